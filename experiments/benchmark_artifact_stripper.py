@@ -0,0 +1,108 @@
+# experiments/benchmark_artifact_stripper.py
+"""
+Benchmark: ArtifactStripper (one literal-prefix scan, regexes only on
+candidate lines) vs the previous per-pattern re.sub cleaning in
+ContentRefiner, on long synthetic generations with echoed prompt lines,
+bullets and blank-line runs. Also checks outputs are identical (shared
+patterns, and each writer's derived pattern set against the same patterns
+applied one re.sub at a time).
+
+Usage:
+    python experiments/benchmark_artifact_stripper.py [--lines 200 2000 20000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from services.meme_engine.content_refiner import ContentRefiner, PROMPT_ARTIFACT_PATTERNS, _stripper_for
+from services.writers import TwitterWriter, MediumWriter, YouTubeWriter
+from shared.utils.artifact_stripper import ArtifactStripper
+
+SENTENCE_WORDS = (
+    "agents autonomous the model launch teams ship faster and cheaper while "
+    "regulators watch closely today open source benchmarks enterprise pricing "
+    "inference costs developers adoption startups funding infrastructure"
+).split()
+
+
+def reference_strip(text, patterns):
+    """The previous ContentRefiner._remove_prompt_artifacts, for any pattern list."""
+    for p in patterns:
+        text = re.sub(p, "", text, flags=re.IGNORECASE)
+
+    text = "\n".join(
+        line for line in text.split("\n")
+        if not re.match(r"^\s*-\s*", line)
+    )
+
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def synthetic_generation(n, seed=5):
+    """n lines of model output mixing prose, echoed instructions and bullets."""
+    rng = random.Random(seed)
+    echoes = [
+        line.strip()
+        for writer in (TwitterWriter, MediumWriter, YouTubeWriter)
+        for line in writer(None, {}).get_system_prompt().split("\n")
+        if line.strip()
+    ] + ["Article:", "  - stray bullet", "Tone: upbeat", "Rules: none"]
+
+    lines = []
+    for _ in range(n):
+        roll = rng.random()
+        prose = " ".join(rng.choices(SENTENCE_WORDS, k=rng.randint(3, 25))).capitalize() + "."
+        if roll < 0.1:
+            lines.append(rng.choice(echoes))
+        elif roll < 0.15:
+            lines.append(prose + " " + rng.choice(echoes))  # artifact mid-line
+        elif roll < 0.25:
+            lines.append("")
+        else:
+            lines.append(prose)
+    return "\n".join(lines)
+
+
+def timed(func, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, nargs="+", default=[200, 2000, 20000])
+    args = parser.parse_args()
+
+    refiner = ContentRefiner()
+    writer_sets = {style: _stripper_for(style).patterns for style in ("twitter", "medium", "youtube")}
+
+    print(f"{'lines':>7}{'re.sub ms':>11}{'single-pass ms':>16}{'speedup':>9}{'identical':>11}")
+    for n in args.lines:
+        text = synthetic_generation(n)
+
+        expected, reference_time = timed(reference_strip, text, PROMPT_ARTIFACT_PATTERNS)
+        actual, fast_time = timed(refiner._remove_prompt_artifacts, text)
+
+        identical = actual == expected and all(
+            ArtifactStripper(patterns).strip(text) == reference_strip(text, patterns)
+            for patterns in writer_sets.values()
+        )
+
+        print(f"{n:>7}{reference_time * 1000:>11.2f}{fast_time * 1000:>16.2f}"
+              f"{reference_time / fast_time:>8.1f}x{str(identical):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# experiments/benchmark_extractors.py
+"""
+Benchmark: fast lxml extractor vs newspaper3k on saved HTML fixtures.
+
+Each fixture is experiments/fixtures/articles/<name>.html with the
+expected body text in <name>.txt. Reports throughput (pages/sec) and
+extraction quality (token F1 against the expected text, title match).
+
+Usage:
+    python experiments/benchmark_extractors.py [--repeat 50]
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from newspaper import Article
+
+from services.scraper.fast_extractor import extract_article
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "articles"
+
+
+# ---------------- EXTRACTORS ----------------
+def run_newspaper(html: str) -> dict:
+    article = Article("https://example.com/article")
+    article.download(input_html=html)
+    article.parse()
+    return {"title": article.title, "text": article.text}
+
+
+def run_fast(html: str) -> dict:
+    return extract_article(html) or {"title": "", "text": ""}
+
+
+EXTRACTORS = {
+    "newspaper": run_newspaper,
+    "fast": run_fast,
+}
+
+
+# ---------------- QUALITY ----------------
+def token_f1(predicted: str, expected: str) -> float:
+    pred = Counter(predicted.lower().split())
+    gold = Counter(expected.lower().split())
+    overlap = sum((pred & gold).values())
+
+    if not overlap:
+        return 0.0
+
+    precision = overlap / sum(pred.values())
+    recall = overlap / sum(gold.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def load_fixtures():
+    fixtures = []
+    for html_path in sorted(FIXTURES_DIR.glob("*.html")):
+        expected_path = html_path.with_suffix(".txt")
+        fixtures.append({
+            "name": html_path.stem,
+            "html": html_path.read_text(encoding="utf-8"),
+            "expected": expected_path.read_text(encoding="utf-8").strip()
+        })
+    return fixtures
+
+
+# ---------------- BENCHMARK ----------------
+def benchmark(repeat: int = 50):
+    fixtures = load_fixtures()
+    if not fixtures:
+        raise RuntimeError(f"No fixtures found in {FIXTURES_DIR}")
+
+    results = {}
+
+    for name, extract in EXTRACTORS.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for fixture in fixtures:
+                extract(fixture["html"])
+        elapsed = time.perf_counter() - start
+
+        per_fixture = {}
+        for fixture in fixtures:
+            output = extract(fixture["html"])
+            per_fixture[fixture["name"]] = round(
+                token_f1(output["text"], fixture["expected"]), 3
+            )
+
+        results[name] = {
+            "pages_per_sec": round(repeat * len(fixtures) / elapsed, 1),
+            "mean_f1": round(sum(per_fixture.values()) / len(per_fixture), 3),
+            "f1": per_fixture
+        }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    results = benchmark(repeat=args.repeat)
+
+    print(f"{'extractor':<12}{'pages/sec':>12}{'mean F1':>10}")
+    for name, r in results.items():
+        print(f"{name:<12}{r['pages_per_sec']:>12}{r['mean_f1']:>10}")
+
+    print("\nPer-fixture F1:")
+    for name, r in results.items():
+        for fixture, f1 in r["f1"].items():
+            print(f"  {name:<12}{fixture:<28}{f1}")
+
+    speedup = results["fast"]["pages_per_sec"] / results["newspaper"]["pages_per_sec"]
+    print(f"\n[BENCH] fast extractor speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# experiments/benchmark_ingestion.py
+"""
+Benchmark: full ingestion path (scrape_news + collect_market_signals)
+replayed from the raw response archive, with zero network access.
+Replays don't write the CSV snapshots or the source registry state, so
+benchmarking leaves the live pipeline state untouched.
+
+Run the pipeline (or both functions) once live with archive.enabled so the
+archive is populated, then:
+    python experiments/benchmark_ingestion.py [--repeat 10]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from services.scoring_engine.market_signal_collector import collect_market_signals
+from services.scraper.news_scraper import scrape_news
+
+
+def benchmark(repeat: int = 10):
+    results = {}
+
+    for name, run in (
+        ("scrape_news", lambda: len(scrape_news(replay=True))),
+        ("collect_market_signals", lambda: len(collect_market_signals(replay=True))),
+    ):
+        timings = []
+        items = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            items = run()
+            timings.append(time.perf_counter() - start)
+
+        timings.sort()
+        results[name] = {
+            "items": items,
+            "best_ms": round(timings[0] * 1000, 2),
+            "median_ms": round(timings[len(timings) // 2] * 1000, 2)
+        }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    results = benchmark(repeat=args.repeat)
+
+    print(f"\n{'stage':<26}{'items':>8}{'best ms':>12}{'median ms':>12}")
+    for name, r in results.items():
+        print(f"{name:<26}{r['items']:>8}{r['best_ms']:>12}{r['median_ms']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# experiments/benchmark_keyword_matcher.py
+"""
+Benchmark: per-keyword substring scan (`kw in text` for each keyword) vs
+KeywordMatcher (Aho-Corasick, word boundaries) on large article bodies.
+Three corpora: a small repetitive filler vocabulary (keyword stems such
+as "ai" inside "said"/"again" on every line, the worst case for the stem
+scan), a varied one (thousands of distinct words with punctuation,
+closer to real article text), and short headline-plus-summary texts
+like the ones the scorer and selector see per signal.
+
+Usage:
+    python experiments/benchmark_keyword_matcher.py [--articles 200] [--words 5000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from services.meme_engine.content_selector import KEYWORDS
+from services.scoring_engine.market_signal_scorer import TREND_KEYWORDS
+from shared.utils.keyword_matcher import KeywordMatcher
+
+FILLER = (
+    "the company said again that its new chip would ship later this year "
+    "while analysts remain cautious about demand pricing and supply chains "
+    "executives declined to comment on details but investors reacted quickly "
+    "shares rose in early trading after the announcement on Tuesday morning"
+).split()
+KEYWORD_RATE = 0.02  # share of body words that are keywords
+
+
+def synthetic_articles(n, words, seed=7, filler=FILLER):
+    rng = random.Random(seed)
+    keywords = TREND_KEYWORDS + KEYWORDS
+    return [
+        " ".join(
+            rng.choice(keywords) if rng.random() < KEYWORD_RATE else rng.choice(filler)
+            for _ in range(words)
+        )
+        for _ in range(n)
+    ]
+
+
+def varied_filler(size=20000, seed=5):
+    """Random words of 2-10 letters, some with trailing punctuation."""
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return [
+        "".join(rng.choices(letters, k=rng.randint(2, 10))) + rng.choice(["", "", "", ",", ".", "'s"])
+        for _ in range(size)
+    ]
+
+
+def substring_count(keywords, texts):
+    counts = []
+    for text in texts:
+        text = text.lower()
+        counts.append(sum(1 for kw in keywords if kw in text))
+    return counts
+
+
+def matcher_count(matcher, texts):
+    return [matcher.count(text) for text in texts]
+
+
+def large_keyword_set(size, seed=11):
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    generated = [
+        "".join(rng.choices(letters, k=rng.randint(4, 9))) + (" " + rng.choice(FILLER) if rng.random() < 0.3 else "")
+        for _ in range(size)
+    ]
+    return TREND_KEYWORDS + KEYWORDS + generated
+
+
+def timed(func, *args, repeat=3):
+    """Best-of-`repeat` wall time."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--words", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--headlines", type=int, default=20000)
+    args = parser.parse_args()
+
+    corpora = [
+        ("repetitive", synthetic_articles(args.articles, args.words)),
+        ("varied", synthetic_articles(args.articles, args.words, filler=varied_filler())),
+        ("headlines", synthetic_articles(args.headlines, 40, filler=varied_filler())),
+    ]
+    cases = [
+        ("TREND_KEYWORDS", TREND_KEYWORDS),
+        ("selector KEYWORDS", KEYWORDS),
+        ("1000 keywords", large_keyword_set(1000)),
+    ]
+
+    for corpus, texts in corpora:
+        megabytes = sum(map(len, texts)) / 1e6
+        words = len(texts[0].split())
+        print(f"\n{corpus}: {len(texts)} texts x {words} words ({megabytes:.1f} MB)\n")
+        run_corpus(cases, texts, megabytes, args.repeat)
+
+
+def run_corpus(cases, texts, megabytes, repeat):
+    print(f"{'keyword set':>18}{'substring s':>13}{'matcher s':>11}{'speedup':>9}{'MB/s':>8}{'avg hits sub/wb':>18}")
+    for name, keywords in cases:
+        start = time.perf_counter()
+        matcher = KeywordMatcher(keywords)
+        build_time = time.perf_counter() - start
+
+        substring, substring_time = timed(substring_count, keywords, texts, repeat=repeat)
+        boundary, matcher_time = timed(matcher_count, matcher, texts, repeat=repeat)
+
+        print(f"{name:>18}{substring_time:>13.3f}{matcher_time:>11.3f}"
+              f"{substring_time / matcher_time:>8.1f}x{megabytes / matcher_time:>8.1f}"
+              f"{sum(substring) / len(texts):>9.1f}/{sum(boundary) / len(texts):<8.1f}"
+              f"  (build {build_time * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
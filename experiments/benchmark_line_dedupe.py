@@ -0,0 +1,109 @@
+# experiments/benchmark_line_dedupe.py
+"""
+Benchmark: LineDeduplicator vs the all-pairs SequenceMatcher loop that
+ContentRefiner used, on a synthetic corpus of LLM-style drafts with
+repeated and lightly edited lines. Also checks the kept lines are
+identical.
+
+Usage:
+    python experiments/benchmark_line_dedupe.py [--lines 25 50 200] [--threshold 0.88]
+"""
+
+import argparse
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from services.meme_engine.line_dedupe import LineDeduplicator
+
+WORDS = (
+    "ai agents are changing how teams ship software and this shift matters "
+    "because autonomous systems now plan execute and review work while "
+    "companies rethink hiring budgets security and the role of developers "
+    "openai google anthropic startups regulators investors users markets"
+).split()
+
+
+def reference_deduplicate(lines, threshold):
+    """The previous ContentRefiner._deduplicate."""
+    unique_lines = []
+    for line in lines:
+        if not any(
+            SequenceMatcher(None, line.lower(), existing.lower()).ratio() > threshold
+            for existing in unique_lines
+        ):
+            unique_lines.append(line)
+    return unique_lines
+
+
+def synthetic_draft(n, seed=11):
+    """n lines: fresh sentences, exact repeats and small edits of earlier ones."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(n):
+        roll = rng.random()
+        if lines and roll < 0.15:
+            lines.append(rng.choice(lines))
+        elif lines and roll < 0.45:
+            lines.append(_edit(rng.choice(lines), rng))
+        else:
+            sentence = " ".join(rng.choices(WORDS, k=rng.randint(4, 60)))
+            lines.append(sentence.capitalize() + rng.choice([".", "!", "?", ""]))
+    return lines
+
+
+def _edit(line, rng):
+    words = line.split()
+    for _ in range(rng.randint(1, 3)):
+        op = rng.random()
+        i = rng.randrange(len(words))
+        if op < 0.4:
+            words[i] = rng.choice(WORDS)
+        elif op < 0.7 and len(words) > 1:
+            del words[i]
+        else:
+            words.insert(i, rng.choice(WORDS))
+    edited = " ".join(words)
+    return edited.upper() if rng.random() < 0.1 else edited
+
+
+def timed(func, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, nargs="+", default=[25, 50, 200])
+    parser.add_argument("--threshold", type=float, default=0.88)
+    parser.add_argument("--seeds", type=int, default=3)
+    args = parser.parse_args()
+
+    deduplicator = LineDeduplicator(args.threshold)
+
+    print(f"{'lines':>7}{'kept':>7}{'all-pairs ms':>14}{'prefilter ms':>14}{'speedup':>9}{'identical':>11}")
+    for n in args.lines:
+        identical = True
+        for seed in range(args.seeds):
+            lines = synthetic_draft(n, seed=seed)
+            identical &= deduplicator.deduplicate(lines) == reference_deduplicate(lines, args.threshold)
+
+        lines = synthetic_draft(n)
+        expected, reference_time = timed(reference_deduplicate, lines, args.threshold, repeat=1)
+        actual, fast_time = timed(deduplicator.deduplicate, lines)
+
+        print(f"{n:>7}{len(expected):>7}{reference_time * 1000:>14.1f}{fast_time * 1000:>14.2f}"
+              f"{reference_time / fast_time:>8.1f}x{str(identical):>11}")
+
+
+if __name__ == "__main__":
+    main()
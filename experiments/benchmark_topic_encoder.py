@@ -0,0 +1,70 @@
+# experiments/benchmark_topic_encoder.py
+"""
+Benchmark: sentence-transformers CPU encode throughput and TopicClusterer
+assignment time / peak memory on synthetic signals.
+
+Usage:
+    python experiments/benchmark_topic_encoder.py [--signals 5000] [--batch-sizes 16 64 256]
+"""
+
+import argparse
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from experiments.benchmark_scorer import synthetic_signals
+from services.scoring_engine.topic_clusterer import TopicClusterer
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--signals", type=int, default=5000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--model", default="sentence-transformers/all-MiniLM-L6-v2")
+    parser.add_argument("--max-memory-mb", type=int, default=256)
+    args = parser.parse_args()
+
+    signals = synthetic_signals(args.signals)
+    texts = [f"{s['title']}. {s['summary']}" for s in signals]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state_file = Path(tmp) / "topic_centroids.npz"
+        clusterer = TopicClusterer(model=args.model, state_file=state_file)
+
+        start = time.perf_counter()
+        clusterer.encode(texts[:8])
+        print(f"model load + warm-up: {time.perf_counter() - start:.2f}s, peak RSS {peak_rss_mb():.0f} MB\n")
+
+        print(f"{'batch':>7}{'texts/s':>10}{'peak RSS MB':>13}")
+        for batch_size in args.batch_sizes:
+            clusterer.batch_size = batch_size
+            start = time.perf_counter()
+            for i in range(0, len(texts), batch_size):
+                clusterer.encode(texts[i:i + batch_size])
+            elapsed = time.perf_counter() - start
+            print(f"{batch_size:>7}{len(texts) / elapsed:>10.0f}{peak_rss_mb():>13.0f}")
+
+        clusterer.batch_size = max(args.batch_sizes)
+        clusterer.max_memory_mb = args.max_memory_mb
+        start = time.perf_counter()
+        assigned = clusterer.assign(signals)
+        elapsed = time.perf_counter() - start
+
+        topics = len({s["topic_id"] for s in assigned})
+        print(f"\nassign: {len(signals)} signals -> {topics} topics in {elapsed:.2f}s "
+              f"({len(signals) / elapsed:.0f} signals/s), "
+              f"centroid store {clusterer.centroids.nbytes / 1e6:.1f} MB, peak RSS {peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# experiments/benchmark_topic_index.py
+"""
+Benchmark: TopicVectorIndex (IVF over memory-mapped embeddings) query
+latency and recall@1 against exact search, as trend memory grows.
+Vectors are synthetic (clustered unit vectors, MiniLM dimension), so no
+model download is needed.
+
+Single queries are timed one at a time, first with the exact search for
+the recall check in between, which evicts the CPU caches (cold, the
+worst case), then back to back (warm). Batched latency is the time of
+one search() call over `--batch` queries (as apply_trend_bias issues
+them through nearest()) divided by the batch size.
+
+Usage:
+    python experiments/benchmark_topic_index.py [--sizes 10000 100000 300000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from services.scoring_engine.topic_clusterer import normalize_rows
+from services.scoring_engine.topic_index import TopicVectorIndex
+
+DIM = 384
+
+
+def synthetic_vectors(n, seed=3, spread=0.35):
+    """Unit vectors scattered around n/20 random story directions."""
+    rng = np.random.default_rng(seed)
+    centers = normalize_rows(rng.standard_normal((max(n // 20, 1), DIM)))
+    noise = rng.standard_normal((n, DIM)).astype(np.float32) * spread / np.sqrt(DIM)
+    return normalize_rows(centers[rng.integers(0, len(centers), n)] + noise)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 300_000])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--nprobe", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=32)
+    args = parser.parse_args()
+
+    print(f"{'topics':>9}{'build s':>9}{'cold p50':>10}{'cold p99':>10}{'warm p99':>10}"
+          f"{'batch p99':>11}{'recall@1':>10}   (latencies in ms per query)")
+    for n in args.sizes:
+        vectors = synthetic_vectors(n + args.queries)
+        stored, queries = vectors[:n], vectors[n:]
+        lookup = {f"topic {i}": v for i, v in enumerate(stored)}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            index = TopicVectorIndex(
+                directory=tmp,
+                nprobe=args.nprobe,
+                encoder=lambda topics: np.stack([lookup[t] for t in topics])
+            )
+
+            start = time.perf_counter()
+            index.add(list(lookup))  # past max_tail, so this builds the IVF lists
+            build = time.perf_counter() - start
+
+            latencies, hits = [], 0
+            for query in queries:
+                start = time.perf_counter()
+                _, rows = index.search(query, k=1)
+                latencies.append(time.perf_counter() - start)
+
+                found = int(index.topics[rows[0, 0]].split()[1])
+                hits += found == int(np.argmax(stored @ query))
+
+            warm = []
+            for query in queries:
+                start = time.perf_counter()
+                index.search(query, k=1)
+                warm.append(time.perf_counter() - start)
+
+            batched = []
+            for i in range(0, len(queries), args.batch):
+                batch = queries[i:i + args.batch]
+                start = time.perf_counter()
+                index.search(batch, k=1)
+                batched.append((time.perf_counter() - start) / len(batch))
+
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        warm_p99 = np.percentile(warm, 99) * 1000
+        batch_p99 = np.percentile(batched, 99) * 1000
+        print(f"{n:>9}{build:>9.2f}{p50:>10.3f}{p99:>10.3f}{warm_p99:>10.3f}"
+              f"{batch_p99:>11.3f}{hits / len(queries):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+# experiments/benchmark_trend_engine.py
+"""
+Benchmark: trend engine throughput and peak memory at scale.
+Measures MarketSignalScorer.score (and the columnar scorer used by the
+pipeline), update_trend_memory and apply_trend_bias on synthetic signals,
+and saves the results as JSON so later runs can be compared against a
+baseline. Peak memory is what the stage itself allocates (tracemalloc),
+not counting its input. Trend memory is written to a fresh temporary
+directory per size, never to data/memory.
+
+Usage:
+    python experiments/benchmark_trend_engine.py [--sizes 1000 100000 1000000]
+        [--topics-per-signal 0.05] [--skew 1.1] [--timestamps exponential]
+        [--output results.json] [--baseline previous.json]
+"""
+
+import argparse
+import copy
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from experiments.synthetic_signals import SignalGenerator, TIMESTAMP_DISTRIBUTIONS
+from services.scoring_engine.columnar_scorer import ColumnarSignalScorer
+from services.scoring_engine.market_signal_scorer import MarketSignalScorer
+from services.scoring_engine.trend_bias_engine import apply_trend_bias
+from services.scoring_engine.trend_evolution import update_trend_memory
+
+RESULTS_DIR = ROOT_DIR / "experiments" / "results"
+
+
+def measure(func, *args, repeat=1, trace_memory=True):
+    """(result, best wall seconds, peak traced MB or None)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if trace_memory:
+        # Separate pass: tracemalloc slows allocation-heavy code down
+        tracemalloc.start()
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+
+    return result, best, peak
+
+
+def run_size(n, args):
+    """Rows of {stage, signals, topics, items, seconds, items_per_second, peak_mb}."""
+    generator = SignalGenerator(
+        topics=max(int(n * args.topics_per_signal), 1),
+        topic_skew=args.skew,
+        sources=args.sources,
+        timestamps=args.timestamps,
+        seed=args.seed
+    )
+    signals = generator.signals(n)
+
+    rows = []
+
+    def record(stage, items, seconds, peak):
+        rows.append({
+            "stage": stage,
+            "signals": n,
+            "topics": len(trends),
+            "items": items,
+            "seconds": round(seconds, 4),
+            "items_per_second": round(items / seconds, 1) if seconds else None,
+            "peak_mb": round(peak, 2) if peak is not None else None
+        })
+
+    trace = not args.skip_memory
+    trends, seconds, peak = measure(MarketSignalScorer().score, signals, repeat=args.repeat, trace_memory=trace)
+    record("score", n, seconds, peak)
+
+    _, seconds, peak = measure(ColumnarSignalScorer().score, signals, repeat=args.repeat, trace_memory=trace)
+    record("score_columnar", n, seconds, peak)
+    del signals
+
+    # Memory stages write per-run state: give every size its own directory.
+    # get_store resolves the configured (relative) db path after the chdir,
+    # and the evolution cache is keyed by it, so nothing carries over.
+    with tempfile.TemporaryDirectory() as workdir, open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        os.chdir(workdir)
+        try:
+            _, seconds, peak = measure(update_trend_memory, trends, repeat=args.repeat, trace_memory=trace)
+            record("update_trend_memory", len(trends), seconds, peak)
+
+            _, seconds, peak = measure(
+                lambda: apply_trend_bias(copy.deepcopy(trends)),
+                repeat=args.repeat,
+                trace_memory=trace
+            )
+            record("apply_trend_bias", len(trends), seconds, peak)
+        finally:
+            os.chdir(ROOT_DIR)
+
+    return rows
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count()
+    }
+
+
+def compare(results, baseline_path):
+    """Print time ratios against a previous results file (< 1 is faster)."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {(r["stage"], r["signals"]): r for r in json.load(f)["results"]}
+
+    print(f"\nvs {baseline_path}")
+    print(f"{'stage':>22}{'signals':>10}{'time ratio':>12}{'peak ratio':>12}")
+    for row in results:
+        before = baseline.get((row["stage"], row["signals"]))
+        if not before:
+            continue
+        time_ratio = row["seconds"] / before["seconds"] if before["seconds"] else float("nan")
+        peak_ratio = (
+            row["peak_mb"] / before["peak_mb"]
+            if row["peak_mb"] and before.get("peak_mb") else float("nan")
+        )
+        print(f"{row['stage']:>22}{row['signals']:>10}{time_ratio:>12.2f}{peak_ratio:>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--topics-per-signal", type=float, default=0.05)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of topic popularity")
+    parser.add_argument("--sources", type=int, default=20)
+    parser.add_argument("--timestamps", choices=TIMESTAMP_DISTRIBUTIONS, default="exponential")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--skip-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'stage':>22}{'signals':>10}{'topics':>9}{'seconds':>10}{'items/s':>12}{'peak MB':>10}")
+    for n in args.sizes:
+        for row in run_size(n, args):
+            results.append(row)
+            peak = f"{row['peak_mb']:.1f}" if row["peak_mb"] is not None else "-"
+            print(f"{row['stage']:>22}{row['signals']:>10}{row['topics']:>9}"
+                  f"{row['seconds']:>10.3f}{row['items_per_second'] or 0:>12.0f}{peak:>10}")
+
+    output = args.output or RESULTS_DIR / f"trend_engine_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "created": datetime.utcnow().isoformat(),
+                "environment": environment(),
+                "parameters": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+                "results": results
+            },
+            f,
+            indent=2
+        )
+    print(f"\n[OK] Results saved to {output}")
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
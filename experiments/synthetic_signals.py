@@ -0,0 +1,102 @@
+# experiments/synthetic_signals.py
+"""
+Synthetic market signals for offline scaling tests.
+Signals look like collect_market_signals() output (title, summary, source,
+timestamp, link). Titles start with their topic's phrase, so the scorer's
+title-prefix topic extraction recovers the intended topics, and topic
+popularity follows a Zipf law.
+"""
+
+import itertools
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Sequence
+
+VOCAB = (
+    "openai launches new ai agent framework for startups model release "
+    "policy google chip market regulation funding autonomous said again "
+    "robotics data center nvidia europe court ruling open source benchmark "
+    "security breach cloud pricing layoffs acquisition research paper"
+).split()
+
+DEFAULT_SOURCES = ["ai_news", "tech_news", "openai_blog", "wire", "forum"]
+
+TIMESTAMP_DISTRIBUTIONS = ("uniform", "exponential", "bursty")
+
+
+class SignalGenerator:
+    """
+    Deterministic (seeded) generator of signal dicts.
+
+    Args:
+        topics: Number of distinct topics
+        topic_skew: Zipf exponent of topic popularity (0 = uniform)
+        sources: Source names, or an int for that many generated names
+        timestamps: "uniform" over the window, "exponential" (most signals
+            recent) or "bursty" (clustered around a few spikes)
+        window_hours: How far back timestamps go
+        title_words: (min, max) words per title, topic phrase included
+        summary_words: Words per summary
+        seed: Random seed
+    """
+
+    def __init__(
+        self,
+        topics: int = 1000,
+        topic_skew: float = 1.1,
+        sources=DEFAULT_SOURCES,
+        timestamps: str = "exponential",
+        window_hours: float = 96,
+        title_words=(6, 14),
+        summary_words: int = 40,
+        seed: int = 7
+    ):
+        if timestamps not in TIMESTAMP_DISTRIBUTIONS:
+            raise ValueError(f"timestamps must be one of {TIMESTAMP_DISTRIBUTIONS}")
+
+        self.rng = random.Random(seed)
+        self.sources = [f"source_{i}" for i in range(sources)] if isinstance(sources, int) else list(sources)
+        self.timestamps = timestamps
+        self.window_hours = window_hours
+        self.title_words = title_words
+        self.summary_words = summary_words
+
+        self.topics = self._topic_phrases(topics)
+        weights = [1 / (rank + 1) ** topic_skew for rank in range(topics)]
+        self._cum_weights = list(itertools.accumulate(weights))
+        self._bursts = [self.rng.random() * window_hours for _ in range(5)]
+        self.now = datetime.utcnow()
+
+    # ---------- PUBLIC ----------
+    def signals(self, n: int) -> List[Dict]:
+        return list(self.iter_signals(n))
+
+    def iter_signals(self, n: int) -> Iterator[Dict]:
+        rng = self.rng
+        low, high = self.title_words
+        topic_ids = rng.choices(range(len(self.topics)), cum_weights=self._cum_weights, k=n)
+
+        for i, topic_id in enumerate(topic_ids):
+            topic = self.topics[topic_id]
+            extra = max(rng.randint(low, high) - 4, 0)
+            yield {
+                "title": topic + " " + " ".join(rng.choices(VOCAB, k=extra)),
+                "summary": " ".join(rng.choices(VOCAB, k=self.summary_words)),
+                "source": rng.choice(self.sources),
+                "timestamp": (self.now - timedelta(hours=self._age_hours())).isoformat(),
+                "link": f"https://example.com/{topic_id}/{i}"
+            }
+
+    # ---------- HELPERS ----------
+    def _age_hours(self):
+        rng = self.rng
+        if self.timestamps == "uniform":
+            return rng.random() * self.window_hours
+        if self.timestamps == "exponential":
+            return min(rng.expovariate(4 / self.window_hours), self.window_hours)
+        spike = rng.choice(self._bursts)
+        return min(max(rng.gauss(spike, 2.0), 0.0), self.window_hours)
+
+    def _topic_phrases(self, n: int) -> Sequence[str]:
+        """n distinct four-word phrases (the scorer's topic key)."""
+        return [" ".join(self.rng.choices(VOCAB, k=3) + [f"t{i}"]) for i in range(n)]
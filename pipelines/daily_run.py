@@ -1,7 +1,6 @@
 # run.py
 import sys
 from pathlib import Path
-import pandas as pd
 
 # ---------------- PATH FIX ----------------
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -26,12 +25,10 @@ def main():
     platforms = config["platforms"]
 
     # 2. Scrape news
-    scrape_news()
+    df = scrape_news()
     print("[OK] News scraped")
 
     # 3. Load article
-    df = pd.read_csv("data/raw/news_sample.csv")
-
     if df.empty:
         raise ValueError("No news articles found")
 
@@ -1,6 +1,5 @@
 import sys
 from pathlib import Path
-import pandas as pd
 
 # =========================================================
 # PATH FIX
@@ -19,13 +18,14 @@ from services.scraper import scrape_news
 from services.scoring_engine import collect_market_signals
 
 # Sprint 2
-from services.scoring_engine import MarketSignalScorer
+from services.scoring_engine import ColumnarSignalScorer, ShardedSignalScorer, NearDuplicateDetector, TopicClusterer
+from services.scoring_engine import TrendArticleIndex
 
 # Sprint 3
-from services.meme_engine import generate_content
+from services.meme_engine import generate_content, ContentHistory
 
 # Sprint 4
-from services.scoring_engine import update_trend_memory
+from services.scoring_engine import update_trend_memory, compact_trend_memory
 
 # Sprint 5
 from services.scoring_engine import apply_trend_bias
@@ -48,15 +48,9 @@ def main():
     # SPRINT 0 — NEWS SCRAPING
     # =====================================================
     print("[SPRINT 0] News Scraping")
-    scrape_news()
+    df = scrape_news()
     print("[OK] News scraped successfully\n")
 
-    # =====================================================
-    # LOAD RAW NEWS
-    # =====================================================
-    print("[LOAD] Reading raw news articles")
-    df = pd.read_csv("data/raw/news_sample.csv")
-
     if df.empty:
         raise ValueError("❌ No news data found. Pipeline stopped.")
 
@@ -73,33 +67,64 @@ def main():
 
     print(f"[OK] Collected {len(signals)} market signals\n")
 
+    config = load_config()
+
     # =====================================================
-    # SPRINT 2 — TREND DETECTION
+    # SPRINT 1B — NEAR-DUPLICATE REMOVAL
     # =====================================================
-    print("[SPRINT 2] Trend Detection")
-    scorer = MarketSignalScorer()
-    ranked_trends = scorer.score(signals)
+    dedupe_config = dict(config.get("scoring", {}).get("dedupe", {}))
+    if dedupe_config.pop("enabled", True):
+        print("[SPRINT 1B] Near-Duplicate Removal")
+        detector = NearDuplicateDetector(**dedupe_config)
+        collected = len(signals)
+        signals = detector.deduplicate(signals)
+        print(f"[OK] {collected - len(signals)} duplicates merged, {len(signals)} signals left\n")
 
-    if not ranked_trends:
-        print("[WARN] No strong trends detected.")
-        return
+    # =====================================================
+    # SPRINT 1C — TOPIC CLUSTERING
+    # =====================================================
+    if config.get("scoring", {}).get("clustering", {}).get("enabled", False):
+        print("[SPRINT 1C] Topic Clustering")
+        try:
+            signals = TopicClusterer.from_config().assign(signals)
+            topics = len({s["topic_id"] for s in signals})
+            print(f"[OK] {len(signals)} signals grouped into {topics} topics\n")
+        except (ImportError, OSError) as e:
+            print(f"[WARN] Topic clustering unavailable ({e}), using title topics\n")
 
-    config = load_config()
+    # =====================================================
+    # SPRINT 2 — TREND DETECTION
+    # =====================================================
+    print("[SPRINT 2] Trend Detection")
     platforms = config.get("platforms", [])
     top_k = config.get("top_trends", 2)
 
-    top_trends = ranked_trends[:top_k]
+    if config.get("scoring", {}).get("parallel", {}).get("workers", 1) != 1:
+        scorer = ShardedSignalScorer.from_config()
+    else:
+        scorer = ColumnarSignalScorer()
+    top_trends = scorer.score_top_k(signals, top_k)
+
+    if not top_trends:
+        print("[WARN] No strong trends detected.")
+        return
 
     print("\n🔥 Raw Detected Trends:")
     for t in top_trends:
         print(f"  • {t['topic']} (score={round(t['score'], 3)})")
 
+    article_index = TrendArticleIndex.from_trends(signals, top_trends)
+    print(f"[SAVE] Trend index written to {article_index.save()}")
+
     # =====================================================
     # SPRINT 4 — TREND MEMORY UPDATE
     # =====================================================
     print("\n[SPRINT 4] Updating Trend Memory")
     update_trend_memory(top_trends)
-    print("[OK] Trend memory updated\n")
+    retention = compact_trend_memory()
+    print(f"[OK] Trend memory updated "
+          f"({retention['compacted']} compacted, {retention['evicted']} evicted, "
+          f"{retention['unindexed']} dropped from the topic index)\n")
 
     # =====================================================
     # SPRINT 5 — LEARNING / BIAS ENGINE
@@ -118,15 +143,12 @@ def main():
     # SPRINT 3 — CONTENT GENERATION
     # =====================================================
     print("\n[SPRINT 3] Content Generation")
+    history = ContentHistory.from_config()
 
     for trend in biased_trends:
         print(f"\n[GEN] Trend: {trend['topic']}")
 
-        related_articles = [
-            s["summary"]
-            for s in signals
-            if trend["topic"].lower() in s["title"].lower()
-        ]
+        related_articles = article_index.articles(trend["topic"])
 
         article_text = " ".join(related_articles)
 
@@ -139,7 +161,8 @@ def main():
             generate_content(
                 article_text,
                 platform,
-                trend_status=trend["bias_status"]
+                trend_status=trend["bias_status"],
+                history=history
             )
 
     # =====================================================
@@ -150,11 +173,7 @@ def main():
     for trend in biased_trends:
         print(f"\n[GEN] Trend: {trend['topic']}")
 
-        related_articles = [
-            s["summary"]
-            for s in signals
-            if trend["topic"].lower() in s["title"].lower()
-        ]
+        related_articles = article_index.articles(trend["topic"])
 
         article_text = " ".join(related_articles)
 
@@ -168,8 +187,24 @@ def main():
             content = generate_content(
                 article_text,
                 platform,
-                trend_status=trend["bias_status"]
+                trend_status=trend["bias_status"],
+                history=history
             )
+            if content is None:
+                continue
+
+            # Skip near-duplicates of content queued or posted in earlier runs
+            if history is not None:
+                earlier = history.claim(
+                    content,
+                    platform,
+                    source=article_text,
+                    trend=trend["topic"]
+                )
+                if earlier is not None:
+                    print(f"  ⏭️ Near-duplicate of {earlier['status']} post "
+                          f"({earlier['trend']}, {earlier['created']}), not queued")
+                    continue
 
             # Build and queue post payload
             build_post_payload(
@@ -0,0 +1,70 @@
+import sys
+import time
+from pathlib import Path
+
+# =========================================================
+# PATH FIX
+# =========================================================
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+# =========================================================
+# IMPORTS
+# =========================================================
+from services.scoring_engine import collect_market_signals, StreamingTrendScorer
+from shared.config import get_config
+
+
+def main():
+    """
+    Trend daemon: polls the source registry (only due sources are
+    fetched), feeds every new signal to a StreamingTrendScorer and prints
+    the live top-k whenever it changes.
+    """
+    config = get_config()
+    poll_seconds = config.get("streaming.poll_seconds", 60)
+    top_k = config.get("streaming.top_k", 5)
+
+    scorer = StreamingTrendScorer(
+        decay_hours=config.get("streaming.decay_hours", 48),
+        expire_hours=config.get("streaming.expire_hours")
+    )
+    # signal key -> last poll whose feeds still served it. A key is only
+    # forgotten once the feeds stop serving it for expire_hours, so an
+    # item that stays in a feed is never ingested twice.
+    seen = {}
+    previous_top = None
+
+    print("\n" + "=" * 60)
+    print(f"📡 [STREAM START] polling every {poll_seconds}s, top {top_k}")
+    print("=" * 60 + "\n")
+
+    while True:
+        signals = collect_market_signals()
+
+        now = time.time()
+        fresh = 0
+        for signal in signals:
+            key = signal.get("canonical_link") or signal["title"]
+            if key not in seen:
+                scorer.ingest(signal)
+                fresh += 1
+            seen[key] = now
+
+        expired = scorer.expire()
+        cutoff = now - scorer.expire_hours * 3600
+        seen = {key: at for key, at in seen.items() if at >= cutoff}
+        top = scorer.top_k(top_k)
+        print(f"[STREAM] {fresh} new signals, {expired} topics expired, {len(scorer)} tracked")
+
+        if [t["topic"] for t in top] != previous_top:
+            print("🔥 Live trends:")
+            for t in top:
+                print(f"  • {t['topic']} (score={t['score']}, mentions={t['mentions']})")
+            previous_top = [t["topic"] for t in top]
+
+        time.sleep(poll_seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,11 @@ Separates content GENERATION from content POSTING.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from datetime import datetime
+from typing import Dict, Any, Iterator, List
+
+from shared.schemas.payloads import ContentPayload
+from shared.utils.artifact_stripper import prompt_artifact_patterns
 
 
 class BaseWriter(ABC):
@@ -35,6 +39,14 @@ class BaseWriter(ABC):
         """Return max tokens for this platform's content."""
         pass
 
+    def get_artifact_patterns(self) -> List[str]:
+        """
+        Regex patterns for prompt text echoed in the output, removed by
+        ContentRefiner. Derived from the system prompt (and the prompt
+        template in write()) so they follow prompt edits.
+        """
+        return prompt_artifact_patterns(self.get_system_prompt()) + [r"Article:.*"]
+
     def write(self, article_text: str) -> str:
         """
         Generate platform-specific content.
@@ -45,16 +57,66 @@ class BaseWriter(ABC):
         Returns:
             Platform-optimized content
         """
-        prompt = f"""{self.get_system_prompt()}
-
-Article:
-{article_text}"""
-        
         return self.llm_engine.generate(
-            prompt,
+            self._build_prompt(article_text),
             max_new_tokens=self.get_max_tokens()
         )
 
+    def write_stream(self, article_text: str) -> Iterator[str]:
+        """
+        write() as a stream of text chunks while the model generates,
+        without the prompt (see LLMEngine.generate_stream). Closing the stream stops
+        generation, so a StreamingRefiner can end it early.
+        """
+        return self.llm_engine.generate_stream(
+            self._build_prompt(article_text),
+            max_new_tokens=self.get_max_tokens()
+        )
+
+    def write_best(self, article_text: str, n: int) -> ContentPayload:
+        """
+        Best-of-n generation: n candidates from one batched generate call
+        (LLMEngine.generate_many), scored by ContentRanker. Returns the
+        best one refined, with its quality_score.
+
+        Library API for callers driving an LLM writer directly; the
+        pipeline (generate_content) uses the template writers and does
+        not sample candidates.
+        
+        Args:
+            article_text: Raw article or context
+            n: Candidates to sample
+        """
+        # Imported here: meme_engine imports the writers
+        from services.meme_engine.content_ranker import ContentRanker
+
+        candidates = self.llm_engine.generate_many(
+            self._build_prompt(article_text),
+            max(n, 1),
+            max_new_tokens=self.get_max_tokens(),
+            skip_prompt=True
+        )
+
+        style = self.platform.lower()
+        ranker = ContentRanker(style, article_text, max_length=self.config.get("max_length", 280))
+        index, report = ranker.best(candidates)
+        self._log(f"Best of {len(candidates)}: candidate {index + 1} (quality {report['score']})")
+
+        return ContentPayload(
+            original_article=article_text,
+            platform=style,
+            generated_content=report["text"],
+            style=style,
+            quality_score=report["score"],
+            timestamp=datetime.utcnow().isoformat()
+        )
+
+    def _build_prompt(self, article_text: str) -> str:
+        return f"""{self.get_system_prompt()}
+
+Article:
+{article_text}"""
+
     def _log(self, message: str):
         """Helper for logging."""
         if self.logger:
@@ -6,7 +6,10 @@ Powered by local LLM (Zephyr-7b) or configured model.
 
 from services.meme_engine.llm_engine import LLMEngine
 from services.meme_engine.content_generator import generate_content
-from services.meme_engine.content_refiner import ContentRefiner
+from services.meme_engine.content_refiner import ContentRefiner, RefinedText
+from services.meme_engine.streaming_refiner import StreamingRefiner
+from services.meme_engine.content_ranker import ContentRanker
+from services.meme_engine.content_history import ContentHistory, get_history
 from services.meme_engine.content_selector import select_top_news
 from services.meme_engine.content_writer import write_twitter, write_medium, write_youtube
 from services.meme_engine.image_generator import generate_instagram_image
@@ -15,6 +18,11 @@ __all__ = [
     'LLMEngine',
     'generate_content',
     'ContentRefiner',
+    'RefinedText',
+    'StreamingRefiner',
+    'ContentRanker',
+    'ContentHistory',
+    'get_history',
     'select_top_news',
     'write_twitter',
     'write_medium',
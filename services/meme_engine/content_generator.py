@@ -1,5 +1,6 @@
 # services/meme_engine/content_generator.py
 
+from services.meme_engine.content_history import ContentHistory, SOURCE
 from services.meme_engine.content_refiner import ContentRefiner
 from services.meme_engine.content_writer import write_twitter, write_medium, write_youtube
 from shared.utils.output_writer import OutputWriter
@@ -13,10 +14,20 @@ def apply_content_bias(text: str, trend_status: str):
     return text
 
 
-def generate_content(article_text: str, platform: str, trend_status: str = "STABLE") -> str:
+def generate_content(article_text: str, platform: str, trend_status: str = "STABLE",
+                     history: ContentHistory = None) -> str:
     """
     Central content generation entry point.
+    With a `history`, returns None without generating when content from
+    a near-identical article was already queued for the platform.
     """
+    if history is not None:
+        earlier = history.find(article_text, platform, kind=SOURCE)
+        if earlier is not None:
+            print(f"[SKIP] Same story already {earlier['status']} for {platform} "
+                  f"({earlier['trend']}, {earlier['created']})")
+            return None
+
     biased_text = apply_content_bias(article_text, trend_status)
 
     if platform == "twitter":
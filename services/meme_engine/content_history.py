@@ -0,0 +1,319 @@
+# services/meme_engine/content_history.py
+"""
+Cross-run content history (SQLite, WAL mode).
+Keeps a MinHash signature of every queued or posted piece of content,
+and of the source articles it was generated from, per platform, using
+the same shingling and hash family as NearDuplicateDetector. Each
+signature is filed under its LSH band keys, so a lookup reads only the
+entries sharing a band bucket (a few index probes, independent of the
+history size) and verifies their estimated Jaccard similarity.
+
+Content is fingerprinted without the platform's boilerplate (template
+headings, fixed sentences, tweet numbering, outros): for short stories
+that text outweighs the story itself, and distinct stories would look
+like near-duplicates.
+"""
+
+import json
+import os
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from shared.config.config_loader import ConfigLoader
+from services.scoring_engine.near_duplicate_detector import NearDuplicateDetector
+
+SCHEMA_VERSION = 2
+
+# Stored signatures depend on these; changing them needs a new database
+NUM_PERM = 64
+BANDS = 16
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS content_history (
+    id        INTEGER PRIMARY KEY,
+    platform  TEXT NOT NULL,
+    kind      TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    trend     TEXT,
+    status    TEXT NOT NULL,
+    created   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS content_bands (
+    platform TEXT NOT NULL,
+    kind     TEXT NOT NULL,
+    band     INTEGER NOT NULL,
+    bucket   INTEGER NOT NULL,
+    entry_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_content_bands_bucket ON content_bands (platform, kind, band, bucket);
+"""
+
+CANDIDATES_SQL = (
+    "SELECT id, signature, trend, status, created FROM content_history WHERE id IN ("
+    + " UNION ".join(
+        "SELECT entry_id FROM content_bands WHERE platform = ? AND kind = ? AND band = ? AND bucket = ?"
+        for _ in range(BANDS)
+    )
+    + ")"
+)
+
+# Entry kinds
+CONTENT = "content"   # generated text as queued / posted
+SOURCE = "source"     # the article text it was generated from
+
+# Header OutputWriter puts on saved content (and so on queued payloads)
+OUTPUT_HEADER = re.compile(r"^Generated on: .*\nPlatform: .*\n\n")
+
+# Queue payloads written before the history existed, imported once
+LEGACY_QUEUE_DIR = Path("data/post_queue")
+SMOKE_TEST_SUFFIX = "_smoke_test"  # tests/run_smoke_tests.py payloads, never imported
+
+# Stand-in for generated text when rendering the templates (see boilerplate_pattern)
+PLACEHOLDER = re.compile(r"\x00[^\x00]*\x00")
+WORD = re.compile(r"\w")
+
+
+class ContentHistory:
+    """
+    Data-access object for the content fingerprint history.
+    """
+
+    def __init__(self, db_path: str = "data/memory/content_history.db", threshold: float = 0.7):
+        """
+        Args:
+            db_path: SQLite database file
+            threshold: Estimated Jaccard similarity (word 3-grams) from
+                which content counts as a duplicate
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self._detector = NearDuplicateDetector(threshold=threshold, num_perm=NUM_PERM, bands=BANDS)
+
+        self._conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._migrate()
+
+    @classmethod
+    def from_config(cls) -> Optional["ContentHistory"]:
+        """Build from the `content.history` section of config.yaml (None if disabled)."""
+        settings = ConfigLoader().get("content.history", {}) or {}
+        if not settings.get("enabled", True):
+            return None
+        return get_history(settings.get("db"), settings.get("threshold", 0.7))
+
+    def close(self):
+        self._conn.close()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM content_history").fetchone()[0]
+
+    # ---------- PUBLIC ----------
+    def find(self, text: str, platform: str, kind: str = CONTENT) -> Optional[Dict]:
+        """
+        Most similar recorded entry at or above the threshold
+        ({id, similarity, trend, status, created}), or None.
+        """
+        signature = self.signature(text, platform if kind == CONTENT else None)
+        if signature is None:
+            return None
+        return self._find(signature, platform, kind)
+
+    def claim(self, content: str, platform: str, source: str = None, trend: str = None) -> Optional[Dict]:
+        """
+        Record content about to be queued (and the article it came
+        from), unless it near-duplicates earlier content for the
+        platform. Check and insert are one transaction, so concurrent
+        runs can't both claim the same post.
+        Returns the earlier entry if it is a duplicate (nothing recorded),
+        else None.
+        """
+        signature = self.signature(content, platform)
+        if signature is None:
+            return None
+
+        with self._transaction():
+            duplicate = self._find(signature, platform, CONTENT)
+            if duplicate is not None:
+                return duplicate
+
+            self._insert(signature, platform, CONTENT, trend, "queued")
+            source_signature = self.signature(source) if source else None
+            if source_signature is not None:
+                self._insert(source_signature, platform, SOURCE, trend, "queued")
+        return None
+
+    def mark_posted(self, content: str, platform: str):
+        """Set status=posted on the content's entry (recorded now if missing)."""
+        signature = self.signature(content, platform)
+        if signature is None:
+            return
+
+        with self._transaction():
+            entry = self._find(signature, platform, CONTENT)
+            if entry is None:
+                self._insert(signature, platform, CONTENT, None, "posted")
+            else:
+                self._conn.execute("UPDATE content_history SET status = 'posted' WHERE id = ?", (entry["id"],))
+
+    def signature(self, text: str, platform: str = None) -> Optional[np.ndarray]:
+        """
+        MinHash signature of `text` without OutputWriter's header and,
+        given the platform it was written for, without that platform's
+        boilerplate (None if no words are left).
+        """
+        text = OUTPUT_HEADER.sub("", text)
+        if platform is not None:
+            text = boilerplate_pattern(platform).sub("\n", text)
+        signatures, has_shingles = self._detector.signatures([text])
+        return signatures[0] if has_shingles[0] else None
+
+    # ---------- HELPERS ----------
+    def _find(self, signature, platform, kind):
+        params = []
+        for band, bucket in enumerate(self._band_buckets(signature)):
+            params += [platform, kind, band, bucket]
+
+        best = None
+        for entry_id, stored, trend, status, created in self._conn.execute(CANDIDATES_SQL, params):
+            similarity = float((np.frombuffer(stored, dtype=np.uint32) == signature).mean())
+            if similarity >= self.threshold and (best is None or similarity > best["similarity"]):
+                best = {
+                    "id": entry_id,
+                    "similarity": round(similarity, 3),
+                    "trend": trend,
+                    "status": status,
+                    "created": created
+                }
+        return best
+
+    def _insert(self, signature, platform, kind, trend, status):
+        cursor = self._conn.execute(
+            "INSERT INTO content_history (platform, kind, signature, trend, status, created) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (platform, kind, signature.astype(np.uint32).tobytes(), trend, status, datetime.utcnow().isoformat())
+        )
+        self._conn.executemany(
+            "INSERT INTO content_bands (platform, kind, band, bucket, entry_id) VALUES (?, ?, ?, ?, ?)",
+            [
+                (platform, kind, band, bucket, cursor.lastrowid)
+                for band, bucket in enumerate(self._band_buckets(signature))
+            ]
+        )
+
+    def _band_buckets(self, signature):
+        """Band keys as signed 64-bit ints (SQLite INTEGER)."""
+        return self._detector.band_keys(signature[None, :])[0].view(np.int64).tolist()
+
+    @contextmanager
+    def _transaction(self):
+        """BEGIN IMMEDIATE ... COMMIT, rolled back on error."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _migrate(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        with self._transaction():
+            # Another process may have migrated while we waited for the lock
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+            for statement in SCHEMA.split(";"):
+                if statement.strip():
+                    self._conn.execute(statement)
+            if version == 1:
+                # v1 content signatures included the platform boilerplate
+                self._conn.execute("DELETE FROM content_bands WHERE kind = ?", (CONTENT,))
+                self._conn.execute("DELETE FROM content_history WHERE kind = ?", (CONTENT,))
+            self._import_queue()
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _import_queue(self):
+        """Record the payloads already in the post queue (smoke-test payloads excepted)."""
+        if not LEGACY_QUEUE_DIR.exists():
+            return
+
+        for path in sorted(LEGACY_QUEUE_DIR.glob("*.json")):
+            if path.stem.endswith(SMOKE_TEST_SUFFIX):
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    payload = json.load(f)
+                platform, content = payload["platform"], payload["content"]
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+
+            signature = self.signature(content, platform)
+            if signature is not None and self._find(signature, platform, CONTENT) is None:
+                self._insert(signature, platform, CONTENT, payload.get("trend"), "queued")
+
+
+@lru_cache(maxsize=None)
+def boilerplate_pattern(platform: str) -> re.Pattern:
+    """
+    Regex matching the text the pipeline adds to every post for
+    `platform`. The writer templates, trend-status lead lines and
+    ContentRefiner formatter are rendered with placeholders for the
+    generated text, and every remaining piece that contains a word is
+    boilerplate; deriving it keeps the list in step with template edits.
+    """
+    # Imported here: these modules import the history themselves
+    from services.meme_engine.content_generator import apply_content_bias
+    from services.meme_engine.content_refiner import ContentRefiner
+    from services.meme_engine import content_writer
+
+    def placeholder(i):
+        return f"\x00{i:02d} placeholder text long enough for a title\x00"
+
+    fields = ("title", "text", "stance", "why_it_matters", "prediction")
+    rendered = [
+        apply_content_bias(placeholder(0), status) for status in ("RISING", "FALLING")
+    ]
+    writer = getattr(content_writer, f"write_{platform}", None)
+    if writer is not None:
+        rendered.append(writer(placeholder(0)))
+        rendered.append(writer({field: placeholder(i) for i, field in enumerate(fields)}))
+
+    # The formatter keeps a long first line as the title and replaces a short one
+    lines = [placeholder(i) for i in range(20)]
+    refiner = ContentRefiner()
+    rendered.append(refiner._format(lines, platform))
+    rendered.append(refiner._format(["\x00\x00"] + lines[1:], platform))
+
+    pieces = {
+        piece.strip()
+        for text in rendered
+        for line in text.split("\n")
+        for piece in PLACEHOLDER.split(line)
+        if WORD.search(piece)
+    }
+    alternation = "|".join(re.escape(p) for p in sorted(pieces, key=len, reverse=True))
+    return re.compile(alternation or r"(?!)", re.IGNORECASE)
+
+
+_HISTORIES = {}
+
+
+def get_history(db_path: str = None, threshold: float = 0.7) -> ContentHistory:
+    """Shared ContentHistory per database path (one connection per process)."""
+    db_path = db_path or ConfigLoader().get("content.history.db", "data/memory/content_history.db")
+    key = (os.getpid(), db_path, threshold)
+    if key not in _HISTORIES:
+        _HISTORIES[key] = ContentHistory(db_path, threshold)
+    return _HISTORIES[key]
@@ -0,0 +1,114 @@
+# services/meme_engine/content_ranker.py
+"""
+Cheap quality ranking of generated candidates (best-of-N sampling).
+Each candidate goes once through the same line pipeline as
+ContentRefiner.refine, which yields the refined text and the counts the
+score is made of, so no model call or similarity search is needed.
+"""
+
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+from shared.utils.keyword_matcher import KeywordMatcher, TOKEN_PATTERN
+from services.meme_engine.content_refiner import ContentRefiner, _stripper_for
+from services.meme_engine.line_dedupe import LineDeduplicator
+from services.meme_engine.streaming_refiner import LINE_LIMITS
+
+# Score weights (sum to 1)
+WEIGHTS = {
+    "length": 0.3,       # kept lines vs what the platform format uses, tweets within max_length
+    "duplication": 0.2,  # share of lines that aren't near-duplicates
+    "artifacts": 0.2,    # share of lines that aren't prompt echoes / bullets
+    "keywords": 0.3      # share of the article's keywords the text mentions
+}
+
+STOPWORDS = frozenset("""
+    about after again also been before being between both could does doing down during each
+    from further have having here into just more most much only other over same should some
+    such than that their them then there these they this those through under until very was
+    were what when where which while will with would your
+""".split())
+
+
+def article_keywords(text: str, limit: int = 10) -> List[str]:
+    """Most frequent words of 4+ letters in `text` (stopwords excluded)."""
+    counts = Counter(
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) >= 4 and not token.isdigit() and token not in STOPWORDS
+    )
+    return [token for token, _ in counts.most_common(limit)]
+
+
+class ContentRanker:
+    """
+    Scores candidates for one prompt in [0, 1].
+
+    Args:
+        style: Target platform style, as ContentRefiner.refine
+        article_text: Source article, for keyword coverage ("" = not scored)
+        max_length: Longest acceptable tweet (twitter style only)
+        similarity_threshold: Near-duplicate line threshold
+    """
+
+    def __init__(self, style: str, article_text: str = "", max_length: int = 280,
+                 similarity_threshold: float = 0.88):
+        self.style = style.lower()
+        self.max_length = max_length
+        self.similarity_threshold = similarity_threshold
+
+        self._refiner = ContentRefiner(similarity_threshold)
+        self._stripper = _stripper_for(self.style)
+        self._keywords = KeywordMatcher(article_keywords(article_text)) if article_text else None
+
+    # ---------- PUBLIC ----------
+    def score(self, text: str) -> Dict:
+        """
+        {score, length, duplication, artifacts, keywords, text}: the
+        weighted score, its parts and the refined text (as refine()).
+        """
+        raw = [line for line in text.split("\n") if line.strip()]
+        artifacts = 0
+        cleaned = []
+        for line in raw:
+            stripped = self._stripper.strip_line(line)
+            if stripped != line:
+                artifacts += 1
+            if stripped is not None and stripped.strip():
+                cleaned.append(stripped.strip())
+
+        lines = LineDeduplicator(self.similarity_threshold).deduplicate(cleaned)
+
+        parts = {
+            "length": self._length_fit(lines),
+            "duplication": len(lines) / len(cleaned) if cleaned else 0.0,
+            "artifacts": 1 - artifacts / len(raw) if raw else 0.0,
+            "keywords": self._keyword_coverage(lines)
+        }
+        report = {"score": round(sum(WEIGHTS[k] * v for k, v in parts.items()), 3)}
+        report.update((k, round(v, 3)) for k, v in parts.items())
+        report["text"] = self._refiner._format(lines, self.style)
+        return report
+
+    def best(self, candidates: Sequence[str]) -> Tuple[int, Dict]:
+        """Index and score() report of the best candidate (the first on ties)."""
+        reports = [self.score(text) for text in candidates]
+        index = max(range(len(reports)), key=lambda i: reports[i]["score"])
+        return index, reports[index]
+
+    # ---------- HELPERS ----------
+    def _length_fit(self, lines):
+        limit = LINE_LIMITS.get(self.style)
+        if limit is None:
+            return 1.0 if lines else 0.0
+
+        used = lines[:limit]
+        fit = len(used) / limit
+        if self.style == "twitter" and self.max_length and used:
+            fit *= sum(len(line) <= self.max_length for line in used) / len(used)
+        return fit
+
+    def _keyword_coverage(self, lines):
+        if self._keywords is None or not self._keywords.keywords:
+            return 1.0
+        found = self._keywords.find(" ".join(lines))
+        return len(found) / len(self._keywords.keywords)
@@ -1,7 +1,51 @@
 # services/meme_engine/content_refiner.py
 
-import re
+import os
+import time
+from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+from shared.config.config_loader import ConfigLoader
+from shared.utils.artifact_stripper import ArtifactStripper
+from shared.utils.helpers import parallel_map
+from services.meme_engine.line_dedupe import LineDeduplicator
+from services.writers import TwitterWriter, MediumWriter, YouTubeWriter
+
+# Instruction echoes removed for every style
+PROMPT_ARTIFACT_PATTERNS = [
+    r"You are .*",
+    r"Rules:.*",
+    r"Structure:.*",
+    r"Tone:.*",
+    r"Article:.*",
+    r"Write .*",
+    r"Read the article .*",
+    r"- Confident tone.*",
+    r"- Slightly controversial.*",
+    r"- .*tweets.*",
+    r"- No emojis.*",
+    r"- Strong hook.*",
+    r"- Explain impact.*",
+    r"- Simple language.*",
+    r"- End with call to action.*"
+]
+
+# Writers whose prompts add style-specific artifact patterns
+STYLE_WRITERS = {
+    "twitter": TwitterWriter,
+    "medium": MediumWriter,
+    "youtube": YouTubeWriter
+}
+
+
+@dataclass
+class RefinedText:
+    """One refine_many result."""
+    text: str
+    style: str
+    seconds: float  # time spent refining this item (in its worker)
 
 
 class ContentRefiner:
@@ -16,62 +60,46 @@ class ContentRefiner:
         """
         style = style.lower()
 
-        cleaned_text = self._remove_prompt_artifacts(text)
+        cleaned_text = self._remove_prompt_artifacts(text, style)
         lines = self._split_lines(cleaned_text)
         lines = self._deduplicate(lines)
 
-        if style == "twitter":
-            return self._format_twitter(lines)
-        elif style == "medium":
-            return self._format_medium(lines)
-        elif style == "youtube":
-            return self._format_youtube(lines)
-        else:
-            return "\n".join(lines)
+        return self._format(lines, style)
 
-    # ================= CLEANING =================
-    def _remove_prompt_artifacts(self, text: str) -> str:
-        # Remove instruction blocks and bullets
-        patterns = [
-            r"You are .*",
-            r"Rules:.*",
-            r"Structure:.*",
-            r"Tone:.*",
-            r"Article:.*",
-            r"Write .*",
-            r"Read the article .*",
-            r"- Confident tone.*",
-            r"- Slightly controversial.*",
-            r"- .*tweets.*",
-            r"- No emojis.*",
-            r"- Strong hook.*",
-            r"- Explain impact.*",
-            r"- Simple language.*",
-            r"- End with call to action.*"
-        ]
-
-        for p in patterns:
-            text = re.sub(p, "", text, flags=re.IGNORECASE)
-
-        # Remove leftover bullet-only lines
-        text = "\n".join(
-            line for line in text.split("\n")
-            if not re.match(r"^\s*-\s*", line)
-        )
+    def refine_many(self, items: Iterable[Tuple[str, str]], workers: int = None) -> List[RefinedText]:
+        """
+        Refine a batch of (text, style) pairs, in order, spread over
+        `workers` processes (default: content.refine_workers in
+        config.yaml, 0 = one per CPU). Items are dealt round-robin so
+        long and short texts mix in every worker.
+        """
+        items = list(items)
+        if workers is None:
+            workers = ConfigLoader().get("content.refine_workers", 1)
+        workers = max(min(workers or os.cpu_count() or 1, len(items)), 1)
 
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        return text.strip()
+        jobs = [(self.similarity_threshold, items[w::workers]) for w in range(workers)]
+        batches = parallel_map(_refine_batch, jobs, workers=workers)
 
+        results = [None] * len(items)
+        for w, batch in enumerate(batches):
+            results[w::workers] = batch
+        return results
+
+    # ================= CLEANING =================
+    def _remove_prompt_artifacts(self, text: str, style: str = None) -> str:
+        """
+        Strip instruction lines, bullet-only lines and extra blank lines
+        in one line-oriented pass (see ArtifactStripper).
+        """
+        return _stripper_for(style).strip(text)
 
     def _split_lines(self, text: str):
         return [line.strip() for line in text.split("\n") if line.strip()]
 
     def _deduplicate(self, lines):
-        unique_lines = []
-        for line in lines:
-            if not any(self._is_similar(line, existing) for existing in unique_lines):
-                unique_lines.append(line)
-        return unique_lines
+        """Drop lines too similar to an earlier kept line (see LineDeduplicator)."""
+        return LineDeduplicator(self.similarity_threshold).deduplicate(lines)
 
     def _is_similar(self, a: str, b: str) -> bool:
         return (
@@ -80,6 +108,16 @@ class ContentRefiner:
         )
 
     # ================= FORMATTERS =================
+    def _format(self, lines, style):
+        if style == "twitter":
+            return self._format_twitter(lines)
+        elif style == "medium":
+            return self._format_medium(lines)
+        elif style == "youtube":
+            return self._format_youtube(lines)
+        else:
+            return "\n".join(lines)
+
     def _format_twitter(self, lines):
         tweets = lines[:7]
         return "\n\n".join(f"{i+1}/ {tweet}" for i, tweet in enumerate(tweets))
@@ -128,3 +166,26 @@ class ContentRefiner:
         )
 
         return "\n\n".join([hook] + body + [outro])
+
+
+@lru_cache(maxsize=None)
+def _stripper_for(style):
+    """Compiled stripper: the shared patterns plus the style's writer patterns."""
+    patterns = list(PROMPT_ARTIFACT_PATTERNS)
+    writer = STYLE_WRITERS.get(style)
+    if writer is not None:
+        patterns += writer(llm_engine=None, config={}).get_artifact_patterns()
+    return ArtifactStripper(patterns)
+
+
+def _refine_batch(job) -> List[RefinedText]:
+    """Worker: refine (text, style) pairs with a fresh refiner, timing each."""
+    similarity_threshold, items = job
+    refiner = ContentRefiner(similarity_threshold)
+
+    results = []
+    for text, style in items:
+        start = time.perf_counter()
+        refined = refiner.refine(text, style)
+        results.append(RefinedText(refined, style, time.perf_counter() - start))
+    return results
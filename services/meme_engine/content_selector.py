@@ -4,6 +4,8 @@ import pandas as pd
 import json
 from pathlib import Path
 
+from shared.utils.keyword_matcher import get_matcher
+
 RAW_PATH = "data/raw/news_sample.csv"
 OUT_PATH = "data/processed/selected_news.json"
 
@@ -15,8 +17,7 @@ KEYWORDS = [
 
 
 def is_relevant(title: str, text: str) -> bool:
-    content = f"{title} {text}".lower()
-    return any(k in content for k in KEYWORDS)
+    return get_matcher(tuple(KEYWORDS)).contains_any(f"{title} {text}")
 
 
 def select_top_news(df, top_n=1):
@@ -0,0 +1,136 @@
+# services/meme_engine/line_dedupe.py
+"""
+Near-duplicate line removal.
+Keeps a line unless its difflib ratio to an already kept line exceeds
+the threshold — the same rule as comparing every pair — but the exact
+SequenceMatcher ratio only runs on candidates that pass upper bounds of
+it, cheapest first:
+- exact repeat (set lookup)
+- shared characters, from character histograms of all kept lines at
+  once (NumPy); this is at least quick_ratio
+- longest common subsequence (bit-parallel): SequenceMatcher's matching
+  blocks form a common subsequence, so 2 * LCS / total >= ratio
+Only provable bounds are used (no MinHash / shingle sampling), so the
+kept lines are exactly those of the all-pairs loop.
+"""
+
+from difflib import SequenceMatcher
+from typing import List
+
+import numpy as np
+
+
+class LineDeduplicator:
+    """
+    Args:
+        threshold: Lines with ratio > threshold to a kept line are dropped
+        buckets: Character histogram size for the prefilter (any size
+            gives a valid bound; more buckets give a tighter one)
+    """
+
+    def __init__(self, threshold: float = 0.88, buckets: int = 64):
+        self.threshold = threshold
+        self.buckets = buckets
+        self.reset()
+
+    # ---------- PUBLIC ----------
+    def deduplicate(self, lines: List[str]) -> List[str]:
+        """Lines in order, without near-duplicates of earlier kept lines."""
+        self.reset(capacity=len(lines))
+        return [line for line in lines if self.add(line)]
+
+    def add(self, line: str) -> bool:
+        """
+        Incremental form of deduplicate(): keep `line` unless it
+        near-duplicates a line kept so far. Returns whether it was kept.
+        """
+        lower = line.lower()
+        if lower in self._seen and self.threshold < 1.0:
+            return False  # ratio of identical strings is 1.0
+
+        histogram = self._histogram(lower)
+        n = len(self.kept)
+        if n and self._has_similar(lower, histogram, self._histograms[:n], self._lengths[:n]):
+            return False
+
+        if n == len(self._lengths):
+            self._histograms = np.concatenate([self._histograms, np.zeros_like(self._histograms)])
+            self._lengths = np.concatenate([self._lengths, np.zeros_like(self._lengths)])
+        self._histograms[n] = histogram
+        self._lengths[n] = len(lower)
+        self.kept.append(line)
+        self._kept_lower.append(lower)
+        self._seen.add(lower)
+        return True
+
+    def reset(self, capacity: int = 64):
+        """Forget the kept lines."""
+        self.kept = []
+        self._kept_lower = []
+        self._masks = {}      # kept index -> {char: bit mask of its positions}
+        self._matchers = {}   # kept index -> SequenceMatcher with the kept line as seq2
+        self._seen = set()
+        self._histograms = np.zeros((max(capacity, 1), self.buckets), dtype=np.int32)
+        self._lengths = np.zeros(max(capacity, 1), dtype=np.float64)
+
+    def is_similar(self, a: str, b: str) -> bool:
+        """difflib ratio of the lowercased lines above the threshold."""
+        return self._exact_similar(a.lower(), b.lower())
+
+    # ---------- CORE LOGIC ----------
+    def _has_similar(self, lower, histogram, histograms, lengths):
+        # Shared characters bound the matching characters from above
+        shared = np.minimum(histograms, histogram).sum(axis=1)
+        bound = 2.0 * shared / (len(lower) + lengths)
+        candidates = np.flatnonzero(bound > self.threshold)
+
+        # Most promising first, so a duplicate is usually confirmed on the first try
+        for j in candidates[np.argsort(-bound[candidates], kind="stable")].tolist():
+            other = self._kept_lower[j]
+            if j not in self._masks:
+                self._masks[j] = _position_masks(other)
+            if not _lcs_exceeds(lower, self._masks[j], len(other), self.threshold):
+                continue
+
+            if j not in self._matchers:
+                self._matchers[j] = SequenceMatcher(None, "", other)
+            matcher = self._matchers[j]
+            matcher.set_seq1(lower)
+            if matcher.ratio() > self.threshold:
+                return True
+        return False
+
+    def _exact_similar(self, a, b):
+        return SequenceMatcher(None, a, b).ratio() > self.threshold
+
+    # ---------- HELPERS ----------
+    def _histogram(self, text):
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        return np.bincount(codes % self.buckets, minlength=self.buckets)
+
+
+def _position_masks(text):
+    masks = {}
+    for i, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _lcs_exceeds(a, b_masks, b_length, threshold, check_every=16):
+    """
+    Whether 2 * LCS(a, b) / (len(a) + len(b)) > threshold, with the LCS
+    from Hyyrö's bit-vector algorithm. Every `check_every` characters
+    it stops early once the LCS so far plus the characters left in `a`
+    can no longer get there.
+    """
+    total = len(a) + b_length
+    full = (1 << b_length) - 1
+    v = full
+    for i, char in enumerate(a, start=1):
+        u = v & b_masks.get(char, 0)
+        v = ((v + u) | (v - u)) & full
+        if i % check_every == 0:
+            reachable = b_length - bin(v).count("1") + len(a) - i
+            if 2.0 * reachable / total <= threshold:
+                return False
+    return 2.0 * (b_length - bin(v).count("1")) / total > threshold
@@ -5,7 +5,10 @@ Single Responsibility: Load and manage LLM for text generation.
 All model config comes from config.yaml, not hard-coded.
 """
 
-from transformers import AutoTokenizer, AutoModelForCausalLM
+import threading
+from typing import Iterator, List
+
+from transformers import AutoTokenizer, AutoModelForCausalLM, StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
 import torch
 from shared.config.config_loader import ConfigLoader
 
@@ -60,31 +63,118 @@ class LLMEngine:
         Returns:
             Generated text
         """
-        if max_new_tokens is None:
-            max_new_tokens = self.config.get("max_tokens", 512)
-        
-        temperature = self.config.get("temperature", 0.7)
-        top_p = self.config.get("top_p", 0.95)
+        try:
+            inputs = self.tokenizer(prompt, return_tensors="pt").to(self.device)
+            
+            outputs = self.model.generate(**inputs, **self._sampling_kwargs(max_new_tokens))
+            
+            return self.tokenizer.decode(outputs[0], skip_special_tokens=True)
+        except Exception as e:
+            self._log(f"Generation failed: {e}", "ERROR")
+            raise
+    
+    def generate_many(self, prompt: str, n: int, max_new_tokens: int = None,
+                      skip_prompt: bool = False) -> List[str]:
+        """
+        Sample n completions of one prompt in a single batched generate
+        call (num_return_sequences), so the prompt is tokenized and the
+        model invoked once instead of n times.
         
+        Args:
+            prompt: Input prompt
+            n: Number of candidates
+            max_new_tokens: Max tokens to generate (uses config default if None)
+            skip_prompt: Decode only the generated tokens (generate()
+                returns the prompt too)
+            
+        Returns:
+            n generated texts
+        """
         try:
             inputs = self.tokenizer(prompt, return_tensors="pt").to(self.device)
             
             outputs = self.model.generate(
                 **inputs,
-                max_new_tokens=max_new_tokens,
-                do_sample=True,
-                temperature=temperature,
-                top_p=top_p
+                **self._sampling_kwargs(max_new_tokens),
+                num_return_sequences=n
             )
+            if skip_prompt:
+                outputs = outputs[:, inputs["input_ids"].shape[1]:]
             
-            return self.tokenizer.decode(outputs[0], skip_special_tokens=True)
+            return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
         except Exception as e:
             self._log(f"Generation failed: {e}", "ERROR")
             raise
     
+    def generate_stream(self, prompt: str, max_new_tokens: int = None) -> Iterator[str]:
+        """
+        Generate text from prompt as a stream of text chunks, decoded while
+        tokens are produced. Only generated text is streamed, not the
+        prompt: its lines would count toward StreamingRefiner's line
+        limit. Closing the iterator early (e.g. StreamingRefiner once
+        the format is satisfied) stops generation at the next token.
+        
+        Args:
+            prompt: Input prompt
+            max_new_tokens: Max tokens to generate (uses config default if None)
+            
+        Yields:
+            Generated text chunks
+        """
+        inputs = self.tokenizer(prompt, return_tensors="pt").to(self.device)
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        stop = threading.Event()
+        errors = []
+        
+        def run():
+            try:
+                self.model.generate(
+                    **inputs,
+                    **self._sampling_kwargs(max_new_tokens),
+                    streamer=streamer,
+                    stopping_criteria=StoppingCriteriaList([_StopOnEvent(stop)])
+                )
+            except Exception as e:
+                errors.append(e)
+                streamer.end()  # unblock the consumer
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        try:
+            yield from streamer
+        finally:
+            stop.set()
+            thread.join()
+        
+        if errors:
+            self._log(f"Generation failed: {errors[0]}", "ERROR")
+            raise errors[0]
+    
+    def _sampling_kwargs(self, max_new_tokens: int = None) -> dict:
+        """model.generate() settings from config."""
+        if max_new_tokens is None:
+            max_new_tokens = self.config.get("max_tokens", 512)
+        
+        return {
+            "max_new_tokens": max_new_tokens,
+            "do_sample": True,
+            "temperature": self.config.get("temperature", 0.7),
+            "top_p": self.config.get("top_p", 0.95)
+        }
+    
     def _log(self, message: str, level: str = "INFO"):
         """Helper for logging."""
         if self.logger:
             getattr(self.logger, level.lower())(message)
         else:
             print(f"[LLM] [{level}] {message}")
+
+
+class _StopOnEvent(StoppingCriteria):
+    """Stops generation once `event` is set (checked after every token)."""
+    
+    def __init__(self, event: threading.Event):
+        self.event = event
+    
+    def __call__(self, input_ids, scores, **kwargs):
+        return torch.full((input_ids.shape[0],), self.event.is_set(), dtype=torch.bool, device=input_ids.device)
@@ -0,0 +1,105 @@
+# services/meme_engine/streaming_refiner.py
+"""
+Incremental ContentRefiner for streamed generations.
+Chunks are split into lines as they arrive and every complete line is
+cleaned (ArtifactStripper.strip_line) and deduplicated
+(LineDeduplicator.add) right away. The platform formatters only use a
+fixed number of leading lines, so once that many are kept the rest of
+the generation can't change the output and the producer is told to
+stop. The result equals ContentRefiner.refine on the full generation.
+
+    refiner = StreamingRefiner("twitter")
+    text = refiner.refine_stream(writer.write_stream(article_text))
+"""
+
+from typing import Iterable, List, Optional
+
+from services.meme_engine.content_refiner import ContentRefiner, _stripper_for
+from services.meme_engine.line_dedupe import LineDeduplicator
+
+# Kept lines each formatter uses; later lines can't change its output
+LINE_LIMITS = {
+    "twitter": 7,          # one tweet per line
+    "medium": 1 + 3 * 4,   # title + three 4-line sections
+    "youtube": 1 + 5       # hook + 5 body lines
+}
+
+
+class StreamingRefiner:
+    """
+    Args:
+        style: Target platform style, as ContentRefiner.refine
+        similarity_threshold: Near-duplicate line threshold
+    """
+
+    def __init__(self, style: str, similarity_threshold: float = 0.88):
+        self.style = style.lower()
+        self.limit: Optional[int] = LINE_LIMITS.get(self.style)  # None: every line is used
+        self.done = False
+
+        self._refiner = ContentRefiner(similarity_threshold)
+        self._stripper = _stripper_for(self.style)
+        self._deduplicator = LineDeduplicator(similarity_threshold)
+        self._partial = []  # pieces of the line still being generated
+
+    @property
+    def lines(self) -> List[str]:
+        """Lines kept so far (cleaned, deduplicated)."""
+        return self._deduplicator.kept
+
+    # ---------- PUBLIC ----------
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume the next chunk of generated text. Returns True once the
+        format is satisfied; anything fed after that is ignored.
+        """
+        if self.done or "\n" not in chunk:
+            if not self.done:
+                self._partial.append(chunk)
+            return self.done
+
+        first, *rest = chunk.split("\n")
+        self._partial.append(first)
+        complete = ["".join(self._partial)] + rest[:-1]
+        self._partial = [rest[-1]]
+
+        for line in complete:
+            self._add_line(line)
+            if self.done:
+                break
+        return self.done
+
+    def finish(self) -> str:
+        """Refined text of everything fed (a trailing partial line included)."""
+        if not self.done:
+            self._add_line("".join(self._partial))
+        self._partial = []
+        return self._refiner._format(list(self.lines), self.style)
+
+    def refine_stream(self, chunks: Iterable[str]) -> str:
+        """
+        Feed chunks until the format is satisfied, then close the chunk
+        iterator, which makes a generator producer (e.g.
+        LLMEngine.generate_stream) stop generating.
+        """
+        chunks = iter(chunks)
+        try:
+            for chunk in chunks:
+                if self.feed(chunk):
+                    break
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        return self.finish()
+
+    # ---------- CORE LOGIC ----------
+    def _add_line(self, line):
+        """One line through the same steps as refine(): artifacts, blank lines, near-duplicates."""
+        line = self._stripper.strip_line(line)
+        if line is None:
+            return
+
+        line = line.strip()
+        if line and self._deduplicator.add(line) and self.limit is not None:
+            self.done = len(self.lines) >= self.limit
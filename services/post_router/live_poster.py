@@ -18,6 +18,7 @@ sys.path.append(str(ROOT_DIR))
 
 from services.infrastructure.poster_factory import PosterFactory
 from services.infrastructure.base_poster import PostPayload
+from services.meme_engine.content_history import ContentHistory
 from shared.config.config_loader import ConfigLoader
 
 
@@ -32,6 +33,7 @@ class LivePoster:
         queue_dir: Path = None,
         enabled_platforms: List[str] = None,
         live_mode: bool = None,
+        history: ContentHistory = None,
         logger=None
     ):
         """
@@ -39,6 +41,7 @@ class LivePoster:
             queue_dir: Directory with post payloads. If None, uses config.
             enabled_platforms: List of enabled platforms. If None, uses config.
             live_mode: Whether to actually post. If None, uses config.
+            history: Content history posts are recorded in. If None, uses config.
             logger: Optional logger instance
         """
         self.config_loader = ConfigLoader()
@@ -54,6 +57,7 @@ class LivePoster:
             live_mode if live_mode is not None else
             self.config_loader.is_live_mode()
         )
+        self.history = history if history is not None else ContentHistory.from_config()
         
         self.results = []
     
@@ -159,6 +163,10 @@ class LivePoster:
             # Post
             result = poster.post(payload)
             
+            # Record in content history so later runs skip near-duplicates
+            if self.history is not None and result.get("status") == "success":
+                self.history.mark_posted(payload.content, platform)
+            
             # Add context
             result["title"] = payload.title
             result["timestamp"] = datetime.utcnow().isoformat()
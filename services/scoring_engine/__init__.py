@@ -5,18 +5,41 @@ Analyzes market signals, trends, and content quality.
 
 from services.scoring_engine.market_signal_collector import collect_market_signals
 from services.scoring_engine.market_signal_scorer import MarketSignalScorer
+from services.scoring_engine.columnar_scorer import ColumnarSignalScorer, SignalColumns
+from services.scoring_engine.streaming_scorer import StreamingTrendScorer
+from services.scoring_engine.sharded_scorer import ShardedSignalScorer
+from services.scoring_engine.near_duplicate_detector import NearDuplicateDetector
+from services.scoring_engine.topic_clusterer import TopicClusterer
+from services.scoring_engine.topic_index import TopicVectorIndex, get_index
+from services.scoring_engine.trend_articles import TrendArticleIndex
+from services.scoring_engine.trend_store import TrendStore, get_store
+from services.scoring_engine.trend_series import TrendSeries
 from services.scoring_engine.trend_memory import load_memory, update_memory, init_memory
-from services.scoring_engine.trend_evolution import update_trend_memory, get_trend_evolution_status
+from services.scoring_engine.trend_evolution import update_trend_memory, get_trend_evolution_status, get_evolution_cache_stats, compact_trend_memory
 from services.scoring_engine.trend_bias_engine import apply_trend_bias
 
 __all__ = [
     'collect_market_signals',
     'MarketSignalScorer',
+    'ColumnarSignalScorer',
+    'SignalColumns',
+    'StreamingTrendScorer',
+    'ShardedSignalScorer',
+    'NearDuplicateDetector',
+    'TopicClusterer',
+    'TopicVectorIndex',
+    'get_index',
+    'TrendArticleIndex',
+    'TrendStore',
+    'get_store',
+    'TrendSeries',
     'load_memory',
     'update_memory',
     'init_memory',
     'update_trend_memory',
     'get_trend_evolution_status',
+    'get_evolution_cache_stats',
+    'compact_trend_memory',
     'apply_trend_bias',
 ]
 
@@ -0,0 +1,203 @@
+# services/scoring_engine/columnar_scorer.py
+
+import warnings
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import numpy as np
+
+from services.scoring_engine.market_signal_scorer import MarketSignalScorer, TREND_KEYWORDS
+from shared.utils.keyword_matcher import get_matcher
+
+EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass
+class SignalColumns:
+    """
+    Signals converted once to flat arrays.
+    Source membership is exploded to (topic, source) pairs so merged
+    signals carrying several sources count each of them.
+    """
+    topics: List[str]           # topic id -> grouping key
+    fields: List[Dict]          # topic id -> {label[, topic_id]}
+    sources: List[str]          # source id -> source name
+    topic_ids: np.ndarray       # (n,) int64
+    epoch: np.ndarray           # (n,) float64, seconds since epoch (UTC)
+    keyword_hits: np.ndarray    # (n,) int32
+    pair_topic_ids: np.ndarray  # (m,) int64
+    pair_source_ids: np.ndarray  # (m,) int64
+
+    def __len__(self):
+        return len(self.topic_ids)
+
+
+class ColumnarSignalScorer(MarketSignalScorer):
+    """
+    Same scoring model and output as MarketSignalScorer.score, computed
+    with NumPy group-by reductions over SignalColumns instead of a
+    per-item Python loop. Timestamps are parsed once, in bulk, and a
+    single `now` is used for the whole batch.
+    """
+
+    # ---------- PUBLIC ----------
+    def score(self, signals):
+        """
+        signals: list of dicts
+        Each dict must contain: title, summary, source, timestamp
+        (merged duplicates may also carry a `sources` list)
+        """
+        if not signals:
+            return []
+        now = utc_now_epoch()
+        return self.score_columns(self.to_columns(signals), now=now)
+
+    def score_top_k(self, signals, k):
+        """Same result as score(signals)[:k]; only the top k are ranked and built."""
+        if not signals or k <= 0:
+            return []
+        now = utc_now_epoch()
+        return self.score_columns(self.to_columns(signals), now=now, k=k)
+
+    def score_columns(self, columns, now=None, k=None):
+        """
+        Score pre-built columns. Returns the same list of topic dicts as
+        MarketSignalScorer.score, sorted by score descending (only the
+        first k when k is given).
+        """
+        scores, counts, pairs = self._topic_scores(columns, now)
+
+        candidates = np.arange(len(scores))
+        if k is not None and len(scores) > k:
+            # Keep everything that can still round into the top k, then rank exactly
+            kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+            candidates = np.flatnonzero(scores >= kth - 0.001)
+
+        n_sources = max(len(columns.sources), 1)
+        pair_topics = pairs // n_sources
+        pair_bounds = np.searchsorted(pair_topics, np.arange(len(columns.topics) + 1))
+        pair_sources = (pairs % n_sources).tolist()
+
+        # Member signal positions, grouped by topic (signal order kept)
+        members = np.argsort(columns.topic_ids, kind="stable")
+        member_bounds = np.concatenate(([0], np.cumsum(counts)))
+
+        rounded = dict(zip(candidates.tolist(), (round(s, 3) for s in scores[candidates].tolist())))
+        order = sorted(rounded, key=rounded.__getitem__, reverse=True)[:k]
+
+        scored_topics = []
+        for t in order:
+            scored_topics.append({
+                "topic": columns.topics[t],
+                **columns.fields[t],
+                "score": rounded[t],
+                "mentions": int(counts[t]),
+                "sources": [
+                    columns.sources[s]
+                    for s in pair_sources[pair_bounds[t]:pair_bounds[t + 1]]
+                ],
+                "signal_ids": members[member_bounds[t]:member_bounds[t + 1]].tolist()
+            })
+
+        return scored_topics
+
+    def to_columns(self, signals):
+        """Convert signal dicts to SignalColumns (one pass per column)."""
+        n = len(signals)
+
+        topic_index = {}
+        topic_ids = np.fromiter(
+            (
+                topic_index.setdefault(topic, len(topic_index))
+                for topic in map(self._topic_of, signals)
+            ),
+            dtype=np.int64,
+            count=n
+        )
+        first = np.unique(topic_ids, return_index=True)[1]  # first member of each topic
+
+        matcher = get_matcher(tuple(TREND_KEYWORDS))
+        keyword_hits = np.fromiter(
+            (matcher.count(s["title"] + " " + s["summary"]) for s in signals),
+            dtype=np.int32,
+            count=n
+        )
+
+        source_index = {}
+        pair_topics, pair_sources = [], []
+        for t, s in zip(topic_ids.tolist(), signals):
+            for source in s.get("sources") or [s["source"]]:
+                pair_topics.append(t)
+                pair_sources.append(source_index.setdefault(source, len(source_index)))
+
+        return SignalColumns(
+            topics=list(topic_index),
+            fields=[self._topic_fields(signals[i]) for i in first.tolist()],
+            sources=list(source_index),
+            topic_ids=topic_ids,
+            epoch=self._parse_timestamps([s["timestamp"] for s in signals]),
+            keyword_hits=keyword_hits,
+            pair_topic_ids=np.array(pair_topics, dtype=np.int64),
+            pair_source_ids=np.array(pair_sources, dtype=np.int64)
+        )
+
+    # ---------- CORE LOGIC ----------
+    def _topic_scores(self, columns, now=None):
+        """
+        Per-topic final score and mention count, indexed by topic id, plus
+        the sorted distinct (topic, source) pairs encoded as
+        topic_id * n_sources + source_id.
+        """
+        n_topics = len(columns.topics)
+        now = utc_now_epoch() if now is None else now
+
+        counts = np.bincount(columns.topic_ids, minlength=n_topics)
+
+        hours = (now - columns.epoch) / 3600
+        recency = np.exp(-hours / self.decay_hours)
+        recency_score = np.bincount(columns.topic_ids, weights=recency, minlength=n_topics) / counts
+
+        strength = columns.keyword_hits / max(len(TREND_KEYWORDS), 1)
+        keyword_score = np.bincount(columns.topic_ids, weights=strength, minlength=n_topics) / counts
+
+        n_sources = max(len(columns.sources), 1)
+        pairs = np.unique(columns.pair_topic_ids * n_sources + columns.pair_source_ids)
+        distinct = np.bincount(pairs // n_sources, minlength=n_topics)
+
+        scores = (
+            0.4 * np.log(counts + 1) +
+            0.3 * recency_score +
+            0.2 * keyword_score +
+            0.1 * distinct
+        )
+
+        return scores, counts, pairs
+
+    # ---------- HELPERS ----------
+    @staticmethod
+    def _parse_timestamps(timestamps):
+        """
+        ISO strings -> float seconds since epoch, naive values read as UTC
+        (as datetime.utcnow() does). Parsed in bulk by NumPy, with a
+        per-item fallback for values carrying a UTC offset.
+        """
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                parsed = np.array(timestamps, dtype="datetime64[us]")
+            return parsed.astype(np.int64) / 1e6
+        except (ValueError, UserWarning):
+            return np.array([_to_epoch(t) for t in timestamps], dtype=np.float64)
+
+
+def _to_epoch(timestamp):
+    t = datetime.fromisoformat(timestamp)
+    if t.tzinfo is not None:
+        t = t.astimezone(timezone.utc).replace(tzinfo=None)
+    return (t - EPOCH).total_seconds()
+
+
+def utc_now_epoch():
+    """Current UTC time in seconds since epoch."""
+    return (datetime.utcnow() - EPOCH).total_seconds()
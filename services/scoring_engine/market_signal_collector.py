@@ -6,46 +6,184 @@ from pathlib import Path
 
 import feedparser
 
+from shared.config.config_loader import ConfigLoader
+from shared.config.source_registry import SourceRegistry
+from shared.utils.helpers import canonicalize_url, parallel_map
+from shared.utils.http_fetch import fetch_all
+from shared.utils.response_archive import ResponseArchive
 
-# ---------------- CONFIG ----------------
-RSS_SOURCES = {
-    "ai_news": "https://www.theverge.com/rss/ai-artificial-intelligence/index.xml",
-    "tech_news": "https://www.theverge.com/rss/index.xml"
-}
 
+# ---------------- CONFIG ----------------
 OUTPUT_DIR = Path("data/processed")
 OUTPUT_FILE = OUTPUT_DIR / "market_signals.csv"
 
+FIELDS = [
+    "timestamp",
+    "source",
+    "title",
+    "summary",
+    "link",
+    "type",
+    "canonical_link",
+    "sources"
+]
+
+SOURCES_SEPARATOR = "|"
+
 
 # ---------------- CORE ----------------
-def collect_market_signals(limit_per_source: int = 5):
+def collect_market_signals(limit_per_source: int = None, force: bool = False, replay: bool = None):
     """
-    Collects raw market signals from public RSS feeds
+    Collects raw market signals from the RSS feeds in the source registry
     and stores them in a structured CSV.
+
+    Only sources whose refresh interval has elapsed are fetched (all of
+    them when force=True); signals from the other sources are carried
+    over from the previous snapshot. Feeds are downloaded concurrently
+    and parsed in a process pool.
+
+    Entries are keyed by canonical link, so the same story from several
+    feeds is kept once with every feed listed in `sources`.
+
+    Live responses are written to the response archive. With replay=True
+    (or archive.replay in config) every source is served from the archive
+    with no network access; the CSV snapshot and the due-state are left
+    untouched.
+
+    limit_per_source caps the entries taken from each feed on top of the
+    source's own `limit` (None = registry limits only).
     """
 
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    config = ConfigLoader()
+    registry = SourceRegistry.from_config()
+    archive = ResponseArchive.from_config(replay=replay)
+
+    if force or archive.replay:
+        sources = registry.sources("rss")
+    else:
+        sources = registry.due("rss", max_sources=config.get("sources.max_per_cycle", 0))
+
+    print(f"[SIGNAL] {len(sources)} RSS sources due for refresh")
+
+    responses = fetch_all(
+        [s.url for s in sources],
+        max_concurrency=config.get("sources.max_concurrency", 16),
+        archive=archive
+    )
+
+    jobs = []
+    fetched = []
+
+    for source, response in zip(sources, responses):
+        if not response.ok:
+            print(f"[WARN] Failed to fetch {source.name}: {response.error or response.status}")
+            continue
+
+        fetched.append(source)
+        jobs.append((
+            source.name,
+            response.body,
+            min(source.limit, limit_per_source) if limit_per_source else source.limit,
+            datetime.utcfromtimestamp(response.fetched_at).isoformat()
+        ))
+
+    batches = parallel_map(_parse_feed, jobs, workers=config.get("sources.parse_workers", 1))
+    signals = [signal for batch in batches for signal in batch]
+
+    fetched_names = {s.name for s in fetched}
+    known_names = {s.name for s in registry.sources("rss")}
+    carried = [] if archive.replay else _carry_over(
+        _load_previous_signals(), known_names - fetched_names
+    )
+
+    fresh = len(signals)
+    signals = _merge_by_link(signals + carried)
+
+    if not archive.replay:
+        _save_signals(signals)
+        registry.mark_fetched(fetched)
+    print(f"[OK] {len(signals)} market signals collected "
+          f"({fresh} fresh, {len(carried)} carried over, "
+          f"{fresh + len(carried) - len(signals)} merged by link)")
+    return signals
+
+
+# ---------------- MERGE ----------------
+def _merge_by_link(signals):
+    """
+    Merge signals sharing a canonical link, keeping the first one seen and
+    the union of their sources. One dict lookup per signal.
+    """
+    index = {}
+    merged = []
+
+    for signal in signals:
+        key = signal.get("canonical_link")
+        existing = index.get(key) if key else None
+
+        if existing is None:
+            if key:
+                index[key] = signal
+            merged.append(signal)
+            continue
+
+        for source in signal["sources"]:
+            if source not in existing["sources"]:
+                existing["sources"].append(source)
+
+    return merged
+
+
+def _carry_over(previous, carry_names):
+    """
+    Keep previous signals that belong to sources not fetched this cycle,
+    limited to those sources (fresh data replaces the rest).
+    """
+    carried = []
+    for signal in previous:
+        sources = [s for s in signal["sources"] if s in carry_names]
+        if sources:
+            carried.append({**signal, "source": sources[0], "sources": sources})
+    return carried
+
+
+# ---------------- PARSE ----------------
+def _parse_feed(job):
+    """
+    Parse one downloaded feed into signal dicts.
+    Top-level so it can run in a worker process.
+    """
+    source_name, body, limit, collected_at = job
+    feed = feedparser.parse(body)
 
     signals = []
+    for entry in feed.entries[:limit]:
+        signals.append({
+            "timestamp": collected_at,
+            "source": source_name,
+            "title": entry.get("title", "").strip(),
+            "summary": entry.get("summary", "").strip(),
+            "link": entry.get("link", ""),
+            "type": "news",
+            "canonical_link": canonicalize_url(entry.get("link", "")),
+            "sources": [source_name]
+        })
+    return signals
 
-    for source_name, feed_url in RSS_SOURCES.items():
-        print(f"[SIGNAL] Fetching from {source_name}")
 
-        feed = feedparser.parse(feed_url)
+# ---------------- LOAD ----------------
+def _load_previous_signals():
+    if not OUTPUT_FILE.exists():
+        return []
 
-        for entry in feed.entries[:limit_per_source]:
-            signal = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "source": source_name,
-                "title": entry.get("title", "").strip(),
-                "summary": entry.get("summary", "").strip(),
-                "link": entry.get("link", ""),
-                "type": "news"
-            }
-            signals.append(signal)
+    with open(OUTPUT_FILE, mode="r", newline="", encoding="utf-8") as f:
+        signals = list(csv.DictReader(f))
+
+    for signal in signals:
+        raw = signal.get("sources") or signal["source"]
+        signal["sources"] = raw.split(SOURCES_SEPARATOR)
+        signal["canonical_link"] = signal.get("canonical_link") or canonicalize_url(signal.get("link", ""))
 
-    _save_signals(signals)
-    print(f"[OK] {len(signals)} market signals collected")
     return signals
 
 
@@ -55,13 +193,17 @@ def _save_signals(signals):
         print("[WARN] No signals to save")
         return
 
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     with open(OUTPUT_FILE, mode="w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(
             f,
-            fieldnames=signals[0].keys()
+            fieldnames=FIELDS,
+            extrasaction="ignore"
         )
         writer.writeheader()
-        writer.writerows(signals)
+        writer.writerows(
+            {**s, "sources": SOURCES_SEPARATOR.join(s["sources"])} for s in signals
+        )
 
     print(f"[SAVE] Signals written to {OUTPUT_FILE}")
 
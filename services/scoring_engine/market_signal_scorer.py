@@ -1,9 +1,12 @@
 # services/scoring_engine/market_signal_scorer.py
 
+import heapq
 import math
 from datetime import datetime
 from collections import defaultdict
 
+from shared.utils.keyword_matcher import get_matcher
+
 
 TREND_KEYWORDS = [
     "ai", "agent", "autonomous", "openai", "launch",
@@ -21,75 +24,179 @@ class MarketSignalScorer:
         """
         signals: list of dicts
         Each dict must contain: title, summary, source, timestamp
+        (merged duplicates may also carry a `sources` list)
+        Each topic lists its member signals as `signal_ids`
+        (positions in `signals`), its human-readable `label` and, for
+        TopicClusterer topics, its `topic_id`.
         """
 
-        grouped = self._group_by_topic(signals)
+        positions = self._group_positions(signals)
         scored_topics = []
 
-        for topic, items in grouped.items():
+        for topic, ids in positions.items():
+            items = [signals[i] for i in ids]
             score = self._compute_score(items)
             scored_topics.append({
                 "topic": topic,
+                **self._topic_fields(items[0]),
                 "score": round(score, 3),
                 "mentions": len(items),
-                "sources": list(set(i["source"] for i in items))
+                "sources": list(self._distinct_sources(items)),
+                "signal_ids": ids
             })
 
         scored_topics.sort(key=lambda x: x["score"], reverse=True)
         return scored_topics
 
+    def score_top_k(self, signals, k):
+        """
+        Same result as score(signals)[:k] without ranking every topic.
+        Topics are visited by an upper bound on their score (exact
+        frequency, recency and source terms, best-case keyword term) and
+        kept in a k-sized heap; keyword matching stops as soon as no
+        remaining topic can reach the current k-th score.
+        """
+        if k <= 0:
+            return []
+
+        positions = self._group_positions(signals)
+        topics = list(positions)
+        grouped = {topic: [signals[i] for i in ids] for topic, ids in positions.items()}
+
+        terms = []
+        bounds = []
+        for position, items in enumerate(grouped.values()):
+            freq_score, recency_score, sources = self._base_terms(items)
+            terms.append((freq_score, recency_score, sources))
+            bound = self._combine(freq_score, recency_score, 1.0, len(sources))
+            bounds.append((-bound, position))
+        heapq.heapify(bounds)
+
+        # Min-heap of the best k so far: (rounded score, -position), so
+        # the root is the entry score() would rank last among them
+        best = []
+        while bounds:
+            negative_bound, position = heapq.heappop(bounds)
+            if len(best) == k and round(-negative_bound, 3) < best[0][0]:
+                break
+
+            freq_score, recency_score, sources = terms[position]
+            keyword_score = self._keyword_score(grouped[topics[position]])
+            entry = (
+                round(self._combine(freq_score, recency_score, keyword_score, len(sources)), 3),
+                -position
+            )
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+
+        return [
+            {
+                "topic": topics[-negative_position],
+                **self._topic_fields(grouped[topics[-negative_position]][0]),
+                "score": score,
+                "mentions": len(grouped[topics[-negative_position]]),
+                "sources": list(terms[-negative_position][2]),
+                "signal_ids": positions[topics[-negative_position]]
+            }
+            for score, negative_position in sorted(best, key=lambda e: (-e[0], -e[1]))
+        ]
+
     # ---------- CORE LOGIC ----------
     def _compute_score(self, items):
+        freq_score, recency_score, sources = self._base_terms(items)
+        return self._combine(freq_score, recency_score, self._keyword_score(items), len(sources))
+
+    def _base_terms(self, items):
+        """Frequency and recency terms plus the distinct sources."""
         freq_score = math.log(len(items) + 1)
 
         recency_score = sum(
             self._recency_weight(i["timestamp"]) for i in items
         ) / len(items)
 
-        keyword_score = sum(
+        return freq_score, recency_score, self._distinct_sources(items)
+
+    def _keyword_score(self, items):
+        """Mean keyword strength, in [0, 1]."""
+        return sum(
             self._keyword_strength(i["title"] + " " + i["summary"])
             for i in items
         ) / len(items)
 
-        source_diversity = len(set(i["source"] for i in items))
-
-        final_score = (
+    @staticmethod
+    def _combine(freq_score, recency_score, keyword_score, source_diversity):
+        return (
             0.4 * freq_score +
             0.3 * recency_score +
             0.2 * keyword_score +
             0.1 * source_diversity
         )
 
-        return final_score
-
     # ---------- HELPERS ----------
-    def _recency_weight(self, timestamp):
+    def _recency_weight(self, timestamp, now=None):
         """
         Expects ISO timestamp string
         """
-        now = datetime.utcnow()
+        now = datetime.utcnow() if now is None else now
         t = datetime.fromisoformat(timestamp)
         hours_diff = (now - t).total_seconds() / 3600
 
         return math.exp(-hours_diff / self.decay_hours)
 
     def _keyword_strength(self, text):
-        text = text.lower()
-        hits = sum(1 for kw in TREND_KEYWORDS if kw in text)
+        hits = get_matcher(tuple(TREND_KEYWORDS)).count(text)
         return hits / max(len(TREND_KEYWORDS), 1)
 
+    def _distinct_sources(self, items):
+        return set(
+            source
+            for i in items
+            for source in (i.get("sources") or [i["source"]])
+        )
+
     def _group_by_topic(self, signals):
+        return {
+            topic: [signals[i] for i in ids]
+            for topic, ids in self._group_positions(signals).items()
+        }
+
+    def _group_positions(self, signals):
+        """{topic: [positions of its signals]}, topics in first-appearance order."""
         buckets = defaultdict(list)
 
-        for s in signals:
-            topic = self._extract_topic(s["title"])
-            buckets[topic].append(s)
+        for i, s in enumerate(signals):
+            buckets[self._topic_of(s)].append(i)
 
         return buckets
 
+    def _topic_of(self, signal):
+        """
+        Grouping key. TopicClusterer labels are founding headlines and can
+        repeat across topics, so clustered signals group by `topic_id`
+        (key "<label> #<topic_id>"); others by the title-prefix fallback.
+        """
+        label = self._label_of(signal)
+        topic_id = signal.get("topic_id")
+        return label if topic_id is None else f"{label} #{topic_id}"
+
+    def _label_of(self, signal):
+        """
+        Label assigned by TopicClusterer, else the title-prefix fallback
+        """
+        return signal.get("topic") or self._extract_topic(signal["title"])
+
+    def _topic_fields(self, signal):
+        """`label` (and `topic_id`) of the topic a member signal belongs to."""
+        fields = {"label": self._label_of(signal)}
+        if signal.get("topic_id") is not None:
+            fields["topic_id"] = signal["topic_id"]
+        return fields
+
     def _extract_topic(self, title):
         """
         Naive topic extraction (will improve in Sprint 4)
         """
-        words = title.split()
+        words = title.split(None, 4)
         return " ".join(words[:4]).lower()
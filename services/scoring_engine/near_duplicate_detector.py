@@ -0,0 +1,207 @@
+# services/scoring_engine/near_duplicate_detector.py
+
+import re
+import zlib
+from itertools import chain
+
+import numpy as np
+
+
+MIX = np.uint64(0x9E3779B97F4A7C15)
+EMPTY = np.uint64(0xFFFFFFFF)
+CHUNK_SHINGLES = 250_000
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class NearDuplicateDetector:
+    """
+    MinHash + LSH near-duplicate clustering over title+summary word shingles.
+    Candidate pairs only come from shared LSH buckets, so clustering is
+    roughly linear in the number of signals instead of quadratic.
+    """
+
+    def __init__(self, threshold=0.6, num_perm=64, bands=16, shingle_size=3, seed=1):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        # Multiply-shift hash family: h(x) = (a*x + b) mod 2^64 >> 32, a odd
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, 1 << 63, size=(num_perm, 1), dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 1 << 63, size=(num_perm, 1), dtype=np.uint64)
+
+    # ---------- PUBLIC ----------
+    def deduplicate(self, signals):
+        """
+        signals: list of dicts with title, summary, source
+        Returns one representative per cluster (the first one seen), with
+        `sources` listing every source in the cluster and `duplicates`
+        the number of signals it absorbed.
+        """
+        texts = [f"{s.get('title', '')} {s.get('summary', '')}" for s in signals]
+        deduped = []
+
+        for members in self.cluster(texts):
+            representative = dict(signals[members[0]])
+            sources = []
+            for i in members:
+                for source in signals[i].get("sources") or [signals[i]["source"]]:
+                    if source not in sources:
+                        sources.append(source)
+
+            representative["sources"] = sources
+            representative["duplicates"] = len(members) - 1
+            deduped.append(representative)
+
+        return deduped
+
+    def cluster(self, texts):
+        """
+        Group near-duplicate texts.
+        Returns lists of indices, ordered by first occurrence.
+        """
+        signatures, has_shingles = self.signatures(texts)
+        parent = list(range(len(texts)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, j in self._verified_pairs(signatures, has_shingles):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        clusters = {}
+        for i in range(len(texts)):
+            clusters.setdefault(find(i), []).append(i)
+
+        return sorted(clusters.values(), key=lambda members: members[0])
+
+    def signatures(self, texts):
+        """
+        MinHash signatures, shape (len(texts), num_perm), plus a mask of
+        texts that produced at least one shingle.
+        """
+        shingles, counts = self._shingle_hashes(texts)
+        signatures = np.full((len(texts), self.num_perm), EMPTY, dtype=np.uint64)
+        has_shingles = counts > 0
+
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        docs = np.flatnonzero(has_shingles)
+
+        # Process documents in chunks to bound the (num_perm x shingles) matrix
+        first = 0
+        while first < len(docs):
+            limit = starts[docs[first]] + CHUNK_SHINGLES
+            last = max(first + 1, int(np.searchsorted(ends[docs], limit, side="right")))
+            chunk = docs[first:last]
+
+            lo, hi = starts[chunk[0]], ends[chunk[-1]]
+            permuted = (self._a * shingles[lo:hi] + self._b) >> np.uint64(32)
+            signatures[chunk] = np.minimum.reduceat(permuted, starts[chunk] - lo, axis=1).T
+            first = last
+
+        return signatures, has_shingles
+
+    def band_keys(self, signatures):
+        """LSH bucket key of every band, shape (len(signatures), bands)."""
+        blocks = signatures.reshape(len(signatures), self.bands, self.rows)
+        keys = blocks[:, :, 0].copy()
+        for col in range(1, self.rows):
+            keys = keys * MIX + blocks[:, :, col]
+        return keys
+
+    # ---------- HELPERS ----------
+    def _verified_pairs(self, signatures, has_shingles):
+        """
+        Pairs sharing at least one LSH band bucket whose estimated Jaccard
+        similarity reaches the threshold. Each member of a bucket is
+        paired with the bucket's first member.
+        """
+        docs = np.flatnonzero(has_shingles)
+        if len(docs) < 2:
+            return []
+
+        band_keys = self.band_keys(signatures[docs])
+        left, right = [], []
+        for band in range(self.bands):
+            keys = band_keys[:, band]
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            run_start = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+            heads = order[np.maximum.accumulate(np.where(run_start, np.arange(len(order)), 0))]
+
+            dup = ~run_start
+            left.append(docs[heads[dup]])
+            right.append(docs[order[dup]])
+
+        left = np.concatenate(left)
+        right = np.concatenate(right)
+        if not len(left):
+            return []
+
+        pairs = np.unique(np.stack([left, right], axis=1), axis=0)
+        similarity = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        return pairs[similarity >= self.threshold].tolist()
+
+    def _shingle_hashes(self, texts):
+        """
+        Word k-gram hashes for every text, flattened in text order,
+        plus the shingle count of each text.
+        """
+        tokens = [TOKEN_PATTERN.findall(text.lower()) for text in texts]
+        vocab = {
+            token: zlib.crc32(token.encode("utf-8"))
+            for token in set(chain.from_iterable(tokens))
+        }
+
+        lengths = np.fromiter((len(t) for t in tokens), dtype=np.int64, count=len(texts))
+        flat = np.fromiter(
+            map(vocab.__getitem__, chain.from_iterable(tokens)),
+            dtype=np.uint64,
+            count=int(lengths.sum())
+        )
+
+        k = self.shingle_size
+        counts = np.where(lengths >= k, lengths - k + 1, np.minimum(lengths, 1))
+
+        if len(flat) >= k:
+            span = len(flat) - k + 1
+            combined = flat[:span].copy()
+            for m in range(1, k):
+                combined = combined * MIX + flat[m:m + span]
+
+            doc_of = np.repeat(np.arange(len(texts)), lengths)
+            shingles = combined[doc_of[:span] == doc_of[k - 1:]]
+        else:
+            shingles = np.empty(0, dtype=np.uint64)
+
+        short = np.flatnonzero((lengths > 0) & (lengths < k))
+        if len(short):
+            # Texts shorter than k tokens get a single shingle of all their tokens
+            short_hashes = []
+            for i in short:
+                h = 0
+                for token in tokens[i]:
+                    h = (h * int(MIX) + vocab[token]) & 0xFFFFFFFFFFFFFFFF
+                short_hashes.append(h)
+
+            positions = np.cumsum(counts)[short] - 1
+            merged = np.empty(int(counts.sum()), dtype=np.uint64)
+            mask = np.ones(len(merged), dtype=bool)
+            mask[positions] = False
+            merged[mask] = shingles
+            merged[positions] = short_hashes
+            shingles = merged
+
+        return shingles, counts
@@ -0,0 +1,218 @@
+# services/scoring_engine/sharded_scorer.py
+"""
+Multi-process scoring.
+Signals are partitioned by a stable hash of their topic, so every topic
+lives in exactly one shard. Each worker receives its shard as flat arrays
+(topic ids, timestamps, one text blob with offsets, source pairs),
+computes per-topic partial aggregates and the parent merges them into the
+same ranked list as MarketSignalScorer.score.
+"""
+
+import math
+import os
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+
+from shared.config.config_loader import ConfigLoader
+from shared.utils.helpers import parallel_map
+from services.scoring_engine.market_signal_scorer import MarketSignalScorer
+
+
+@dataclass
+class SignalShard:
+    """One worker's signals as compact arrays (all in original signal order)."""
+    decay_hours: float
+    now: datetime
+    topic_ids: np.ndarray        # (n,) int64, global topic ids
+    timestamps: np.ndarray       # (n,) unicode, ISO strings
+    text: str                    # title + " " + summary of every signal, concatenated
+    offsets: np.ndarray          # (n + 1,) int64, text[offsets[i]:offsets[i + 1]]
+    pair_topic_ids: np.ndarray   # (m,) int64, one (topic, source) pair per signal source
+    pair_source_ids: np.ndarray  # (m,) int64
+
+
+@dataclass
+class ShardAggregate:
+    """Per-topic partial aggregates returned by a worker."""
+    topic_ids: np.ndarray        # (t,) int64
+    counts: np.ndarray           # (t,) int64
+    recency_sums: np.ndarray     # (t,) float64
+    keyword_sums: np.ndarray     # (t,) float64
+    pair_topic_ids: np.ndarray   # distinct (topic, source) pairs, first appearance order
+    pair_source_ids: np.ndarray
+
+
+class ShardedSignalScorer(MarketSignalScorer):
+    """
+    Same scoring model and output as MarketSignalScorer.score (evaluated
+    at a single `now`), with keyword matching and recency spread over
+    worker processes.
+    """
+
+    def __init__(self, decay_hours=48, workers=None, min_signals_per_worker=20000):
+        """
+        Args:
+            decay_hours: Recency half-life scale, as MarketSignalScorer
+            workers: Worker processes (default: CPU count)
+            min_signals_per_worker: Fewer signals than this per worker are
+                scored in fewer processes (one means in-process)
+        """
+        super().__init__(decay_hours=decay_hours)
+        self.workers = workers or os.cpu_count() or 1
+        self.min_signals_per_worker = min_signals_per_worker
+
+    @classmethod
+    def from_config(cls) -> "ShardedSignalScorer":
+        """Build from the `scoring.parallel` section of config.yaml."""
+        settings = ConfigLoader().get("scoring.parallel", {}) or {}
+        return cls(
+            workers=settings.get("workers"),
+            min_signals_per_worker=settings.get("min_signals_per_worker", 20000)
+        )
+
+    # ---------- PUBLIC ----------
+    def score(self, signals):
+        """
+        signals: list of dicts
+        Each dict must contain: title, summary, source, timestamp
+        (merged duplicates may also carry a `sources` list)
+        """
+        return self._rank(signals)
+
+    def score_top_k(self, signals, k):
+        """Same result as score(signals)[:k]; only the top k topic dicts are built."""
+        if k <= 0:
+            return []
+        return self._rank(signals, k)
+
+    # ---------- CORE LOGIC ----------
+    def _rank(self, signals, k=None):
+        if not signals:
+            return []
+
+        shards = min(self.workers, max(len(signals) // self.min_signals_per_worker, 1))
+        topics, topic_ids, sources, parts = self._partition(signals, shards)
+        aggregates = parallel_map(_score_shard, parts, workers=shards)
+
+        n_topics = len(topics)
+        counts = np.zeros(n_topics, dtype=np.int64)
+        recency_sums = np.zeros(n_topics)
+        keyword_sums = np.zeros(n_topics)
+        topic_sources = [[] for _ in range(n_topics)]
+
+        for aggregate in aggregates:
+            counts[aggregate.topic_ids] = aggregate.counts
+            recency_sums[aggregate.topic_ids] = aggregate.recency_sums
+            keyword_sums[aggregate.topic_ids] = aggregate.keyword_sums
+            for t, s in zip(aggregate.pair_topic_ids.tolist(), aggregate.pair_source_ids.tolist()):
+                topic_sources[t].append(sources[s])
+
+        counts, recency_sums, keyword_sums = counts.tolist(), recency_sums.tolist(), keyword_sums.tolist()
+        distinct = [set(names) for names in topic_sources]  # same insertion order as _distinct_sources
+        rounded = [
+            round(self._combine(
+                math.log(counts[t] + 1),
+                recency_sums[t] / counts[t],
+                keyword_sums[t] / counts[t],
+                len(distinct[t])
+            ), 3)
+            for t in range(n_topics)
+        ]
+
+        order = sorted(range(n_topics), key=rounded.__getitem__, reverse=True)[:k]
+
+        members = np.argsort(topic_ids, kind="stable")
+        member_bounds = np.concatenate(([0], np.cumsum(counts)))
+        return [
+            {
+                "topic": topics[t],
+                **self._topic_fields(signals[members[member_bounds[t]]]),
+                "score": rounded[t],
+                "mentions": counts[t],
+                "sources": list(distinct[t]),
+                "signal_ids": members[member_bounds[t]:member_bounds[t + 1]].tolist()
+            }
+            for t in order
+        ]
+
+    def _partition(self, signals, shards):
+        """
+        Topic keys, per-signal topic ids, source names and one
+        SignalShard per worker. Topic and source ids follow first
+        appearance, as dict grouping does.
+        """
+        topic_index, source_index = {}, {}
+        topic_ids = np.fromiter(
+            (topic_index.setdefault(topic, len(topic_index)) for topic in map(self._topic_of, signals)),
+            dtype=np.int64,
+            count=len(signals)
+        )
+        topics = list(topic_index)
+
+        topic_shard = np.array([zlib.crc32(topic.encode("utf-8")) % shards for topic in topics], dtype=np.int64)
+        signal_shard = topic_shard[topic_ids]
+
+        pair_signals, pair_sources = [], []
+        for i, s in enumerate(signals):
+            for source in s.get("sources") or [s["source"]]:
+                pair_signals.append(i)
+                pair_sources.append(source_index.setdefault(source, len(source_index)))
+        pair_signals = np.array(pair_signals, dtype=np.int64)
+        pair_sources = np.array(pair_sources, dtype=np.int64)
+        pair_shard = signal_shard[pair_signals]
+
+        now = datetime.utcnow()
+        parts = []
+        for shard in range(shards):
+            members = np.flatnonzero(signal_shard == shard)
+            if not len(members):
+                continue
+
+            texts = [signals[i]["title"] + " " + signals[i]["summary"] for i in members.tolist()]
+            offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+            np.cumsum([len(t) for t in texts], out=offsets[1:])
+            in_shard = pair_shard == shard
+
+            parts.append(SignalShard(
+                decay_hours=self.decay_hours,
+                now=now,
+                topic_ids=topic_ids[members],
+                timestamps=np.array([signals[i]["timestamp"] for i in members.tolist()]),
+                text="".join(texts),
+                offsets=offsets,
+                pair_topic_ids=topic_ids[pair_signals[in_shard]],
+                pair_source_ids=pair_sources[in_shard]
+            ))
+
+        return topics, topic_ids, list(source_index), parts
+
+
+def _score_shard(shard: SignalShard) -> ShardAggregate:
+    """
+    Worker: per-topic counts, recency and keyword sums (summed in signal
+    order, exactly as MarketSignalScorer does) and distinct source pairs.
+    """
+    scorer = MarketSignalScorer(decay_hours=shard.decay_hours)
+    text, offsets = shard.text, shard.offsets.tolist()
+
+    recency, keyword = defaultdict(list), defaultdict(list)
+    for i, (t, timestamp) in enumerate(zip(shard.topic_ids.tolist(), shard.timestamps.tolist())):
+        recency[t].append(scorer._recency_weight(timestamp, now=shard.now))
+        keyword[t].append(scorer._keyword_strength(text[offsets[i]:offsets[i + 1]]))
+
+    pairs = dict.fromkeys(zip(shard.pair_topic_ids.tolist(), shard.pair_source_ids.tolist()))
+    pair_topics, pair_sources = zip(*pairs) if pairs else ((), ())
+
+    topics = list(recency)
+    return ShardAggregate(
+        topic_ids=np.array(topics, dtype=np.int64),
+        counts=np.array([len(recency[t]) for t in topics], dtype=np.int64),
+        recency_sums=np.array([sum(recency[t]) for t in topics], dtype=np.float64),
+        keyword_sums=np.array([sum(keyword[t]) for t in topics], dtype=np.float64),
+        pair_topic_ids=np.array(pair_topics, dtype=np.int64),
+        pair_source_ids=np.array(pair_sources, dtype=np.int64)
+    )
@@ -0,0 +1,168 @@
+# services/scoring_engine/streaming_scorer.py
+
+import math
+
+import numpy as np
+
+from services.scoring_engine.market_signal_scorer import MarketSignalScorer
+from services.scoring_engine.columnar_scorer import _to_epoch, utc_now_epoch
+
+REBASE_AFTER = 30  # decay time constants before the reference time moves
+
+
+class StreamingTrendScorer(MarketSignalScorer):
+    """
+    Stateful version of MarketSignalScorer: signals are ingested one at a
+    time and per-topic counters are updated in O(1). top_k() returns, at
+    any moment, what MarketSignalScorer.score would return for every
+    signal ingested so far (same model, same output format).
+
+    Recency is an exponentially-decayed counter. Every signal's weight is
+    stored relative to a shared reference time, so decaying all topics to
+    "now" is one multiplication at read time instead of a pass over the
+    signals. Topics with no signal for `expire_hours` are dropped.
+    """
+
+    def __init__(self, decay_hours=48, expire_hours=None, initial_capacity=1024):
+        super().__init__(decay_hours=decay_hours)
+        self.expire_hours = expire_hours if expire_hours is not None else 4 * decay_hours
+        self._tau = decay_hours * 3600
+        self._reference = utc_now_epoch()
+
+        self._slot_of = {}        # topic -> slot
+        self._topics = []         # slot -> topic (None when free)
+        self._fields = []         # slot -> {label[, topic_id]}
+        self._sources = []        # slot -> set of sources
+        self._free = []
+
+        self._mentions = np.zeros(initial_capacity, dtype=np.int64)
+        self._keyword_sum = np.zeros(initial_capacity, dtype=np.float64)
+        self._decayed = np.zeros(initial_capacity, dtype=np.float64)   # sum of exp((t - reference) / tau)
+        self._last_seen = np.zeros(initial_capacity, dtype=np.float64)
+        self._distinct = np.zeros(initial_capacity, dtype=np.int64)      # len(sources)
+        self._active = np.zeros(initial_capacity, dtype=bool)
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    # ---------- PUBLIC ----------
+    def ingest(self, signal):
+        """
+        signal: dict with title, summary, source, timestamp
+        (optionally `topic` from TopicClusterer and a merged `sources` list)
+        Returns the signal's topic.
+        """
+        topic = self._topic_of(signal)
+        slot = self._slot_of.get(topic)
+        if slot is None:
+            slot = self._new_slot(topic, signal)
+
+        epoch = _to_epoch(signal["timestamp"])
+        if epoch - self._reference > REBASE_AFTER * self._tau:
+            self._rebase(epoch)
+
+        self._mentions[slot] += 1
+        self._keyword_sum[slot] += self._keyword_strength(signal["title"] + " " + signal["summary"])
+        self._decayed[slot] += math.exp((epoch - self._reference) / self._tau)
+        self._last_seen[slot] = max(self._last_seen[slot], epoch)
+        self._sources[slot].update(signal.get("sources") or [signal["source"]])
+        self._distinct[slot] = len(self._sources[slot])
+
+        return topic
+
+    def ingest_many(self, signals):
+        for signal in signals:
+            self.ingest(signal)
+
+    def top_k(self, k=10, now=None):
+        """
+        Highest-scoring topics right now, best first, in the format of
+        MarketSignalScorer.score.
+        """
+        now = utc_now_epoch() if now is None else now
+        slots = np.flatnonzero(self._active)
+        if not len(slots) or k <= 0:
+            return []
+
+        scores = self._scores(slots, now)
+        if len(slots) > k:
+            # Keep everything that can still round into the top k, then rank exactly
+            kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+            keep = np.flatnonzero(scores >= kth - 0.001)
+            slots, scores = slots[keep], scores[keep]
+
+        rounded = [round(s, 3) for s in scores.tolist()]
+        order = sorted(range(len(slots)), key=lambda i: (-rounded[i], slots[i]))[:k]
+        return [
+            {
+                "topic": self._topics[slots[i]],
+                **self._fields[slots[i]],
+                "score": rounded[i],
+                "mentions": int(self._mentions[slots[i]]),
+                "sources": list(self._sources[slots[i]])
+            }
+            for i in order
+        ]
+
+    def expire(self, now=None):
+        """Drop topics not seen for `expire_hours`. Returns how many were dropped."""
+        now = utc_now_epoch() if now is None else now
+        cutoff = now - self.expire_hours * 3600
+
+        stale = [topic for topic, slot in self._slot_of.items() if self._last_seen[slot] < cutoff]
+        for topic in stale:
+            slot = self._slot_of.pop(topic)
+            self._topics[slot] = None
+            self._fields[slot] = None
+            self._sources[slot] = set()
+            self._mentions[slot] = 0
+            self._keyword_sum[slot] = 0.0
+            self._decayed[slot] = 0.0
+            self._last_seen[slot] = 0.0
+            self._distinct[slot] = 0
+            self._active[slot] = False
+            self._free.append(slot)
+
+        return len(stale)
+
+    # ---------- CORE LOGIC ----------
+    def _scores(self, slots, now):
+        mentions = self._mentions[slots]
+        decay = math.exp(-(now - self._reference) / self._tau)
+        return (
+            0.4 * np.log(mentions + 1) +
+            0.3 * (self._decayed[slots] * decay) / mentions +
+            0.2 * self._keyword_sum[slots] / mentions +
+            0.1 * self._distinct[slots]
+        )
+
+    # ---------- HELPERS ----------
+    def _new_slot(self, topic, signal):
+        if self._free:
+            slot = self._free.pop()
+            self._topics[slot] = topic
+            self._fields[slot] = self._topic_fields(signal)
+        else:
+            slot = len(self._topics)
+            if slot == len(self._mentions):
+                self._grow()
+            self._topics.append(topic)
+            self._fields.append(self._topic_fields(signal))
+            self._sources.append(set())
+
+        self._slot_of[topic] = slot
+        self._active[slot] = True
+        return slot
+
+    def _grow(self):
+        capacity = 2 * len(self._mentions)
+        for name in ("_mentions", "_keyword_sum", "_decayed", "_last_seen", "_distinct", "_active"):
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
+
+    def _rebase(self, epoch):
+        """Move the reference time forward so stored weights stay finite."""
+        self._decayed *= math.exp(-(epoch - self._reference) / self._tau)
+        self._reference = epoch
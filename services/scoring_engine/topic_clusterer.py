@@ -0,0 +1,261 @@
+# services/scoring_engine/topic_clusterer.py
+"""
+Embedding-based topic clustering.
+Titles+summaries are batch-encoded on CPU with sentence-transformers and
+assigned online to the nearest topic centroid (cosine similarity), or
+start a new topic below the threshold. Centroids, ids and labels persist
+between runs, so the same story keeps the same topic id and label.
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+
+from shared.config.config_loader import ConfigLoader
+from shared.utils.atomic_io import atomic_write
+
+
+class TopicClusterer:
+    """
+    Online centroid clustering over normalised sentence embeddings.
+    Signals are processed in batches of `batch_size`, so a run holds at
+    most one batch of embeddings plus the centroid store, which is kept
+    under `max_memory_mb` by evicting the least recently seen topics.
+    """
+
+    def __init__(
+        self,
+        model="sentence-transformers/all-MiniLM-L6-v2",
+        threshold=0.6,
+        batch_size=64,
+        max_chars=512,
+        max_memory_mb=256,
+        state_file="data/memory/topic_centroids.npz",
+        encoder=None
+    ):
+        """
+        Args:
+            model: sentence-transformers model name
+            threshold: Cosine similarity needed to join an existing topic
+            batch_size: Texts encoded (and held in memory) at a time
+            max_chars: Texts are truncated to this many characters
+            max_memory_mb: Cap on batch embeddings + centroid store
+            state_file: Where centroids, ids and labels persist
+            encoder: Optional callable(list[str]) -> 2-D array, replaces the model
+        """
+        self.model_name = model
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self.max_chars = max_chars
+        self.max_memory_mb = max_memory_mb
+        self.state_file = Path(state_file)
+        self._encoder = encoder
+
+        self.centroids = None                         # (k, dim) float32, unit norm
+        self.counts = np.zeros(0, dtype=np.int64)     # signals absorbed per topic
+        self.last_seen = np.zeros(0, dtype=np.float64)
+        self.topic_ids = np.zeros(0, dtype=np.int64)
+        self.labels = []
+        self.next_id = 0
+
+        self._load_state()
+
+    @classmethod
+    def from_config(cls, **overrides) -> "TopicClusterer":
+        """Build from the `scoring.clustering` section of config.yaml."""
+        config = dict(ConfigLoader().get("scoring.clustering", {}) or {})
+        config.pop("enabled", None)
+        config.update(overrides)
+        return cls(**config)
+
+    # ---------- PUBLIC ----------
+    def assign(self, signals):
+        """
+        signals: list of dicts with title, summary
+        Returns copies with `topic` (label) and `topic_id` set. Labels
+        are founding headlines and may repeat; `topic_id` identifies the
+        topic. The centroid store is saved afterwards.
+        """
+        assigned = []
+        now = time.time()
+
+        for start in range(0, len(signals), self.batch_size):
+            batch = signals[start:start + self.batch_size]
+            texts = [
+                f"{s.get('title', '')}. {s.get('summary', '')}"[:self.max_chars]
+                for s in batch
+            ]
+
+            for s, slot in zip(batch, self._assign_batch(self.encode(texts), batch, now)):
+                item = dict(s)
+                item["topic"] = self.labels[slot]
+                item["topic_id"] = int(self.topic_ids[slot])
+                assigned.append(item)
+
+            self._enforce_memory_cap()
+
+        self.save()
+        return assigned
+
+    def encode(self, texts):
+        """Unit-normalised float32 embeddings, one row per text."""
+        if self._encoder is not None:
+            return normalize_rows(self._encoder(texts))
+        return encode_texts(texts, self.model_name, self.batch_size)
+
+    def save(self):
+        """Persist the centroid store atomically."""
+        if self.centroids is None:
+            return
+
+        with atomic_write(self.state_file) as f:
+            np.savez(
+                f,
+                centroids=self.centroids,
+                counts=self.counts,
+                last_seen=self.last_seen,
+                topic_ids=self.topic_ids,
+                labels=np.array(self.labels, dtype=str),
+                next_id=np.array(self.next_id)
+            )
+
+    # ---------- CORE LOGIC ----------
+    def _assign_batch(self, vectors, batch, now):
+        """
+        Centroid slot for each vector. Vectors close enough to an existing
+        centroid join it; the rest are compared among themselves, in
+        order, and seed new topics.
+        """
+        existing = len(self.counts)
+        slots = np.full(len(vectors), -1, dtype=np.int64)
+
+        if existing:
+            sims = vectors @ self.centroids.T
+            best = sims.argmax(axis=1)
+            matched = sims[np.arange(len(vectors)), best] >= self.threshold
+            slots[matched] = best[matched]
+
+        # New topics within this batch: seed vectors, then their members
+        seeds, members = [], []
+        for i in np.flatnonzero(slots < 0):
+            if seeds:
+                sims = np.asarray(seeds) @ vectors[i]
+                best = int(sims.argmax())
+                if sims[best] >= self.threshold:
+                    slots[i] = existing + best
+                    members[best].append(i)
+                    continue
+            slots[i] = existing + len(seeds)
+            seeds.append(vectors[i])
+            members.append([i])
+
+        if seeds:
+            self._add_topics(
+                [vectors[m].mean(axis=0) for m in members],
+                [len(m) for m in members],
+                [batch[m[0]] for m in members],
+                now
+            )
+
+        joined = np.flatnonzero(slots < existing)
+        if len(joined):
+            self._update_centroids(slots[joined], vectors[joined], now)
+
+        return slots.tolist()
+
+    def _update_centroids(self, slots, vectors, now):
+        """Fold vectors into their centroids' running means."""
+        touched, inverse = np.unique(slots, return_inverse=True)
+        sums = np.zeros((len(touched), vectors.shape[1]), dtype=np.float32)
+        np.add.at(sums, inverse, vectors)
+        added = np.bincount(inverse, minlength=len(touched))
+
+        merged = self.centroids[touched] * self.counts[touched, None] + sums
+        self.centroids[touched] = merged / np.maximum(np.linalg.norm(merged, axis=1, keepdims=True), 1e-12)
+        self.counts[touched] += added
+        self.last_seen[touched] = now
+
+    def _add_topics(self, means, counts, founders, now):
+        means = np.asarray(means, dtype=np.float32)
+        means /= np.maximum(np.linalg.norm(means, axis=1, keepdims=True), 1e-12)
+
+        if self.centroids is None:
+            self.centroids = np.empty((0, means.shape[1]), dtype=np.float32)
+
+        new_ids = np.arange(self.next_id, self.next_id + len(means))
+        self.centroids = np.vstack([self.centroids, means])
+        self.counts = np.concatenate([self.counts, counts])
+        self.last_seen = np.concatenate([self.last_seen, np.full(len(means), now)])
+        self.topic_ids = np.concatenate([self.topic_ids, new_ids])
+        self.labels.extend(self._label(s) for s in founders)
+        self.next_id += len(means)
+
+    def _enforce_memory_cap(self):
+        """Evict least recently seen topics until the store fits the cap."""
+        if self.centroids is None:
+            return
+
+        dim = self.centroids.shape[1]
+        budget = self.max_memory_mb * 1024 * 1024 - self.batch_size * dim * 4
+        max_topics = max(int(budget // (dim * 4)), 1)
+        if len(self.counts) <= max_topics:
+            return
+
+        keep = np.sort(np.argsort(-self.last_seen, kind="stable")[:max_topics])
+        self.centroids = self.centroids[keep]
+        self.counts = self.counts[keep]
+        self.last_seen = self.last_seen[keep]
+        self.topic_ids = self.topic_ids[keep]
+        self.labels = [self.labels[i] for i in keep]
+
+    # ---------- HELPERS ----------
+    def _load_state(self):
+        if not self.state_file.exists():
+            return
+
+        with np.load(self.state_file) as state:
+            self.centroids = state["centroids"].astype(np.float32)
+            self.counts = state["counts"]
+            self.last_seen = state["last_seen"]
+            self.topic_ids = state["topic_ids"]
+            self.labels = state["labels"].tolist()
+            self.next_id = int(state["next_id"])
+
+    @staticmethod
+    def _label(signal):
+        """A topic is labelled once, by the headline that founded it."""
+        return " ".join(signal.get("title", "").split()).lower()
+
+
+# ---------- ENCODER ----------
+_MODELS = {}
+
+
+def load_sentence_model(model_name):
+    """CPU sentence-transformers model, loaded once per process."""
+    if model_name not in _MODELS:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError("sentence-transformers required for topic embeddings")
+
+        _MODELS[model_name] = SentenceTransformer(model_name, device="cpu")
+    return _MODELS[model_name]
+
+
+def encode_texts(texts, model_name, batch_size=64):
+    """Unit-normalised float32 embeddings, one row per text."""
+    vectors = load_sentence_model(model_name).encode(
+        list(texts),
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        show_progress_bar=False
+    )
+    return normalize_rows(vectors)
+
+
+def normalize_rows(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
@@ -0,0 +1,505 @@
+# services/scoring_engine/topic_index.py
+"""
+Persistent approximate nearest-neighbour index over topic embeddings.
+Used to resolve a reworded topic to its closest topic in trend memory.
+
+Layout (under `directory`):
+    vectors.<gen>.f32     float32 rows, memory-mapped; IVF-ordered, then an unindexed tail
+    topics.<gen>.jsonl    topic per row (a JSON string per line), append-only
+    centroids.<gen>.npy   IVF list centroids (nlist, dim)
+    offsets.<gen>.npy     IVF list boundaries in rows (nlist + 1)
+    meta.json             generation, dim, indexed row count (fixed size)
+
+Adding topics appends to the vector and topic files under a file lock;
+a row exists once both files hold it. A rebuild writes a new generation
+and then swaps meta.json, so readers never see lists that do not match
+the vector file. get_index() keeps one index per directory per process
+and only reads what other processes appended since.
+
+Queries score the `nprobe` closest IVF lists plus the tail, so latency
+grows with ~sqrt(n) rather than with the whole memory. A batch of
+queries reads each probed list once for all the queries that probe it.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from shared.config.config_loader import ConfigLoader
+from shared.utils.atomic_io import atomic_write, file_lock
+from services.scoring_engine.topic_clusterer import encode_texts, normalize_rows
+
+
+class TopicVectorIndex:
+    """
+    IVF (inverted file) index of unit-normalised topic embeddings.
+    New topics are appended to a brute-forced tail; the IVF lists are
+    rebuilt with k-means once the tail grows past `max_tail` rows.
+    """
+
+    def __init__(
+        self,
+        directory="data/memory/topic_index",
+        model="sentence-transformers/all-MiniLM-L6-v2",
+        nprobe=4,
+        max_tail=4096,
+        kmeans_iterations=10,
+        encoder=None
+    ):
+        """
+        Args:
+            directory: Where the index files live
+            model: sentence-transformers model used to embed topics
+            nprobe: IVF lists scanned per query
+            max_tail: Unindexed rows allowed before the lists are rebuilt
+            kmeans_iterations: Lloyd iterations per rebuild
+            encoder: Optional callable(list[str]) -> 2-D array, replaces the model
+        """
+        self.directory = Path(directory)
+        self.model_name = model
+        self.nprobe = nprobe
+        self.max_tail = max_tail
+        self.kmeans_iterations = kmeans_iterations
+        self._encoder = encoder
+
+        self.generation = 0
+        self.dim = None
+        self.topics = []
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.indexed = 0
+        self.centroids = None
+        self.vectors = None
+
+        self._row_of = {}
+        self._topics_end = 0  # bytes of the topic file already read
+        self._legacy_files = []
+        self._refresh()
+
+    @classmethod
+    def from_config(cls, directory: str = None) -> "TopicVectorIndex":
+        """Build from `scoring.topic_index` (model from `scoring.clustering`)."""
+        config = ConfigLoader()
+        return cls(
+            directory=directory or config.get("scoring.topic_index.dir", "data/memory/topic_index"),
+            model=config.get("scoring.clustering.model", "sentence-transformers/all-MiniLM-L6-v2"),
+            nprobe=config.get("scoring.topic_index.nprobe", 4),
+            max_tail=config.get("scoring.topic_index.max_tail", 4096)
+        )
+
+    def __len__(self):
+        return len(self.topics)
+
+    def __contains__(self, topic):
+        return topic in self._row_of
+
+    # ---------- PUBLIC ----------
+    def add(self, topics):
+        """Embed and append topics not yet in the index."""
+        new_topics = list(dict.fromkeys(t for t in topics if t not in self._row_of))
+        if not new_topics:
+            return 0
+
+        vectors = self.encode(new_topics)  # outside the lock: the slow part
+
+        with file_lock(self._lock_path):
+            self._refresh()
+            keep = [i for i, topic in enumerate(new_topics) if topic not in self._row_of]
+            if not keep:
+                return 0
+            new_topics = [new_topics[i] for i in keep]
+            vectors = vectors[keep]
+
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                self._save_meta()
+                self._remove_files(self._legacy_files)
+                self._legacy_files = []
+
+            self._append(new_topics, vectors)
+            if len(self.topics) - self.indexed > self.max_tail:
+                self._rebuild()
+            else:
+                self._map_vectors()
+
+        return len(new_topics)
+
+    def search(self, queries, k=1):
+        """
+        queries: (m, dim) unit-normalised vectors
+        Returns (similarities, rows), each (m, k), best first; missing
+        neighbours are -inf / -1.
+        """
+        queries = np.atleast_2d(queries)
+        sims_out = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        rows_out = np.full((len(queries), k), -1, dtype=np.int64)
+        if not self.topics:
+            return sims_out, rows_out
+
+        tail = (self.indexed, len(self.topics))
+        probes = None
+        if self.centroids is not None and len(self.centroids):
+            nprobe = min(self.nprobe, len(self.centroids))
+            probes = np.argpartition(-(queries @ self.centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+
+        # IVF lists are contiguous row ranges: score memory-mapped slices in place
+        segments = []
+        for q in range(len(queries)):
+            ranges = [tail] if probes is None else [tail] + [
+                (int(self.offsets[l]), int(self.offsets[l + 1])) for l in probes[q]
+            ]
+            segments.append([(start, end) for start, end in ranges if end > start])
+
+        if len(queries) == 1:
+            results = [self._score_segments(segments[0], queries[0], k)] if segments[0] else [None]
+        else:
+            results = self._score_batch(segments, queries, k)
+
+        for q, result in enumerate(results):
+            if result is not None:
+                sims, rows = result
+                sims_out[q, :len(rows)] = sims
+                rows_out[q, :len(rows)] = rows
+
+        return sims_out, rows_out
+
+    def nearest(self, topics, threshold, exclude_self=True, candidates=None, k=8):
+        """
+        Closest indexed topic for each topic, if similarity >= threshold.
+        With `candidates`, only topics in it can match: the best `k`
+        neighbours are searched, so rows that are no longer wanted don't
+        hide a valid match.
+        Returns {topic: (matched_topic, similarity)}; topics without a
+        match are left out.
+        """
+        topics = list(topics)
+        self._refresh()
+        if not topics or not self.topics:
+            return {}
+
+        if candidates is None:
+            k = 2 if exclude_self else 1
+        sims, rows = self.search(self.encode(topics), k=k)
+
+        matches = {}
+        for topic, topic_sims, topic_rows in zip(topics, sims, rows):
+            for sim, row in zip(topic_sims, topic_rows):
+                if row < 0 or sim < threshold:
+                    break
+                candidate = self.topics[row]
+                if (exclude_self and candidate == topic) or (candidates is not None and candidate not in candidates):
+                    continue
+                matches[topic] = (candidate, float(sim))
+                break
+
+        return matches
+
+    def encode(self, topics):
+        if self._encoder is not None:
+            return normalize_rows(self._encoder(list(topics)))
+        return encode_texts(topics, self.model_name)
+
+    def rebuild(self):
+        """Re-cluster all rows into IVF lists and rewrite the files."""
+        with file_lock(self._lock_path):
+            self._refresh()
+            self._rebuild()
+
+    def retain(self, topics):
+        """
+        Drop every topic not in `topics` (e.g. evicted from trend memory),
+        rewriting the index as a new generation. Returns the number dropped.
+        """
+        topics = topics if isinstance(topics, (set, frozenset, dict)) else set(topics)
+        with file_lock(self._lock_path):
+            self._refresh()
+            keep = [row for row, topic in enumerate(self.topics) if topic in topics]
+            dropped = len(self.topics) - len(keep)
+            if dropped:
+                self._rebuild(keep)
+        return dropped
+
+    # ---------- CORE LOGIC ----------
+    def _rebuild(self, keep=None):
+        """rebuild() with the lock held and the index up to date, over the `keep` rows (None = all)."""
+        vectors = np.array(self._all_vectors())
+        topics = self.topics
+        if keep is not None:
+            vectors, topics = vectors[keep], [topics[i] for i in keep]
+
+        centroids, offsets = None, np.zeros(1, dtype=np.int64)
+        if len(topics):
+            # Balances the centroid scan (nlist rows) against the probed lists (nprobe * n / nlist rows)
+            nlist = max(min(int(np.sqrt(len(vectors) * self.nprobe)), len(vectors)), 1)
+
+            centroids = self._kmeans(vectors, nlist)
+            assignment = self._assign(vectors, centroids)
+            order = np.argsort(assignment, kind="stable")
+            offsets = np.searchsorted(assignment[order], np.arange(nlist + 1))
+            vectors, topics = vectors[order], [topics[i] for i in order]
+
+        previous = self._generation_files()
+        self.generation += 1
+        self.topics = topics
+        self._row_of = {topic: row for row, topic in enumerate(self.topics)}
+        self.centroids = centroids
+        self.offsets = offsets.astype(np.int64)
+        self.indexed = len(self.topics)
+
+        encoded = _encode_topics(self.topics)
+        with atomic_write(self._vectors_path) as f:
+            f.write(vectors.tobytes())
+        with atomic_write(self._topics_path) as f:
+            f.write(encoded)
+        if centroids is not None:
+            with atomic_write(self._centroids_path) as f:
+                np.save(f, centroids)
+            with atomic_write(self._offsets_path) as f:
+                np.save(f, self.offsets)
+        self._topics_end = len(encoded)
+
+        self._save_meta()
+        self._map_vectors()
+        self._remove_files(previous)
+
+    def _score_segments(self, segments, query, k):
+        """Top-k (similarities, rows) of `query` over row ranges, best first."""
+        starts = np.array([start for start, _ in segments], dtype=np.int64)
+        lengths = np.array([end - start for start, end in segments], dtype=np.int64)
+        ends = np.cumsum(lengths)  # segment boundaries in the score buffer
+
+        # One output buffer; rows are only worked out for the k winners
+        sims = np.empty(ends[-1], dtype=np.float32)
+        position = 0
+        for (start, end), stop in zip(segments, ends):
+            np.matmul(self.vectors[start:end], query, out=sims[position:stop])
+            position = stop
+
+        top = _top_k(sims, k)
+        segment = np.searchsorted(ends, top, side="right")
+        rows = starts[segment] + top - (ends - lengths)[segment]
+        return sims[top], rows
+
+    def _score_batch(self, segments, queries, k):
+        """
+        search() for several queries: each row range is scored once, as
+        one matrix product against every query that probes it, so lists
+        shared by queries are read once per batch.
+        Returns (similarities, rows) per query (None without candidates).
+        """
+        members = {}
+        for q, ranges in enumerate(segments):
+            for segment in ranges:
+                members.setdefault(segment, []).append(q)
+
+        chunks = [[] for _ in queries]
+        for (start, end), qs in members.items():
+            block = self.vectors[start:end] @ queries[qs].T
+            rows = np.arange(start, end)
+            for column, q in enumerate(qs):
+                chunks[q].append((block[:, column], rows))
+
+        results = []
+        for parts in chunks:
+            if not parts:
+                results.append(None)
+                continue
+            sims = np.concatenate([part[0] for part in parts])
+            rows = np.concatenate([part[1] for part in parts])
+            top = _top_k(sims, k)
+            results.append((sims[top], rows[top]))
+        return results
+
+    def _kmeans(self, vectors, nlist, sample_per_list=64, seed=0):
+        """Spherical k-means on a sample of at most sample_per_list rows per list."""
+        rng = np.random.default_rng(seed)
+        sample_size = min(len(vectors), nlist * sample_per_list)
+        sample = vectors[rng.choice(len(vectors), sample_size, replace=False)]
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+
+        for _ in range(self.kmeans_iterations):
+            assignment = self._assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            empty = np.bincount(assignment, minlength=nlist) == 0
+            sums[empty] = centroids[empty]
+            centroids = normalize_rows(sums)
+
+        return centroids
+
+    @staticmethod
+    def _assign(vectors, centroids, chunk=16384):
+        """Nearest centroid per row, in chunks to bound the similarity matrix."""
+        return np.concatenate([
+            (vectors[i:i + chunk] @ centroids.T).argmax(axis=1)
+            for i in range(0, len(vectors), chunk)
+        ]) if len(vectors) else np.zeros(0, dtype=np.int64)
+
+    # ---------- HELPERS ----------
+    @property
+    def _vectors_path(self):
+        return self.directory / f"vectors.{self.generation}.f32"
+
+    @property
+    def _topics_path(self):
+        return self.directory / f"topics.{self.generation}.jsonl"
+
+    @property
+    def _centroids_path(self):
+        return self.directory / f"centroids.{self.generation}.npy"
+
+    @property
+    def _offsets_path(self):
+        return self.directory / f"offsets.{self.generation}.npy"
+
+    @property
+    def _meta_path(self):
+        return self.directory / "meta.json"
+
+    @property
+    def _lock_path(self):
+        return self.directory / "index"
+
+    def _generation_files(self):
+        return [self._vectors_path, self._topics_path, self._centroids_path, self._offsets_path]
+
+    def _all_vectors(self):
+        self._map_vectors()
+        return self.vectors if self.vectors is not None else np.zeros((0, self.dim or 0), dtype=np.float32)
+
+    def _map_vectors(self):
+        if not self.topics:
+            self.vectors = None
+            return
+        # Plain ndarray view of the mapping: slicing stays zero-copy without memmap overhead
+        self.vectors = np.asarray(np.memmap(
+            self._vectors_path, dtype=np.float32, mode="r",
+            shape=(len(self.topics), self.dim)
+        ))
+
+    def _load(self, meta):
+        self.generation = meta["generation"]
+        self.topics = []
+        self._row_of = {}
+        self._topics_end = 0
+        self.centroids = None
+        self.offsets = np.zeros(1, dtype=np.int64)
+
+        if "topics" in meta:
+            # Old layout (every topic in meta.json): start over in a new
+            # generation, refilled by the next add()
+            self._legacy_files = self._generation_files()
+            self.generation += 1
+            self.dim = None
+            self.indexed = 0
+            self.vectors = None
+            return
+
+        self.dim = meta["dim"]
+        self.indexed = meta["indexed"]
+        if self.indexed:
+            self.centroids = np.load(self._centroids_path)
+            self.offsets = np.load(self._offsets_path)
+
+        self._read_topics()
+
+    def _refresh(self, attempts=5):
+        """Catch up with rows other processes appended, or reload after their rebuild."""
+        for attempt in range(attempts):
+            meta = self._read_meta()
+            if meta is None:
+                return
+            try:
+                if meta["generation"] != self.generation or self.dim is None or "topics" in meta:
+                    self._load(meta)
+                else:
+                    self._read_topics()
+                return
+            except FileNotFoundError:
+                # Another process rebuilt the index between reading meta.json and the files
+                if attempt == attempts - 1:
+                    raise
+
+    def _read_meta(self):
+        try:
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _read_topics(self):
+        """Append the rows written since the last read: complete lines that have a vector."""
+        try:
+            with open(self._topics_path, "rb") as f:
+                f.seek(self._topics_end)
+                data = f.read()
+            vector_rows = os.path.getsize(self._vectors_path) // (self.dim * 4)
+        except FileNotFoundError:
+            if self.topics:
+                raise
+            data, vector_rows = b"", 0  # nothing appended yet
+
+        lines = data.split(b"\n")[:-1]  # the last piece is incomplete (or empty)
+        lines = lines[:max(vector_rows - len(self.topics), 0)]
+        if lines:
+            for topic in json.loads(b"[" + b",".join(lines) + b"]"):
+                self._row_of[topic] = len(self.topics)
+                self.topics.append(topic)
+            self._topics_end += sum(len(line) + 1 for line in lines)
+
+        self._map_vectors()
+
+    def _append(self, topics, vectors):
+        encoded = _encode_topics(topics)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Truncating first drops rows left behind by an interrupted write
+        with open(self._vectors_path, "ab") as f:
+            f.truncate(len(self.topics) * self.dim * 4)
+            f.write(vectors.astype(np.float32).tobytes())
+        with open(self._topics_path, "ab") as f:
+            f.truncate(self._topics_end)
+            f.write(encoded)
+
+        for topic in topics:
+            self._row_of[topic] = len(self.topics)
+            self.topics.append(topic)
+        self._topics_end += len(encoded)
+
+    def _save_meta(self):
+        meta = {"generation": self.generation, "dim": self.dim, "indexed": self.indexed}
+        with atomic_write(self._meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    @staticmethod
+    def _remove_files(paths):
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+
+def _encode_topics(topics):
+    return "".join(json.dumps(topic, ensure_ascii=False) + "\n" for topic in topics).encode("utf-8")
+
+
+def _top_k(sims, k):
+    """Positions of the k largest similarities, best first (stable on ties)."""
+    top = np.argpartition(-sims, k - 1)[:k] if len(sims) > k else np.arange(len(sims))
+    return top[np.argsort(-sims[top], kind="stable")]
+
+
+_INDEXES = {}
+
+
+def get_index(directory: str = None) -> TopicVectorIndex:
+    """
+    Shared TopicVectorIndex per directory (loaded once per process,
+    then kept up to date incrementally). Relative paths are resolved
+    against the current directory, as trend_store.get_store.
+    """
+    directory = os.path.abspath(
+        directory or ConfigLoader().get("scoring.topic_index.dir", "data/memory/topic_index")
+    )
+    key = (os.getpid(), directory)
+    if key not in _INDEXES:
+        _INDEXES[key] = TopicVectorIndex.from_config(directory)
+    return _INDEXES[key]
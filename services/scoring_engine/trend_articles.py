@@ -0,0 +1,105 @@
+# services/scoring_engine/trend_articles.py
+"""
+Trend -> member signals index.
+Built from the `signal_ids` the scorers attach to every trend, so the
+articles behind a trend are looked up in O(members) instead of matching
+topic strings against every signal. Saved with each run's artifacts.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from shared.utils.atomic_io import atomic_write
+
+INDEX_FILE = Path("data/processed/trend_index.json")
+
+# Signal fields kept in the persisted index
+SIGNAL_FIELDS = ("title", "summary", "link", "source", "sources", "timestamp")
+
+
+def signal_key(signal: Dict) -> str:
+    """Stable id of a signal across runs: its canonical link, else a title hash."""
+    link = signal.get("canonical_link") or signal.get("link")
+    if link:
+        return link
+    return "sha1:" + hashlib.sha1(
+        (signal.get("source", "") + "\n" + signal["title"]).encode("utf-8")
+    ).hexdigest()
+
+
+class TrendArticleIndex:
+    """
+    topic -> the signals the scorer grouped into it.
+    """
+
+    def __init__(self, signals: List[Dict], members: Dict[str, List[int]]):
+        """
+        Args:
+            signals: The scored signal list
+            members: {topic: positions in `signals`}
+        """
+        self.signals = signals
+        self.members = members
+
+    @classmethod
+    def from_trends(cls, signals: List[Dict], trends: List[Dict]) -> "TrendArticleIndex":
+        """Index scorer output (trend dicts carrying `signal_ids`)."""
+        return cls(signals, {trend["topic"]: list(trend["signal_ids"]) for trend in trends})
+
+    def __contains__(self, topic):
+        return topic in self.members
+
+    def __len__(self):
+        return len(self.members)
+
+    # ---------- PUBLIC ----------
+    def signals_for(self, topic: str) -> List[Dict]:
+        """Member signals of a topic, in signal order ([] if unknown)."""
+        return [self.signals[i] for i in self.members.get(topic, ())]
+
+    def articles(self, topic: str) -> List[str]:
+        """Summaries of a topic's member signals."""
+        return [signal["summary"] for signal in self.signals_for(topic)]
+
+    def save(self, path=INDEX_FILE) -> Path:
+        """
+        Persist as JSON: {created, topics: {topic: [signal keys]},
+        signals: {signal key: fields}}. Only member signals are stored.
+        """
+        keys = {}
+        topics = {}
+        for topic, ids in self.members.items():
+            topics[topic] = []
+            for i in ids:
+                if i not in keys:
+                    keys[i] = signal_key(self.signals[i])
+                topics[topic].append(keys[i])
+
+        record = {
+            "created": datetime.utcnow().isoformat(),
+            "topics": topics,
+            "signals": {
+                key: {field: self.signals[i][field] for field in SIGNAL_FIELDS if field in self.signals[i]}
+                for i, key in keys.items()
+            }
+        }
+
+        with atomic_write(path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, indent=2)
+
+        return Path(path)
+
+    @classmethod
+    def load(cls, path=INDEX_FILE) -> "TrendArticleIndex":
+        """Read an index saved by save(); signals come back as stored."""
+        with open(path, "r", encoding="utf-8") as f:
+            record = json.load(f)
+
+        position = {key: i for i, key in enumerate(record["signals"])}
+        return cls(
+            list(record["signals"].values()),
+            {topic: [position[key] for key in keys] for topic, keys in record["topics"].items()}
+        )
@@ -1,6 +1,11 @@
 # services/scoring_engine/trend_bias_engine.py
 
+from shared.config.config_loader import ConfigLoader
 from services.scoring_engine.trend_evolution import get_trend_evolution_status
+from services.scoring_engine.topic_index import get_index
+
+# Evolution map whose topics were last added to each topic index
+_indexed = {}
 
 
 def apply_trend_bias(trends, boost=0.15, penalty=0.2):
@@ -11,6 +16,7 @@ def apply_trend_bias(trends, boost=0.15, penalty=0.2):
     print("\n[SPRINT 5] Applying trend bias engine")
 
     evolution_map = get_trend_evolution_status()
+    matches = _match_historical_topics(trends, evolution_map)
     biased_trends = []
 
     for trend in trends:
@@ -18,6 +24,12 @@ def apply_trend_bias(trends, boost=0.15, penalty=0.2):
         score = trend["score"]
         status = evolution_map.get(name, "NEW")
 
+        if status == "NEW" and name in matches:
+            matched, similarity = matches[name]
+            status = evolution_map[matched]
+            trend["matched_topic"] = matched
+            print(f"[SPRINT 5] 🔗 '{name}' ≈ '{matched}' (sim={similarity:.2f})")
+
         original_score = score
 
         if status == "RISING":
@@ -37,3 +49,32 @@ def apply_trend_bias(trends, boost=0.15, penalty=0.2):
 
     biased_trends.sort(key=lambda x: x["score"], reverse=True)
     return biased_trends
+
+
+def _match_historical_topics(trends, evolution_map):
+    """
+    Resolve topics that are NEW by exact name to their nearest topic in
+    trend memory (embedding ANN index, scoring.topic_index in config).
+    Returns {topic: (matched_topic, similarity)}.
+    """
+    config = ConfigLoader()
+    if not config.get("scoring.topic_index.enabled", False):
+        return {}
+
+    new_topics = [t["topic"] for t in trends if evolution_map.get(t["topic"], "NEW") == "NEW"]
+    if not new_topics:
+        return {}
+
+    try:
+        index = get_index()
+        if _indexed.get(index.directory) is not evolution_map:  # unchanged cached map: already indexed
+            index.add(evolution_map)
+            _indexed[index.directory] = evolution_map
+        return index.nearest(
+            new_topics,
+            threshold=config.get("scoring.topic_index.threshold", 0.8),
+            candidates=evolution_map
+        )
+    except (ImportError, OSError) as e:
+        print(f"[WARN] Topic index unavailable ({e}), matching topics by name")
+        return {}
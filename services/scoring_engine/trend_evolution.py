@@ -1,63 +1,63 @@
 # services/scoring_engine/trend_evolution.py
 
-import json
-from datetime import datetime
-from pathlib import Path
+import os
+import time
+from datetime import datetime, timedelta
+from types import MappingProxyType
 
-MEMORY_DIR = Path("data/memory")
-TREND_MEMORY_FILE = MEMORY_DIR / "trend_memory.json"
+from shared.config.config_loader import ConfigLoader
+from services.scoring_engine.trend_store import get_store
+from services.scoring_engine.trend_series import TrendSeries
+from services.scoring_engine.topic_index import get_index
 
-MEMORY_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def _load_memory():
-    if not TREND_MEMORY_FILE.exists():
-        return {}
-    with open(TREND_MEMORY_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def _save_memory(memory):
-    with open(TREND_MEMORY_FILE, "w", encoding="utf-8") as f:
-        json.dump(memory, f, indent=2)
+# In-process cache of the evolution map, keyed by the versions of the
+# store and the series it is derived from
+_evolution_cache = {"version": None, "map": None}
+_cache_stats = {"hits": 0, "misses": 0}
 
 
 # ==================================================
 # SPRINT 4 — UPDATE MEMORY
 # ==================================================
 def update_trend_memory(trends):
-    memory = _load_memory()
+    """
+    Upsert only the detected topics (count += 1, last_seen = now) and
+    record their scores in the per-interval time series.
+    """
     now = datetime.utcnow().isoformat()
+    get_store().record_detections((trend["topic"] for trend in trends), now)
 
+    scores = {}
     for trend in trends:
-        topic = trend["topic"]
-
-        if topic not in memory:
-            memory[topic] = {
-                "count": 0,
-                "first_seen": now,
-                "last_seen": now
-            }
+        scores[trend["topic"]] = max(scores.get(trend["topic"], 0.0), float(trend.get("score", 0.0)))
 
-        memory[topic]["count"] += 1
-        memory[topic]["last_seen"] = now
-
-    _save_memory(memory)
+    with TrendSeries.locked(scores) as series:
+        series.record(scores)
+        _store_history(series)
 
 
 # ==================================================
 # ✅ SPRINT 5 — READ ALL EVOLUTION STATES
 # ==================================================
-def get_trend_evolution_status():
+def get_trend_evolution_status(use_cache=True):
     """
-    Returns:
+    Returns (read-only):
     {
         "openai agents": "RISING",
         "autonomous ai": "STABLE",
         ...
     }
+    The map is rebuilt only when trend memory changed (any process) or a
+    new series interval started; otherwise the cached map is returned.
     """
-    memory = _load_memory()
+    store = get_store()
+    version = (os.getpid(), store.db_path, store.version(), TrendSeries.version())
+    if use_cache and _evolution_cache["version"] == version:
+        _cache_stats["hits"] += 1
+        return _evolution_cache["map"]
+    _cache_stats["misses"] += 1
+
+    memory = store.evolution()
     evolution_map = {}
 
     for topic, meta in memory.items():
@@ -72,4 +72,83 @@ def get_trend_evolution_status():
 
         evolution_map[topic] = status
 
-    return evolution_map
\ No newline at end of file
+    # Topics with enough history are classified by score velocity instead
+    for topic, status in TrendSeries.from_config().classify().items():
+        if topic in evolution_map:
+            evolution_map[topic] = status
+
+    evolution_map = MappingProxyType(evolution_map)
+    _evolution_cache.update(version=version, map=evolution_map)
+    return evolution_map
+
+
+def get_evolution_cache_stats():
+    """{"hits", "misses", "hit_rate", "topics"} for the evolution map cache."""
+    lookups = _cache_stats["hits"] + _cache_stats["misses"]
+    cached = _evolution_cache["map"]
+    return {
+        **_cache_stats,
+        "hit_rate": round(_cache_stats["hits"] / lookups, 4) if lookups else 0.0,
+        "topics": len(cached) if cached is not None else 0
+    }
+
+
+# ==================================================
+# RETENTION / COMPACTION
+# ==================================================
+def compact_trend_memory(now=None):
+    """
+    Keep trend memory bounded (config: memory.retention):
+    - intervals leaving the per-topic series are rolled into coarse
+      per-period summaries (trend_history), and topics with an empty
+      window are dropped from the series
+    - topics not seen for max_age_days, then the least recently seen
+      beyond max_topics, are evicted everywhere, the topic index
+      (scoring.topic_index) included
+    - history older than history_days is pruned
+    Returns {"compacted": n, "evicted": n, "unindexed": n}.
+    """
+    config = ConfigLoader()
+    max_age_days = config.get("memory.retention.max_age_days", 90)
+    max_topics = config.get("memory.retention.max_topics", 50000)
+    history_days = config.get("memory.retention.history_days", 365)
+
+    now = time.time() if now is None else now
+    store = get_store()
+    cutoff = (datetime.utcfromtimestamp(now) - timedelta(days=max_age_days)).isoformat()
+
+    with TrendSeries.locked() as series:
+        compacted = series.compact(now)
+        _store_history(series)
+
+    evicted = store.evict(cutoff, max_topics)  # series rows included
+
+    # The index also drops topics evicted before it was last compacted
+    unindexed = 0
+    if config.get("scoring.topic_index.enabled", False):
+        try:
+            unindexed = get_index().retain(store.evolution())
+        except (ImportError, OSError) as e:
+            print(f"[WARN] Topic index not compacted ({e})")
+
+    store.prune_history(_period(now - history_days * 86400))
+    return {"compacted": len(compacted), "evicted": len(evicted), "unindexed": unindexed}
+
+
+def _store_history(series):
+    """Aggregate rolled-out interval scores into coarse periods."""
+    summaries = {}
+    for topic, interval, score in series.drain_rolled():
+        key = (topic, _period(interval * series.interval_seconds))
+        detections, max_score, total = summaries.get(key, (0, 0.0, 0.0))
+        summaries[key] = (detections + 1, max(max_score, score), total + score)
+
+    get_store().record_history(
+        (topic, period, detections, max_score, total)
+        for (topic, period), (detections, max_score, total) in summaries.items()
+    )
+
+
+def _period(epoch):
+    period_seconds = ConfigLoader().get("memory.retention.period_hours", 24) * 3600
+    return int(epoch // period_seconds)
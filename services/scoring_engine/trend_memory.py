@@ -1,21 +1,9 @@
 # services/scoring_engine/trend_memory.py
 
-import csv
 from datetime import datetime
-from pathlib import Path
 from typing import List, Dict
 
-# ---------------- PATHS ----------------
-MEMORY_DIR = Path("data/memory")
-MEMORY_FILE = MEMORY_DIR / "trend_memory.csv"
-
-FIELDS = [
-    "trend",
-    "first_seen",
-    "last_seen",
-    "frequency",
-    "avg_score"
-]
+from services.scoring_engine.trend_store import get_store
 
 
 # ---------------- INIT ----------------
@@ -23,12 +11,7 @@ def init_memory():
     """
     Initialize memory storage if not present.
     """
-    MEMORY_DIR.mkdir(parents=True, exist_ok=True)
-
-    if not MEMORY_FILE.exists():
-        with open(MEMORY_FILE, mode="w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=FIELDS)
-            writer.writeheader()
+    get_store()
 
 
 # ---------------- LOAD ----------------
@@ -36,20 +19,7 @@ def load_memory() -> Dict[str, Dict]:
     """
     Load memory into dict keyed by trend.
     """
-    init_memory()
-    memory = {}
-
-    with open(MEMORY_FILE, mode="r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            memory[row["trend"]] = {
-                "first_seen": row["first_seen"],
-                "last_seen": row["last_seen"],
-                "frequency": int(row["frequency"]),
-                "avg_score": float(row["avg_score"])
-            }
-
-    return memory
+    return get_store().memory()
 
 
 # ---------------- UPDATE ----------------
@@ -57,50 +27,13 @@ def update_memory(trends: List[Dict]):
     """
     Update memory using newly detected trends.
     trends = [{"trend": str, "score": float}]
+    Only the given trends are upserted (frequency += 1, running average).
     """
-    memory = load_memory()
     now = datetime.utcnow().isoformat()
-
-    for item in trends:
-        trend = item["trend"].lower().strip()
-        score = float(item["score"])
-
-        if trend in memory:
-            prev = memory[trend]
-            freq = prev["frequency"] + 1
-
-            # running average
-            new_avg = (
-                (prev["avg_score"] * prev["frequency"]) + score
-            ) / freq
-
-            memory[trend].update({
-                "last_seen": now,
-                "frequency": freq,
-                "avg_score": round(new_avg, 4)
-            })
-        else:
-            memory[trend] = {
-                "first_seen": now,
-                "last_seen": now,
-                "frequency": 1,
-                "avg_score": round(score, 4)
-            }
-
-    _save_memory(memory)
-
-
-# ---------------- SAVE ----------------
-def _save_memory(memory: Dict[str, Dict]):
-    with open(MEMORY_FILE, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=FIELDS)
-        writer.writeheader()
-
-        for trend, data in memory.items():
-            writer.writerow({
-                "trend": trend,
-                **data
-            })
+    get_store().record_scores(
+        ((item["trend"].lower().strip(), float(item["score"])) for item in trends),
+        now
+    )
 
 
 # ---------------- CLI TEST ----------------
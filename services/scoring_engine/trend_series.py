@@ -0,0 +1,319 @@
+# services/scoring_engine/trend_series.py
+"""
+Per-topic trend time series.
+Each topic keeps a fixed-size ring buffer of per-interval scores, held
+in memory as one row of a 2-D float32 array, so 100k topics x 12
+intervals is ~5 MB. Velocity and acceleration are least-squares slopes
+computed for all topics at once, and classify them as RISING / STABLE /
+FALLING. Rows persist in the trend_series table of the TrendStore; a
+save upserts only the topics that changed. Writers go through
+TrendSeries.locked() so concurrent pipeline processes merge their
+intervals instead of overwriting each other's rows.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from shared.config.config_loader import ConfigLoader
+from services.scoring_engine.trend_store import TrendStore, get_store
+
+DEFAULT_INTERVAL_HOURS = 6
+
+
+class TrendSeries:
+    """
+    Ring buffers of the last `window` intervals per topic. A topic's
+    interval score is the highest score it was detected with in that
+    interval; intervals without a detection count as 0.
+    """
+
+    def __init__(
+        self,
+        store: TrendStore = None,
+        window=12,
+        interval_hours=DEFAULT_INTERVAL_HOURS,
+        min_points=3,
+        rise_threshold=0.05,
+        fall_threshold=0.05,
+        initial_capacity=1024,
+        topics: Iterable[str] = None
+    ):
+        """
+        Args:
+            store: TrendStore the buffers persist in (default: get_store())
+            window: Intervals kept per topic
+            interval_hours: Length of one interval
+            min_points: Intervals with a detection needed before a topic is classified
+            rise_threshold: Relative slope (fraction of the mean per interval) for RISING
+            fall_threshold: Relative slope for FALLING
+            topics: Load only these topics (None = all); enough for record()
+        """
+        self.store = store or get_store()
+        self.window = window
+        self.interval_seconds = interval_hours * 3600
+        self.min_points = min_points
+        self.rise_threshold = rise_threshold
+        self.fall_threshold = fall_threshold
+
+        self.topics = []
+        self._row_of = {}
+        self.values = np.zeros((initial_capacity, window), dtype=np.float32)
+        self.last_interval = np.zeros(initial_capacity, dtype=np.int64)
+        self.first_interval = np.zeros(initial_capacity, dtype=np.int64)
+        self._rolled = []
+        self._dirty = set()    # topics to upsert on save()
+        self._removed = set()  # topics to delete on save()
+
+        self._load(topics)
+
+    @classmethod
+    def from_config(cls, topics: Iterable[str] = None) -> "TrendSeries":
+        """Build from the `memory.series` section of config.yaml."""
+        settings = ConfigLoader().get("memory.series", {}) or {}
+        return cls(topics=topics, **settings)
+
+    @classmethod
+    @contextmanager
+    def locked(cls, topics: Iterable[str] = None):
+        """
+        Read-modify-write in one store transaction (which holds the
+        database write lock): load from config, yield the series, save
+        it before the transaction commits. Pass the topics about to be
+        recorded to load only those.
+        """
+        store = get_store()
+        with store.transaction():
+            series = cls.from_config(topics)
+            yield series
+            series.save()
+
+    @staticmethod
+    def version(now: float = None):
+        """
+        Token that changes when a new interval starts. Together with
+        TrendStore.version() (which covers the saved rows) it tells when
+        classify() can change, without loading the series.
+        """
+        settings = ConfigLoader().get("memory.series", {}) or {}
+        interval_seconds = settings.get("interval_hours", DEFAULT_INTERVAL_HOURS) * 3600
+        now = time.time() if now is None else now
+        return int(now // interval_seconds)
+
+    def __len__(self):
+        return len(self.topics)
+
+    # ---------- PUBLIC ----------
+    def record(self, scores: Dict[str, float], now: float = None):
+        """Record {topic: score} for the interval containing `now` (epoch seconds)."""
+        if not scores:
+            return
+
+        interval = self._interval(now)
+        rows = np.array([self._row(topic, interval) for topic in scores], dtype=np.int64)
+        values = np.array(list(scores.values()), dtype=np.float32)
+
+        self._advance(rows, interval)
+        slot = interval % self.window
+        self.values[rows, slot] = np.maximum(self.values[rows, slot], values)
+        self._dirty.update(scores)
+
+    def compact(self, now: float = None):
+        """
+        Move every topic's window up to `now` (older intervals go to
+        `rolled`), then drop topics with nothing left in their window.
+        Returns the dropped topics.
+        """
+        n = len(self.topics)
+        self._advance(np.arange(n), self._interval(now))
+
+        empty = np.flatnonzero(~self.values[:n].any(axis=1))
+        dropped = [self.topics[i] for i in empty]
+        self.remove(dropped)
+        return dropped
+
+    def drain_rolled(self) -> List[Tuple[str, int, float]]:
+        """(topic, interval, score) for every detection that left a window since the last call."""
+        rolled, self._rolled = self._rolled, []
+        return rolled
+
+    def remove(self, topics: Iterable[str]):
+        """Forget topics."""
+        topics = set(topics)
+        self._removed |= topics
+        self._dirty -= topics
+
+        drop = {self._row_of[t] for t in topics if t in self._row_of}
+        if not drop:
+            return
+
+        keep = np.array([i for i in range(len(self.topics)) if i not in drop], dtype=np.int64)
+        n = len(keep)
+
+        self.values[:n] = self.values[keep]
+        self.last_interval[:n] = self.last_interval[keep]
+        self.first_interval[:n] = self.first_interval[keep]
+        self.topics = [self.topics[i] for i in keep]
+        self._row_of = {topic: row for row, topic in enumerate(self.topics)}
+
+    def series(self, now: float = None):
+        """
+        (scores, observed): (topics, window) arrays, oldest interval first,
+        ending at `now`. `observed` is False for intervals before the
+        topic was first detected; later intervals without a detection
+        are observed zeros.
+        """
+        n = len(self.topics)
+        current = self._interval(now)
+        intervals = current - (self.window - 1) + np.arange(self.window)
+        positions = intervals % self.window
+
+        recorded = intervals[None, :] <= self.last_interval[:n, None]
+        scores = np.where(recorded, self.values[:n][:, positions], 0)
+        observed = intervals[None, :] >= self.first_interval[:n, None]
+        return scores, observed
+
+    def dynamics(self, now: float = None):
+        """
+        Per topic: (velocity, acceleration, points).
+        velocity: least-squares slope over the observed intervals, as a
+        fraction of the topic's mean score per interval.
+        acceleration: slope over the most recent half of the window minus
+        the overall slope (same units).
+        points: intervals with a detection.
+        """
+        scores, observed = self.series(now)
+        scores = scores.astype(np.float64)
+
+        level = np.maximum(
+            (scores * observed).sum(axis=1) / np.maximum(observed.sum(axis=1), 1), 1e-9
+        )
+        recent = observed & (np.arange(self.window) >= self.window // 2)[None, :]
+
+        velocity = _masked_slope(scores, observed) / level
+        acceleration = _masked_slope(scores, recent) / level - velocity
+        return velocity, acceleration, np.count_nonzero(scores, axis=1)
+
+    def classify(self, now: float = None) -> Dict[str, str]:
+        """
+        {topic: RISING | STABLE | FALLING} for topics with at least
+        `min_points` detections in the window.
+        """
+        velocity, acceleration, points = self.dynamics(now)
+
+        status = np.full(len(self.topics), "STABLE", dtype=object)
+        status[(velocity >= self.rise_threshold) | ((velocity > 0) & (acceleration >= self.rise_threshold))] = "RISING"
+        status[velocity <= -self.fall_threshold] = "FALLING"
+
+        ready = np.flatnonzero(points >= self.min_points)
+        return {self.topics[i]: status[i] for i in ready}
+
+    def save(self):
+        """Upsert the topics changed since loading and delete the removed ones, in one transaction."""
+        rows = [self._row_of[topic] for topic in self._dirty]
+        self.store.write_series(
+            (
+                (self.topics[row], self.values[row].tobytes(), int(self.first_interval[row]),
+                 int(self.last_interval[row]), self.interval_seconds)
+                for row in rows
+            ),
+            self._removed
+        )
+        self._dirty, self._removed = set(), set()
+
+    # ---------- HELPERS ----------
+    def _interval(self, now):
+        now = time.time() if now is None else now
+        return int(now // self.interval_seconds)
+
+    def _advance(self, rows, interval):
+        """
+        Move the windows of `rows` forward to end at `interval`. Scores in
+        slots that leave the window are appended to `_rolled`.
+        """
+        last = self.last_interval[rows]
+        gap = np.minimum(np.maximum(interval - last, 0), self.window)
+        if not gap.any():
+            return
+
+        offsets = (interval - np.arange(self.window)) % self.window
+        leaving = offsets[None, :] < gap[:, None]
+        block = self.values[rows]
+
+        r, c = np.nonzero(leaving & (block > 0))
+        if len(r):
+            # Interval each slot held before the move
+            held = last[r] - (last[r] - c) % self.window
+            self._rolled.extend(zip(
+                (self.topics[row] for row in rows[r].tolist()),
+                held.tolist(),
+                block[r, c].tolist()
+            ))
+
+        block[leaving] = 0
+        self.values[rows] = block
+        self.last_interval[rows] = np.maximum(last, interval)
+        self._dirty.update(self.topics[row] for row in rows[gap > 0].tolist())
+
+    def _row(self, topic, interval):
+        row = self._row_of.get(topic)
+        if row is not None:
+            return row
+
+        row = len(self.topics)
+        if row == len(self.last_interval):
+            self._grow()
+
+        self.topics.append(topic)
+        self._row_of[topic] = row
+        self.values[row] = 0
+        self.last_interval[row] = interval - self.window
+        self.first_interval[row] = interval
+        return row
+
+    def _grow(self):
+        capacity = 2 * len(self.last_interval)
+        values = np.zeros((capacity, self.window), dtype=np.float32)
+        values[:len(self.values)] = self.values
+        self.values = values
+        for name in ("last_interval", "first_interval"):
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=np.int64)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
+
+    def _load(self, topics):
+        rows = self.store.series(topics)
+        valid = [
+            row for row in rows
+            if len(row[1]) == self.window * 4 and row[4] == self.interval_seconds
+        ]
+        if len(valid) < len(rows):
+            print(f"[WARN] {len(rows) - len(valid)} trend series were written with another "
+                  f"window/interval, starting fresh")
+        if not valid:
+            return
+
+        n = len(valid)
+        while len(self.last_interval) < n:
+            self._grow()
+
+        self.topics = [row[0] for row in valid]
+        self._row_of = {topic: row for row, topic in enumerate(self.topics)}
+        self.values[:n] = np.frombuffer(b"".join(row[1] for row in valid), dtype=np.float32).reshape(n, self.window)
+        self.first_interval[:n] = [row[2] for row in valid]
+        self.last_interval[:n] = [row[3] for row in valid]
+
+
+def _masked_slope(y, mask):
+    """Row-wise least-squares slope of y against interval index, over masked points."""
+    x = np.arange(y.shape[1], dtype=np.float64)
+    w = mask.astype(np.float64)
+
+    sw, sx, sy = w.sum(axis=1), w @ x, (w * y).sum(axis=1)
+    sxx, sxy = w @ (x * x), (w * y) @ x
+
+    denominator = sw * sxx - sx * sx
+    return np.where(denominator > 0, (sw * sxy - sx * sy) / np.where(denominator > 0, denominator, 1), 0.0)
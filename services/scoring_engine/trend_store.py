@@ -0,0 +1,352 @@
+# services/scoring_engine/trend_store.py
+"""
+Trend memory store (SQLite, WAL mode).
+Single indexed database behind trend_evolution (per-topic detection
+counts), trend_memory (per-trend frequency and running average score),
+trend_series (per-topic ring buffers of interval scores, see
+TrendSeries) and trend_history (coarse per-period summaries compacted
+from the series). Updates are upserts of the changed topics only;
+retention deletes by last_seen through its index. Every write is one
+BEGIN IMMEDIATE transaction, so concurrent processes serialise on the
+database lock and merge their increments; synchronous=FULL makes a
+committed update survive a crash or power loss.
+"""
+
+import csv
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from shared.config.config_loader import ConfigLoader
+
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trend_evolution (
+    topic      TEXT PRIMARY KEY,
+    count      INTEGER NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trend_memory (
+    trend      TEXT PRIMARY KEY,
+    first_seen TEXT NOT NULL,
+    last_seen  TEXT NOT NULL,
+    frequency  INTEGER NOT NULL,
+    avg_score  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trend_series (
+    topic            TEXT PRIMARY KEY,
+    scores           BLOB NOT NULL,
+    first_interval   INTEGER NOT NULL,
+    last_interval    INTEGER NOT NULL,
+    interval_seconds INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trend_history (
+    topic       TEXT NOT NULL,
+    period      INTEGER NOT NULL,
+    detections  INTEGER NOT NULL,
+    max_score   REAL NOT NULL,
+    total_score REAL NOT NULL,
+    PRIMARY KEY (topic, period)
+);
+CREATE INDEX IF NOT EXISTS idx_trend_evolution_last_seen ON trend_evolution (last_seen);
+CREATE INDEX IF NOT EXISTS idx_trend_memory_last_seen ON trend_memory (last_seen);
+CREATE INDEX IF NOT EXISTS idx_trend_history_period ON trend_history (period);
+"""
+
+# Legacy files imported once when the database is created
+LEGACY_EVOLUTION_FILE = Path("data/memory/trend_memory.json")
+LEGACY_MEMORY_FILE = Path("data/memory/trend_memory.csv")
+LEGACY_SERIES_FILE = Path("data/memory/trend_series.npz")
+
+
+class TrendStore:
+    """
+    Data-access object for trend memory.
+    """
+
+    def __init__(self, db_path: str = "data/memory/trend_memory.db"):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._commits = 0  # transactions committed through this connection
+        self._conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._migrate()
+
+    def close(self):
+        self._conn.close()
+
+    def version(self) -> Tuple[int, int]:
+        """
+        Changes whenever the database changes: data_version moves on
+        commits by other connections (other processes), the counter on
+        this connection's own commits.
+        """
+        return self._conn.execute("PRAGMA data_version").fetchone()[0], self._commits
+
+    @contextmanager
+    def transaction(self):
+        """
+        BEGIN IMMEDIATE ... COMMIT, rolled back on error. Holds the
+        database write lock throughout; writes made inside it (nested
+        calls included) commit together.
+        """
+        if self._conn.in_transaction:
+            yield self._conn
+            return
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        self._commits += 1
+
+    # ---------- EVOLUTION ----------
+    def record_detections(self, topics: Iterable[str], now: str):
+        """count += 1 and last_seen = now for each topic (inserted if new)."""
+        self._write(
+            """
+            INSERT INTO trend_evolution (topic, count, first_seen, last_seen)
+            VALUES (?, 1, ?, ?)
+            ON CONFLICT (topic) DO UPDATE SET
+                count = count + 1,
+                last_seen = excluded.last_seen
+            """,
+            [(topic, now, now) for topic in topics]
+        )
+
+    def evolution(self) -> Dict[str, Dict]:
+        """{topic: {count, first_seen, last_seen}}"""
+        rows = self._conn.execute("SELECT topic, count, first_seen, last_seen FROM trend_evolution")
+        return {
+            topic: {"count": count, "first_seen": first_seen, "last_seen": last_seen}
+            for topic, count, first_seen, last_seen in rows
+        }
+
+    # ---------- MEMORY ----------
+    def record_scores(self, scores: Iterable[Tuple[str, float]], now: str):
+        """frequency += 1 and running average update for each (trend, score)."""
+        self._write(
+            """
+            INSERT INTO trend_memory (trend, first_seen, last_seen, frequency, avg_score)
+            VALUES (?, ?, ?, 1, round(?, 4))
+            ON CONFLICT (trend) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                frequency = frequency + 1,
+                avg_score = round((avg_score * frequency + ?) / (frequency + 1), 4)
+            """,
+            [(trend, now, now, score, score) for trend, score in scores]
+        )
+
+    def memory(self) -> Dict[str, Dict]:
+        """{trend: {first_seen, last_seen, frequency, avg_score}}"""
+        rows = self._conn.execute(
+            "SELECT trend, first_seen, last_seen, frequency, avg_score FROM trend_memory"
+        )
+        return {
+            trend: {
+                "first_seen": first_seen,
+                "last_seen": last_seen,
+                "frequency": frequency,
+                "avg_score": avg_score
+            }
+            for trend, first_seen, last_seen, frequency, avg_score in rows
+        }
+
+    # ---------- SERIES ----------
+    def series(self, topics: Iterable[str] = None) -> List[Tuple[str, bytes, int, int, int]]:
+        """
+        (topic, scores, first_interval, last_interval, interval_seconds)
+        rows for `topics` (None = every topic). `scores` is the float32
+        ring buffer.
+        """
+        columns = "SELECT topic, scores, first_interval, last_interval, interval_seconds FROM trend_series"
+        if topics is None:
+            return self._conn.execute(columns).fetchall()
+
+        topics = list(topics)
+        rows = []
+        for i in range(0, len(topics), 500):  # stay under SQLite's bound-parameter limit
+            chunk = topics[i:i + 500]
+            rows += self._conn.execute(
+                f"{columns} WHERE topic IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+        return rows
+
+    def write_series(self, rows: Iterable[Tuple[str, bytes, int, int, int]], removed: Iterable[str] = ()):
+        """Upsert series rows (as series() returns them) and delete `removed` topics."""
+        rows, removed = list(rows), [(topic,) for topic in removed]
+        if not rows and not removed:
+            return
+        with self.transaction():
+            self._conn.executemany("INSERT OR REPLACE INTO trend_series VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.executemany("DELETE FROM trend_series WHERE topic = ?", removed)
+
+    # ---------- HISTORY ----------
+    def record_history(self, summaries: Iterable[Tuple[str, int, int, float, float]]):
+        """Merge (topic, period, detections, max_score, total_score) summaries."""
+        self._write(
+            """
+            INSERT INTO trend_history (topic, period, detections, max_score, total_score)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (topic, period) DO UPDATE SET
+                detections = detections + excluded.detections,
+                max_score = max(max_score, excluded.max_score),
+                total_score = total_score + excluded.total_score
+            """,
+            list(summaries)
+        )
+
+    def history(self, topic: str) -> List[Dict]:
+        rows = self._conn.execute(
+            "SELECT period, detections, max_score, total_score FROM trend_history "
+            "WHERE topic = ? ORDER BY period",
+            (topic,)
+        )
+        return [
+            {"period": period, "detections": detections, "max_score": max_score, "total_score": total_score}
+            for period, detections, max_score, total_score in rows
+        ]
+
+    # ---------- RETENTION ----------
+    def evict(self, cutoff: str, max_topics: int = 0) -> List[str]:
+        """
+        Delete topics whose last_seen is before `cutoff` (ISO timestamp),
+        then the least recently seen beyond `max_topics` (0 = no cap), from
+        every table. Returns the evicted trend_evolution topics.
+        """
+        with self.transaction():
+            evicted = self._evict_table("trend_evolution", "topic", cutoff, max_topics)
+            for table in ("trend_series", "trend_history"):
+                self._conn.executemany(f"DELETE FROM {table} WHERE topic = ?", [(t,) for t in evicted])
+            self._evict_table("trend_memory", "trend", cutoff, max_topics)
+
+        self._reclaim_space()
+        return evicted
+
+    def prune_history(self, min_period: int):
+        """Drop history summaries older than `min_period`."""
+        with self.transaction():
+            self._conn.execute("DELETE FROM trend_history WHERE period < ?", (min_period,))
+
+    # ---------- HELPERS ----------
+    def _evict_table(self, table, key, cutoff, max_topics):
+        stale = [
+            row[0] for row in
+            self._conn.execute(f"SELECT {key} FROM {table} WHERE last_seen < ?", (cutoff,))
+        ]
+        if max_topics:
+            stale += [
+                row[0] for row in
+                self._conn.execute(
+                    f"SELECT {key} FROM {table} WHERE last_seen >= ? "
+                    f"ORDER BY last_seen DESC LIMIT -1 OFFSET ?",
+                    (cutoff, max_topics)
+                )
+            ]
+
+        self._conn.executemany(f"DELETE FROM {table} WHERE {key} = ?", [(k,) for k in stale])
+        return stale
+
+    def _reclaim_space(self):
+        """VACUUM once a quarter of the file is free pages, then truncate the WAL."""
+        if self._conn.in_transaction:  # inside an outer transaction(): left to a later call
+            return
+        pages = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        free = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if pages and free * 4 >= pages:
+            self._conn.execute("VACUUM")
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _write(self, sql: str, rows: List[tuple]):
+        if not rows:
+            return
+        with self.transaction():
+            self._conn.executemany(sql, rows)
+
+    def _migrate(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        with self.transaction():
+            # Another process may have migrated while we waited for the lock
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+            for statement in SCHEMA.split(";"):
+                if statement.strip():
+                    self._conn.execute(statement)
+            if version == 0:
+                self._import_legacy()
+            if version < 3:
+                self._import_legacy_series()
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _import_legacy(self):
+        """Copy the old JSON / CSV memory files into the database."""
+        if LEGACY_EVOLUTION_FILE.exists():
+            with open(LEGACY_EVOLUTION_FILE, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO trend_evolution VALUES (?, ?, ?, ?)",
+                [
+                    (topic, meta.get("count", 0), meta.get("first_seen", ""), meta.get("last_seen", ""))
+                    for topic, meta in legacy.items()
+                ]
+            )
+
+        if LEGACY_MEMORY_FILE.exists():
+            with open(LEGACY_MEMORY_FILE, "r", encoding="utf-8") as f:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO trend_memory VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (row["trend"], row["first_seen"], row["last_seen"], int(row["frequency"]), float(row["avg_score"]))
+                        for row in csv.DictReader(f)
+                    ]
+                )
+
+    def _import_legacy_series(self):
+        """Copy the old trend_series.npz ring buffers into the database."""
+        if not LEGACY_SERIES_FILE.exists():
+            return
+
+        with np.load(LEGACY_SERIES_FILE) as state:
+            interval_seconds = int(state["interval_seconds"])
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO trend_series VALUES (?, ?, ?, ?, ?)",
+                [
+                    (topic, values.astype(np.float32).tobytes(), int(first), int(last), interval_seconds)
+                    for topic, values, first, last in zip(
+                        state["topics"].tolist(), state["values"],
+                        state["first_interval"], state["last_interval"]
+                    )
+                ]
+            )
+
+
+_STORES = {}
+
+
+def get_store(db_path: str = None) -> TrendStore:
+    """
+    Shared TrendStore per database file (one connection per process).
+    Relative paths are resolved against the current directory, so a
+    process that changes directory gets the database found there.
+    """
+    db_path = os.path.abspath(db_path or ConfigLoader().get("memory.db", "data/memory/trend_memory.db"))
+    key = (os.getpid(), db_path)
+    if key not in _STORES:
+        _STORES[key] = TrendStore(db_path)
+    return _STORES[key]
@@ -4,9 +4,11 @@ Handles fetching and processing news from various sources.
 """
 
 from services.scraper.news_scraper import scrape_news, scrape_article
+from services.scraper.fast_extractor import extract_article
 
 __all__ = [
     'scrape_news',
     'scrape_article',
+    'extract_article',
 ]
 
@@ -0,0 +1,160 @@
+# services/scraper/fast_extractor.py
+"""
+Lightweight article extraction.
+Readability-style heuristics over a single lxml parse: only the title and
+main text are recovered, which is all the pipeline uses from newspaper3k.
+Intended for known, well-structured sources configured in config.yaml.
+"""
+
+import re
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from shared.utils.http_fetch import fetch_url
+
+
+# ---------------- CONFIG ----------------
+MIN_PARAGRAPH_CHARS = 25
+
+NOISE_TAGS = (
+    "script", "style", "noscript", "iframe", "svg", "form",
+    "nav", "header", "footer", "aside", "button",
+)
+
+POSITIVE_HINTS = re.compile(
+    r"article|body|content|entry|main|post|story|text", re.IGNORECASE
+)
+NEGATIVE_HINTS = re.compile(
+    r"comment|footer|masthead|menu|nav|promo|related|share|sidebar|social|"
+    r"sponsor|subscribe|widget|newsletter|advert",
+    re.IGNORECASE
+)
+
+WHITESPACE = re.compile(r"\s+")
+
+
+# ---------------- FETCH ----------------
+def fetch_html(url: str, archive=None) -> str:
+    """
+    Download a page and return its decoded HTML.
+    archive: optional ResponseArchive to record to / replay from.
+    """
+    result = fetch_url(url, archive=archive)
+    if not result.ok:
+        raise RuntimeError(result.error or f"HTTP {result.status}")
+    return result.text()
+
+
+# ---------------- EXTRACT ----------------
+def extract_article(html: str) -> dict | None:
+    """
+    Extract {"title", "text"} from raw HTML.
+    Returns None when no usable body text is found.
+    """
+    if not html or not html.strip():
+        return None
+
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+    title = _extract_title(tree)
+
+    etree.strip_elements(tree, *NOISE_TAGS, with_tail=False)
+
+    container = _best_container(tree)
+    if container is None:
+        return None
+
+    paragraphs = [
+        text for text in (
+            _clean(p.text_content()) for p in container.iter("p")
+            if not _inside_noise(p, container)
+        )
+        if len(text) >= MIN_PARAGRAPH_CHARS
+    ]
+
+    if not paragraphs:
+        return None
+
+    return {
+        "title": title,
+        "text": "\n\n".join(paragraphs)
+    }
+
+
+# ---------------- HELPERS ----------------
+def _extract_title(tree) -> str:
+    for xpath in (
+        "//meta[@property='og:title']/@content",
+        "//meta[@name='twitter:title']/@content",
+        "//h1",
+        "//title",
+    ):
+        found = tree.xpath(xpath)
+        if found:
+            node = found[0]
+            text = node if isinstance(node, str) else node.text_content()
+            text = _clean(text)
+            if text:
+                return text
+    return ""
+
+
+def _best_container(tree):
+    """
+    Score each paragraph's parent (and, at half weight, grandparent)
+    by the amount of text it holds, then pick the highest scorer.
+    """
+    scores = {}
+
+    for p in tree.iter("p"):
+        text = _clean(p.text_content())
+        if len(text) < MIN_PARAGRAPH_CHARS:
+            continue
+
+        weight = 1 + text.count(",") + min(len(text) // 100, 3)
+
+        parent = p.getparent()
+        if parent is None:
+            continue
+        scores[parent] = scores.get(parent, _class_weight(parent)) + weight
+
+        grandparent = parent.getparent()
+        if grandparent is not None:
+            scores[grandparent] = (
+                scores.get(grandparent, _class_weight(grandparent)) + weight / 2
+            )
+
+    if not scores:
+        return None
+
+    return max(scores, key=scores.get)
+
+
+def _inside_noise(node, container) -> bool:
+    """True when a promo/share/etc. block sits between node and container."""
+    for ancestor in node.iterancestors():
+        if ancestor is container:
+            return False
+        if NEGATIVE_HINTS.search(f"{ancestor.get('class', '')} {ancestor.get('id', '')}"):
+            return True
+    return False
+
+
+def _class_weight(node) -> float:
+    hints = f"{node.get('class', '')} {node.get('id', '')}"
+    weight = 0.0
+    if node.tag in ("article", "main"):
+        weight += 10
+    if POSITIVE_HINTS.search(hints):
+        weight += 5
+    if NEGATIVE_HINTS.search(hints):
+        weight -= 15
+    return weight
+
+
+def _clean(text: str) -> str:
+    return WHITESPACE.sub(" ", text).strip()
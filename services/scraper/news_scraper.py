@@ -3,62 +3,175 @@
 import pandas as pd
 from newspaper import Article
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
 
-# You can later replace this with real RSS / API sources
-NEWS_URLS = [
-    "https://openai.com/blog",
-    "https://www.theverge.com/ai-artificial-intelligence",
-]
+from services.scraper.fast_extractor import extract_article, fetch_html
+from shared.config.config_loader import ConfigLoader
+from shared.config.source_registry import SourceRegistry
+from shared.utils.helpers import parallel_map
+from shared.utils.http_fetch import fetch_all
+from shared.utils.response_archive import ResponseArchive
 
+# Sources live in the source registry (config/sources.yaml)
 OUTPUT_PATH = "data/raw/news_sample.csv"
 
+EXTRACTORS = ("newspaper", "fast")
 
-def scrape_article(url: str) -> dict | None:
+
+def get_extractor(url: str) -> str:
     """
-    Scrape a single article and return structured data
+    Resolve the extractor for a source from config
+    (scraper.extractors keyed by host, else scraper.default_extractor).
     """
-    try:
-        article = Article(url)
-        article.download()
-        article.parse()
+    config = ConfigLoader()
+    host = urlparse(url).netloc.lower()
+    extractor = config.get("scraper.extractors", {}).get(
+        host, config.get("scraper.default_extractor", "newspaper")
+    )
+
+    if extractor not in EXTRACTORS:
+        raise ValueError(
+            f"Unknown extractor '{extractor}' for {host}. Available: {list(EXTRACTORS)}"
+        )
+    return extractor
 
-        if not article.text.strip():
-            return None
 
-        return {
-            "title": article.title,
-            "text": article.text,
-            "url": url,
-            "scraped_at": datetime.utcnow().isoformat()
-        }
+def scrape_article(url: str, extractor: str | None = None) -> dict | None:
+    """
+    Scrape a single article and return structured data.
+    extractor: "newspaper" (full newspaper3k parse) or "fast" (lxml
+    heuristics, title + text only). Defaults to the configured one.
+    """
+    try:
+        extractor = extractor or get_extractor(url)
+        html = fetch_html(url, archive=ResponseArchive.from_config())
+        return _extract((url, html, extractor, datetime.utcnow().isoformat()))
 
     except Exception as e:
         print(f"[ERROR] Failed to scrape {url}: {e}")
         return None
 
 
-def scrape_news() -> pd.DataFrame:
+def scrape_news(force: bool = False, replay: bool = None) -> pd.DataFrame:
     """
-    Scrape all news sources and save to CSV
+    Scrape the news sources in the source registry and save to CSV.
+
+    Only sources whose refresh interval has elapsed are fetched (all of
+    them when force=True); articles from the other sources are carried
+    over from the previous run. Pages are downloaded concurrently and
+    parsed in a process pool.
+
+    Live responses are written to the response archive. With replay=True
+    (or archive.replay in config) every source is served from the archive
+    with no network access; the CSV snapshot and the due-state are left
+    untouched, so replays (e.g. benchmark_ingestion) don't change what the
+    next live run carries over.
     """
-    articles = []
+    config = ConfigLoader()
+    registry = SourceRegistry.from_config()
+    archive = ResponseArchive.from_config(replay=replay)
+
+    if force or archive.replay:
+        sources = registry.sources("news")
+    else:
+        sources = registry.due("news", max_sources=config.get("sources.max_per_cycle", 0))
+
+    print(f"[INFO] {len(sources)} news sources due for scraping")
+
+    responses = fetch_all(
+        [s.url for s in sources],
+        max_concurrency=config.get("sources.max_concurrency", 16),
+        archive=archive
+    )
+
+    jobs = []
+    fetched = []
+
+    for source, response in zip(sources, responses):
+        if not response.ok:
+            print(f"[ERROR] Failed to scrape {source.url}: {response.error or response.status}")
+            continue
+
+        print(f"[INFO] Scraped: {source.url}")
+        fetched.append(source)
+        jobs.append((
+            source.url,
+            response.text(),
+            source.extractor or get_extractor(source.url),
+            datetime.utcfromtimestamp(response.fetched_at).isoformat()
+        ))
+
+    results = parallel_map(_extract, jobs, workers=config.get("sources.parse_workers", 1))
 
-    for url in NEWS_URLS:
-        print(f"[INFO] Scraping: {url}")
-        data = scrape_article(url)
+    articles = []
+    for source, data in zip(fetched, results):
         if data:
-            articles.append(data)
+            articles.append({**data, "source": source.name})
+
+    fetched_names = {s.name for s in fetched}
+    known_names = {s.name for s in registry.sources("news")}
+    articles += [] if archive.replay else [
+        row for row in _load_previous_articles()
+        if row.get("source") in known_names and row["source"] not in fetched_names
+    ]
 
     if not articles:
         raise RuntimeError("No articles scraped.")
 
     df = pd.DataFrame(articles)
+    if archive.replay:
+        print(f"[SUCCESS] {len(df)} articles replayed (not saved)")
+        return df
+
+    Path(OUTPUT_PATH).parent.mkdir(parents=True, exist_ok=True)
     df.to_csv(OUTPUT_PATH, index=False)
+    registry.mark_fetched(fetched)
 
     print(f"[SUCCESS] News saved to {OUTPUT_PATH}")
     return df
 
 
+def _extract(job) -> dict | None:
+    """
+    Extract title and text from downloaded HTML.
+    Top-level so it can run in a worker process.
+    """
+    url, html, extractor, scraped_at = job
+
+    try:
+        if extractor == "fast":
+            extracted = extract_article(html)
+            if extracted is None:
+                return None
+            title, text = extracted["title"], extracted["text"]
+        else:
+            article = Article(url)
+            article.download(input_html=html)
+            article.parse()
+            title, text = article.title, article.text
+
+    except Exception as e:
+        print(f"[ERROR] Failed to extract {url}: {e}")
+        return None
+
+    if not text.strip():
+        return None
+
+    return {
+        "title": title,
+        "text": text,
+        "url": url,
+        "scraped_at": scraped_at
+    }
+
+
+def _load_previous_articles() -> list:
+    if not Path(OUTPUT_PATH).exists():
+        return []
+    return pd.read_csv(OUTPUT_PATH).to_dict("records")
+
+
 # Allow standalone execution
 if __name__ == "__main__":
     scrape_news()
@@ -4,6 +4,7 @@ All configuration access goes through this module.
 """
 
 from shared.config.config_loader import ConfigLoader
+from shared.config.source_registry import Source, SourceRegistry
 
 # Singleton instance
 config_instance = ConfigLoader()
@@ -14,6 +15,8 @@ def get_config():
 
 __all__ = [
     'ConfigLoader',
+    'Source',
+    'SourceRegistry',
     'get_config',
     'config_instance',
 ]
@@ -0,0 +1,142 @@
+# shared/config/source_registry.py
+"""
+Source registry.
+Single Responsibility: Load news/RSS sources from config and decide which
+ones are due for a refresh. Replaces the hard-coded source lists in the
+scraper and the market signal collector.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import yaml
+
+from shared.config.config_loader import ConfigLoader
+from shared.utils.atomic_io import atomic_write, file_lock
+
+SOURCE_KINDS = ("rss", "news")
+
+
+@dataclass
+class Source:
+    """A single configured feed or page."""
+    name: str
+    url: str
+    kind: str  # 'rss' or 'news'
+    limit: int = 5
+    priority: int = 0
+    refresh_minutes: int = 30
+    extractor: Optional[str] = None
+    enabled: bool = True
+
+
+class SourceRegistry:
+    """
+    Configured sources plus the last-fetched time of each one,
+    persisted so only due sources are fetched each cycle. Several
+    processes (scraper, collector, streaming daemon) share the state
+    file; each save merges into what is on disk under a file lock.
+    """
+
+    def __init__(self, registry_path: Path, state_path: Path, defaults: Dict = None):
+        """
+        Args:
+            registry_path: YAML file with `rss:` and `news:` source lists
+            state_path: JSON file holding last-fetched timestamps
+            defaults: Field defaults applied to every source
+        """
+        self.registry_path = Path(registry_path)
+        self.state_path = Path(state_path)
+        self.defaults = defaults or {}
+        self._sources = self._load_sources()
+        self._state = self._load_state()
+
+    @classmethod
+    def from_config(cls) -> "SourceRegistry":
+        """Build the registry from the `sources` section of config.yaml."""
+        config = ConfigLoader()
+        return cls(
+            registry_path=config.get("sources.registry", "config/sources.yaml"),
+            state_path=config.get("sources.state_file", "data/memory/source_state.json"),
+            defaults=config.get("sources.defaults", {})
+        )
+
+    # ---------- PUBLIC ----------
+    def sources(self, kind: str) -> List[Source]:
+        """All enabled sources of a kind, highest priority first."""
+        return sorted(
+            (s for s in self._sources if s.kind == kind and s.enabled),
+            key=lambda s: -s.priority
+        )
+
+    def due(self, kind: str, now: datetime = None, max_sources: int = None) -> List[Source]:
+        """
+        Sources whose refresh interval has elapsed since their last fetch.
+        """
+        now = now or datetime.utcnow()
+        due = []
+
+        for source in self.sources(kind):
+            last = self._state.get(source.name)
+            if last is None:
+                due.append(source)
+                continue
+
+            elapsed = (now - datetime.fromisoformat(last)).total_seconds() / 60
+            if elapsed >= source.refresh_minutes:
+                due.append(source)
+
+        return due[:max_sources] if max_sources else due
+
+    def mark_fetched(self, sources: List[Source], now: datetime = None):
+        """Record a successful fetch for each source and persist state."""
+        if not sources:
+            return
+
+        stamp = (now or datetime.utcnow()).isoformat()
+        self._save_state({source.name: stamp for source in sources})
+
+    # ---------- LOAD / SAVE ----------
+    def _load_sources(self) -> List[Source]:
+        if not self.registry_path.exists():
+            raise FileNotFoundError(f"Source registry not found: {self.registry_path}")
+
+        with open(self.registry_path, "r", encoding="utf-8") as f:
+            raw = yaml.safe_load(f) or {}
+
+        sources = []
+        seen = set()
+
+        for kind in SOURCE_KINDS:
+            for entry in raw.get(kind) or []:
+                source = Source(kind=kind, **{**self.defaults, **entry})
+                if source.name in seen:
+                    raise ValueError(f"Duplicate source name: {source.name}")
+                seen.add(source.name)
+                sources.append(source)
+
+        return sources
+
+    def _load_state(self) -> Dict[str, str]:
+        if not self.state_path.exists():
+            return {}
+        with open(self.state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_state(self, updates: Dict[str, str]):
+        """
+        Merge `updates` into the state on disk (re-read under the lock, so
+        other processes' entries survive) and write it atomically.
+        """
+        with file_lock(self.state_path):
+            state = self._load_state()
+            for name, stamp in updates.items():
+                state[name] = max(stamp, state.get(name, stamp))  # ISO stamps sort by time
+
+            with atomic_write(self.state_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2)
+
+        self._state = state
@@ -4,17 +4,37 @@ No business logic - pure functions only.
 """
 
 from shared.utils.output_writer import OutputWriter
+from shared.utils.http_fetch import FetchResult, fetch_url, fetch_all, fetch_all_async
+from shared.utils.response_archive import ResponseArchive
+from shared.utils.keyword_matcher import KeywordMatcher, get_matcher
+from shared.utils.atomic_io import atomic_write, file_lock
+from shared.utils.artifact_stripper import ArtifactStripper, prompt_artifact_patterns
 from shared.utils.helpers import (
     load_json,
     save_json,
     sanitize_text,
     chunk_text,
+    parallel_map,
+    canonicalize_url,
 )
 
 __all__ = [
     'OutputWriter',
+    'FetchResult',
+    'fetch_url',
+    'fetch_all',
+    'fetch_all_async',
+    'ResponseArchive',
+    'KeywordMatcher',
+    'get_matcher',
+    'atomic_write',
+    'file_lock',
+    'ArtifactStripper',
+    'prompt_artifact_patterns',
     'load_json',
     'save_json',
     'sanitize_text',
     'chunk_text',
+    'parallel_map',
+    'canonicalize_url',
 ]
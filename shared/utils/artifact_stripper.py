@@ -0,0 +1,187 @@
+# shared/utils/artifact_stripper.py
+"""
+Prompt-artifact removal for generated text.
+Patterns are compiled once. Lines that may contain an artifact are found
+in a single scan of the lowercased text for each pattern's literal
+prefix (plain str.find, far cheaper than a case-insensitive regex scan),
+and only those lines are rewritten. The result is identical to applying
+re.sub for every pattern in turn (case-insensitive), as long as patterns
+don't match across lines.
+"""
+
+import re
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Iterable, List, Optional
+
+BLANK_RUNS = re.compile(r"\n{3,}")
+
+REGEX_SPECIAL = set(".^$*+?{}[]|()")
+QUANTIFIERS = ("*", "+", "?", "{")
+
+# The only non-ASCII characters IGNORECASE matches to ASCII ones that
+# str.lower() doesn't map there (KELVIN SIGN already lowers to "k")
+ASCII_FOLDS = {"\u0130": "i", "\u0131": "i", "\u017f": "s"}
+
+
+class ArtifactStripper:
+    """
+    Removes pattern matches, then lines that start with a bullet, then
+    collapses runs of blank lines.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(dict.fromkeys(patterns))
+        self._compiled = [re.compile(p, re.IGNORECASE) for p in self.patterns]
+
+        # literal prefix -> indices of the patterns starting with it
+        self._prefixes = {}
+        self._unprefixed = set()  # no usable prefix: always tried with the regex
+        for j, pattern in enumerate(self.patterns):
+            prefix = _literal_prefix(pattern)
+            if prefix:
+                self._prefixes.setdefault(prefix, []).append(j)
+            else:
+                self._unprefixed.add(j)
+
+    # ---------- PUBLIC ----------
+    def strip(self, text: str) -> str:
+        lines = text.split("\n")
+
+        for i, applicable in self._candidate_lines(text, lines).items():
+            lines[i] = self._apply(lines[i], applicable)
+
+        kept = [line for line in lines if not _is_bullet(line)]
+        return BLANK_RUNS.sub("\n\n", "\n".join(kept)).strip()
+
+    def strip_line(self, line: str) -> Optional[str]:
+        """
+        strip() for a single line (no newline): the line with patterns
+        removed, or None if it is dropped as a bullet line.
+        """
+        lower = _fold(line)
+        applicable = set(self._unprefixed)
+        for prefix, indices in self._prefixes.items():
+            if prefix in lower:
+                applicable.update(indices)
+
+        if applicable:
+            line = self._apply(line, applicable)
+        return None if _is_bullet(line) else line
+
+    # ---------- CORE LOGIC ----------
+    def _apply(self, line, applicable):
+        """Patterns in order; those outside `applicable` are skipped while they can't match."""
+        changed = False
+        for j, pattern in enumerate(self._compiled):
+            # Once the line is rewritten, later patterns may match text they didn't before
+            if changed or j in applicable:
+                stripped = pattern.sub("", line)
+                changed = changed or stripped != line
+                line = stripped
+        return line
+
+    def _candidate_lines(self, text, lines):
+        """{line index: indices of the patterns that may match it}."""
+        lower = _fold(text)
+        hits = []
+        for prefix, indices in self._prefixes.items():
+            i = lower.find(prefix)
+            while i != -1:
+                hits.append((i, indices))
+                end = lower.find("\n", i)
+                if end == -1:
+                    break
+                i = lower.find(prefix, end)
+
+        # Offset just past each line's newline; a position belongs to the first line ending after it
+        ends = list(accumulate(len(line) + 1 for line in lines))
+        candidates = {}
+        for position, indices in hits:
+            candidates.setdefault(bisect_left(ends, position + 1), set()).update(indices)
+
+        for j in self._unprefixed:
+            pattern = self._compiled[j]
+            for i, line in enumerate(lines):
+                if pattern.search(line):
+                    candidates.setdefault(i, set()).add(j)
+        return candidates
+
+
+def _is_bullet(line):
+    # Same test as re.match(r"^\s*-\s*", line): \s and str.isspace agree
+    return line.lstrip()[:1] == "-"
+
+
+def _fold(text):
+    """Lowercase `text` so ASCII literals match as under IGNORECASE, keeping offsets."""
+    if not text.isascii():
+        for char, ascii_char in ASCII_FOLDS.items():
+            if char in text:
+                text = text.replace(char, ascii_char)
+    return text.lower()
+
+
+def _literal_prefix(pattern):
+    """
+    Lowercased literal text every match of `pattern` starts with ("" if
+    none can be determined). Stops at the first regex construct or
+    non-ASCII character, so it never demands more than the pattern does.
+    """
+    if _has_alternation(pattern):
+        return ""
+
+    prefix = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            if i + 1 == len(pattern) or pattern[i + 1].isalnum():
+                break  # class escape (\d, \s, ...) or backreference
+            char, step = pattern[i + 1], 2
+        elif char in REGEX_SPECIAL:
+            break
+        else:
+            step = 1
+
+        if pattern[i + step:i + step + 1] in QUANTIFIERS or not char.isascii():
+            break
+        prefix.append(char)
+        i += step
+
+    return "".join(prefix).lower()
+
+
+def _has_alternation(pattern):
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == "\\":
+            i += 2
+            continue
+        if pattern[i] == "|":
+            return True
+        i += 1
+    return False
+
+
+def prompt_artifact_patterns(prompt: str) -> List[str]:
+    """
+    Patterns for instruction lines a model may echo back from `prompt`:
+    a "Label:" line gives `Label:.*`, any other line (bullets included)
+    its first three words followed by `.*`.
+    """
+    patterns = []
+    for line in prompt.split("\n"):
+        words = line.strip().split()
+        if not words:
+            continue
+
+        if words[0].endswith(":"):
+            prefix = words[0]
+        elif words[0] == "-":
+            prefix = " ".join(words[:4])
+        else:
+            prefix = " ".join(words[:3])
+        patterns.append(re.escape(prefix) + ".*")
+
+    return patterns
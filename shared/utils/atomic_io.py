@@ -0,0 +1,107 @@
+# shared/utils/atomic_io.py
+"""
+Crash-safe file writes and inter-process file locks.
+atomic_write: temp file in the same directory + fsync + rename, so readers
+see either the old or the new file, never a partial one.
+file_lock: exclusive advisory lock on a sidecar `.lock` file, held for a
+whole read-modify-write so concurrent processes don't lose updates.
+"""
+
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def atomic_write(path, mode: str = "wb", encoding: str = None):
+    """
+    Yield a file object; on clean exit its contents replace `path`
+    atomically and durably. On error the target is left untouched.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    _fsync_directory(path.parent)
+
+
+@contextmanager
+def file_lock(path, timeout: float = None):
+    """
+    Hold an exclusive inter-process lock for `path` (on `<path>.lock`).
+    Blocks until acquired, or raises TimeoutError after `timeout` seconds.
+    """
+    lock_path = Path(str(path) + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(lock_path, "a+b") as f:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not _try_lock(f, blocking=deadline is None):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Could not lock {lock_path} within {timeout}s")
+            time.sleep(0.05)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+# ---------- HELPERS ----------
+def _try_lock(f, blocking):
+    if fcntl is not None:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    # msvcrt locks a byte range; LK_LOCK itself gives up after ~10s, so retry
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            if not blocking:
+                return False
+
+
+def _unlock(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _fsync_directory(directory):
+    """Persist the rename itself (no-op where directories can't be opened)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
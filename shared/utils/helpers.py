@@ -3,7 +3,26 @@ Pure utility functions for common operations.
 """
 
 import json
-from typing import Any, Dict, List, Optional
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+# Dropped on every host: only keys no site uses for content identity
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+    "ref_src", "_ga", "_gl", "guccounter",
+}
+
+# Generic keys (ref, cid, amp, ...) that are trackers only on these hosts
+HOST_TRACKING_PARAMS = {
+    "nytimes.com": {"smid", "smtyp"},
+    "msn.com": {"ocid", "cvid"},
+    "washingtonpost.com": {"outputtype"},
+    "theguardian.com": {"cmp", "cmpid"},
+    "techcrunch.com": {"guce_referrer", "guce_referrer_sig"},
+}
+AMP_CACHE_PATH = re.compile(r"^/(?:[a-z]/)*(.+)$")
 
 
 def load_json(filepath: str) -> Dict[str, Any]:
@@ -38,3 +57,81 @@ def chunk_text(text: str, chunk_size: int = 500, overlap: int = 50) -> List[str]
             chunks.append(chunk)
     
     return chunks
+
+
+def parallel_map(func: Callable, items: List[Any], workers: int = 1) -> List[Any]:
+    """
+    Map a top-level (picklable) function over items in a process pool.
+    Falls back to a plain loop for one worker or a single item.
+    Results keep the order of `items`.
+    """
+    if workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        return list(pool.map(func, items))
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalise a link so the same story from different feeds maps to one key:
+    https scheme, lowercase host without www./amp., AMP cache and
+    /amp paths unwrapped, tracking params (utm_*, fbclid, ... plus
+    per-host ones from HOST_TRACKING_PARAMS) and
+    fragments dropped, remaining params sorted, no trailing slash.
+    A malformed port is dropped; a link urlsplit rejects is returned as is.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:  # e.g. an unbalanced IPv6 bracket
+        return url
+    try:
+        port = parts.port
+    except ValueError:  # non-numeric or out of range
+        port = None
+    host = (parts.hostname or "").lower()
+    path = parts.path
+
+    # AMP caches: <x>.cdn.ampproject.org/c/s/host/path, google.com/amp/s/host/path
+    if host.endswith(".cdn.ampproject.org") or (
+        host.endswith("google.com") and path.startswith("/amp/")
+    ):
+        match = AMP_CACHE_PATH.match(path[4:] if path.startswith("/amp/") else path)
+        if match:
+            return canonicalize_url("https://" + unquote(match.group(1)) + (
+                "?" + parts.query if parts.query else ""
+            ))
+
+    for prefix in ("www.", "amp.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    segments = [seg for seg in path.split("/") if seg]
+    if segments and segments[-1].lower() in ("amp", "amp.html"):
+        segments = segments[:-1]
+    path = "/" + "/".join(segments)
+
+    tracking = TRACKING_PARAMS | _host_tracking_params(host)
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in tracking
+    )
+
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def _host_tracking_params(host: str) -> set:
+    """Host-specific tracking keys for `host` or any of its parent domains."""
+    params = set()
+    for domain, keys in HOST_TRACKING_PARAMS.items():
+        if host == domain or host.endswith("." + domain):
+            params |= keys
+    return params
@@ -0,0 +1,148 @@
+# shared/utils/http_fetch.py
+"""
+HTTP fetching shared by the scraper and the RSS collector.
+Blocking fetches go through urllib; many URLs are fetched concurrently
+with asyncio, bounded by a semaphore. An optional ResponseArchive records
+live responses or, in replay mode, serves them without touching the network.
+"""
+
+import asyncio
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+USER_AGENT = "Mozilla/5.0 (compatible; ProjectAutomate/1.0)"
+DEFAULT_TIMEOUT = 10
+
+
+@dataclass
+class FetchResult:
+    """Raw outcome of a single HTTP fetch."""
+    url: str
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    fetched_at: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status < 300
+
+    def text(self) -> str:
+        """Decode body using the response charset (utf-8 fallback)."""
+        content_type = self.headers.get("Content-Type", "")
+        charset = "utf-8"
+        if "charset=" in content_type:
+            charset = content_type.split("charset=")[-1].split(";")[0].strip() or charset
+        try:
+            return self.body.decode(charset, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+def fetch_url(url: str, timeout: int = DEFAULT_TIMEOUT, archive=None) -> FetchResult:
+    """
+    Fetch a URL. Never raises: failures are reported via FetchResult.error.
+    archive: optional ResponseArchive (replay serves from it, otherwise
+    the live response is saved to it).
+    """
+    if archive is not None and archive.replay:
+        return archive.load(url)
+
+    result = _fetch_live(url, timeout)
+
+    if archive is not None:
+        archive.save(result)
+
+    return result
+
+
+def _fetch_live(url: str, timeout: int) -> FetchResult:
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    fetched_at = time.time()
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return FetchResult(
+                url=url,
+                status=response.status,
+                headers=dict(response.headers.items()),
+                body=response.read(),
+                fetched_at=fetched_at
+            )
+    except urllib.error.HTTPError as e:
+        return FetchResult(
+            url=url,
+            status=e.code,
+            headers=dict(e.headers.items()) if e.headers else {},
+            body=e.read() or b"",
+            fetched_at=fetched_at,
+            error=str(e)
+        )
+    except Exception as e:
+        return FetchResult(url=url, status=0, fetched_at=fetched_at, error=str(e))
+
+
+async def _fetch_all(urls: List[str], max_concurrency: int, timeout: int, archive) -> List[FetchResult]:
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        async def bounded(url):
+            async with semaphore:
+                return await loop.run_in_executor(executor, fetch_url, url, timeout, archive)
+
+        return await asyncio.gather(*(bounded(url) for url in urls))
+
+
+def fetch_all(
+    urls: List[str],
+    max_concurrency: int = 16,
+    timeout: int = DEFAULT_TIMEOUT,
+    archive=None
+) -> List[FetchResult]:
+    """
+    Fetch many URLs concurrently. Results keep the order of `urls`.
+    In replay mode the archive is read sequentially; no event loop is needed.
+    Called from a running event loop (async callers should await
+    fetch_all_async instead), the fetch runs on its own loop in a helper
+    thread and this call blocks until it is done.
+    """
+    if not urls:
+        return []
+
+    if archive is not None and archive.replay:
+        return [archive.load(url) for url in urls]
+
+    max_concurrency = max(1, min(max_concurrency, len(urls)))
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_fetch_all(urls, max_concurrency, timeout, archive))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(
+            asyncio.run, _fetch_all(urls, max_concurrency, timeout, archive)
+        ).result()
+
+
+async def fetch_all_async(
+    urls: List[str],
+    max_concurrency: int = 16,
+    timeout: int = DEFAULT_TIMEOUT,
+    archive=None
+) -> List[FetchResult]:
+    """Awaitable fetch_all for callers already running an event loop."""
+    if not urls:
+        return []
+
+    if archive is not None and archive.replay:
+        return [archive.load(url) for url in urls]
+
+    max_concurrency = max(1, min(max_concurrency, len(urls)))
+    return await _fetch_all(urls, max_concurrency, timeout, archive)
@@ -0,0 +1,305 @@
+# shared/utils/keyword_matcher.py
+"""
+Multi-keyword matching.
+With word_boundary=True (default) keywords match whole words, so "ai"
+matches "AI agents" but not "said" or "again", and multi-word keywords
+("machine learning") match whole consecutive words. A token also matches
+in its common inflected forms (s/es/ed/ing, release -> released, policy
+-> policies), so "agent" matches "agents" but only mid-word matches are
+excluded. With word_boundary=False keywords are plain substrings. A
+match is reported as the keyword it belongs to ("c++" for the word "c").
+
+Small keyword sets (up to MAX_REGEX_KEYWORDS, e.g. the scorer and
+selector lists) get one compiled regex per keyword that starts with the
+keyword's literal stem, so the regex engine's fast literal search does
+the scanning; on shorter texts a substring check first skips keywords
+that cannot match.
+
+Larger sets are compiled once into an Aho-Corasick automaton over word
+tokens, and each text is scanned in a single pass. Words starting with
+a keyword stem are located by one compiled regex (the stems as a
+character trie, so the scan itself runs inside the regex engine) and
+looked up in a table of the inflected forms; only keyword tokens reach
+the automaton. Keyword sets made of single words skip the full scan:
+the stems are located with str.find and the regex only runs at those
+positions. Without word boundaries the automaton runs over characters.
+"""
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Iterator, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Suffixes a keyword token may carry (after dropping a final e / y where noted)
+SUFFIXES = ("s", "es", "ed", "ing")
+E_SUFFIXES = ("s", "d")                           # release -> releases, released
+E_DROP_SUFFIXES = ("ing",)                        # release -> releasing
+Y_DROP_SUFFIXES = ("ies", "ied")                  # policy -> policies
+
+MAX_REGEX_KEYWORDS = 64       # larger sets use the automaton (one pass for all keywords)
+PREFILTER_MAX_CHARS = 8192    # texts up to this long get a substring check before each regex
+
+
+class KeywordMatcher:
+    """Per-keyword regexes or an Aho-Corasick automaton over a fixed keyword set."""
+
+    def __init__(self, keywords: Iterable[str], word_boundary: bool = True):
+        """
+        Args:
+            keywords: Keywords to match (case-insensitive)
+            word_boundary: Match whole words only
+        """
+        self.keywords = list(dict.fromkeys(k.lower().strip() for k in keywords if k.strip()))
+        self.word_boundary = word_boundary
+
+        # (keyword, literal every match contains, regex or None for a plain substring)
+        self._patterns = None
+        if len(self.keywords) <= MAX_REGEX_KEYWORDS:
+            self._patterns = [
+                _keyword_pattern(k) if word_boundary else (k, k, None) for k in self.keywords
+            ]
+        else:
+            self._build_automaton()
+
+    def _build_automaton(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        for keyword in self.keywords:
+            self._insert(keyword)
+        self._build_failure_links()
+
+        tokens = {token for k in self.keywords for token in TOKEN_PATTERN.findall(k)}
+
+        # inflected form -> keyword token (a form that is itself a token stays that token)
+        self._forms = {}
+        for token in tokens:
+            for form in _inflections(token):
+                self._forms.setdefault(form, token)
+        self._forms.update((token, token) for token in tokens)
+
+        # Shortest prefix shared by each token's forms; matches the whole word from there
+        self._stems = sorted({_stem(token) for token in tokens})
+        self._vocab_pattern = re.compile(r"(?<!\w)" + _trie_pattern(self._stems) + r"\w*")
+
+        # Single-token keywords need no automaton walk: every vocabulary hit is a keyword
+        self._single_tokens = self.word_boundary and all(
+            len(TOKEN_PATTERN.findall(k)) == 1 for k in self.keywords
+        )
+        self._keywords_of = {}  # token -> the single-token keywords made of it ("c" -> "c++")
+        for keyword in self.keywords:
+            for token in TOKEN_PATTERN.findall(keyword)[:1]:
+                self._keywords_of[token] = self._keywords_of.get(token, ()) + (keyword,)
+
+    # ---------- PUBLIC ----------
+    def find(self, text: str) -> FrozenSet[str]:
+        """Distinct keywords present in text."""
+        if not self.keywords:
+            return frozenset()
+
+        if self._patterns is not None:
+            return frozenset(self._pattern_matches(text.lower()))
+
+        if self._single_tokens:
+            found = set()
+            for keywords in self._stem_matches(text.lower()):
+                found.update(keywords)
+            return frozenset(found)
+
+        symbols = self._symbols(text.lower())
+
+        found = set()
+        for outputs in self._walk(symbols):
+            found.update(outputs)
+        return frozenset(found)
+
+    def count(self, text: str) -> int:
+        """Number of distinct keywords present in text."""
+        if self._patterns is not None:
+            return sum(1 for _ in self._pattern_matches(text.lower()))
+        return len(self.find(text))
+
+    def contains_any(self, text: str) -> bool:
+        """True as soon as any keyword is found."""
+        if not self.keywords:
+            return False
+
+        if self._patterns is not None:
+            return any(True for _ in self._pattern_matches(text.lower()))
+
+        if self._single_tokens:
+            return any(True for _ in self._stem_matches(text.lower()))
+
+        return any(True for _ in self._walk(self._symbols(text.lower())))
+
+    # ---------- REGEX ----------
+    def _pattern_matches(self, text: str) -> Iterator[str]:
+        """Keywords in text, one search per keyword (small keyword sets)."""
+        prefilter = len(text) <= PREFILTER_MAX_CHARS
+        for keyword, literal, pattern in self._patterns:
+            if (prefilter or pattern is None) and literal not in text:
+                continue
+            if pattern is None or pattern.search(text):
+                yield keyword
+
+    # ---------- AUTOMATON ----------
+    def _stem_matches(self, text: str) -> Iterator[Tuple[str, ...]]:
+        """
+        Keywords per hit in text (single-word keyword sets): candidate
+        positions come from str.find on the stems, and the vocabulary
+        regex only reads the word starting at each of them.
+        """
+        match_at = self._vocab_pattern.match
+        forms = self._forms
+        keywords_of = self._keywords_of
+        for stem in self._stems:
+            i = text.find(stem)
+            while i != -1:
+                match = match_at(text, i)
+                if match is None:
+                    i = text.find(stem, i + 1)
+                    continue
+                token = forms.get(match.group())
+                if token is not None:
+                    yield keywords_of[token]
+                i = text.find(stem, match.end())
+
+    def _symbols(self, text: str) -> Iterator[Optional[str]]:
+        """
+        Automaton input. In word mode: the vocabulary tokens of text, with
+        a None separator wherever other words sit between two of them (so
+        phrases only match consecutive words).
+        """
+        if not self.word_boundary:
+            yield from text
+            return
+
+        prev_end = None
+        for match in self._vocab_pattern.finditer(text):
+            token = self._forms.get(match.group())
+            if token is None:
+                continue  # another word sharing a stem
+            if prev_end is not None and TOKEN_PATTERN.search(text, prev_end, match.start()):
+                yield None
+            yield token
+            prev_end = match.end()
+
+    def _insert(self, keyword: str):
+        state = 0
+        symbols = TOKEN_PATTERN.findall(keyword) if self.word_boundary else keyword
+        for symbol in symbols:
+            nxt = self._goto[state].get(symbol)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][symbol] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = nxt
+        self._output[state] = self._output[state] + (keyword,)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for symbol, nxt in self._goto[state].items():
+                queue.append(nxt)
+
+                fallback = self._fail[state]
+                while fallback and symbol not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(symbol, 0)
+                self._fail[nxt] = target if target != nxt else 0
+
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def _walk(self, symbols):
+        """Yield the keyword tuple of every state with output."""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+
+        for symbol in symbols:
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            if output[state]:
+                yield output[state]
+
+
+def _inflections(token: str) -> set:
+    """Forms of a word token that match it: the token plus its suffixed forms."""
+    forms = {token}
+    if not token.isalpha() or len(token) < 2:
+        return forms
+
+    if token.endswith("e"):
+        forms.update(token + suffix for suffix in E_SUFFIXES)
+        forms.update(token[:-1] + suffix for suffix in E_DROP_SUFFIXES)
+    elif token.endswith("y"):
+        forms.update(token + suffix for suffix in SUFFIXES)
+        forms.update(token[:-1] + suffix for suffix in Y_DROP_SUFFIXES)
+    else:
+        forms.update(token + suffix for suffix in SUFFIXES)
+    return forms
+
+
+def _stem(token: str) -> str:
+    """Longest prefix common to all forms of token."""
+    forms = list(_inflections(token))
+    stem = forms[0]
+    for form in forms[1:]:
+        while not form.startswith(stem):
+            stem = stem[:-1]
+    return stem
+
+
+def _keyword_pattern(keyword: str):
+    """
+    (keyword, stem, regex) for a keyword's tokens in their inflected
+    forms, separated by non-word characters. The regex starts with the
+    first token's stem as a literal, so searching it is a fast literal
+    scan; the word boundary before it is checked by a lookbehind.
+    """
+    tokens = TOKEN_PATTERN.findall(keyword)
+    if not tokens:
+        return keyword, keyword, re.compile(re.escape(keyword))
+
+    stem = _stem(tokens[0])
+    suffixes = sorted(form[len(stem):] for form in _inflections(tokens[0]))
+    first = re.escape(stem) + r"(?<!\w" + "." * len(stem) + ")"
+    if any(suffixes):
+        first += "(?:" + _trie_pattern([s for s in suffixes if s]) + ")" + ("?" if "" in suffixes else "")
+
+    rest = [_trie_pattern(sorted(_inflections(token))) for token in tokens[1:]]
+    return keyword, stem, re.compile(r"\W+".join([first] + rest) + r"(?!\w)", re.DOTALL)
+
+
+def _trie_pattern(words) -> str:
+    """Regex alternation for a word set, factored as a character trie."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        group = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            group = "(?:" + group + ")?"
+        return group
+
+    return "(?:" + build(trie) + ")"
+
+
+@lru_cache(maxsize=32)
+def get_matcher(keywords: tuple, word_boundary: bool = True) -> KeywordMatcher:
+    """Shared, cached matcher per keyword tuple."""
+    return KeywordMatcher(keywords, word_boundary=word_boundary)
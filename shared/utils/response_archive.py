@@ -0,0 +1,87 @@
+# shared/utils/response_archive.py
+"""
+Raw HTTP response archive.
+Stores the latest response per URL (status, headers, body, fetch time) as
+gzip-compressed JSON, and serves it back in replay mode so the ingestion
+path can run deterministically with zero network.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+from shared.config.config_loader import ConfigLoader
+from shared.utils.atomic_io import atomic_write
+from shared.utils.http_fetch import FetchResult
+
+
+class ResponseArchive:
+    """
+    One file per URL: <dir>/<sha1(url)>.json.gz, overwritten on each fetch.
+    """
+
+    def __init__(self, directory: str = "data/archive", enabled: bool = True, replay: bool = False):
+        """
+        Args:
+            directory: Where archived responses are stored
+            enabled: Write every live response to the archive
+            replay: Serve responses from the archive instead of the network
+        """
+        self.directory = Path(directory)
+        self.enabled = enabled
+        self.replay = replay
+
+    @classmethod
+    def from_config(cls, replay: bool = None) -> "ResponseArchive":
+        """Build from the `archive` section of config.yaml."""
+        config = ConfigLoader()
+        return cls(
+            directory=config.get("archive.dir", "data/archive"),
+            enabled=config.get("archive.enabled", False),
+            replay=config.get("archive.replay", False) if replay is None else replay
+        )
+
+    # ---------- PUBLIC ----------
+    def path_for(self, url: str) -> Path:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json.gz"
+
+    def save(self, result: FetchResult):
+        """Archive a live response (atomic write)."""
+        if not self.enabled:
+            return
+
+        record = {
+            "url": result.url,
+            "status": result.status,
+            "headers": result.headers,
+            "body": base64.b64encode(result.body).decode("ascii"),
+            "fetched_at": result.fetched_at,
+            "error": result.error
+        }
+
+        with atomic_write(self.path_for(result.url)) as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+            json.dump(record, f)
+
+    def load(self, url: str) -> FetchResult:
+        """
+        Return the archived response for a URL.
+        Missing entries come back as a failed FetchResult, never a network call.
+        """
+        path = self.path_for(url)
+        if not path.exists():
+            return FetchResult(url=url, status=0, error="Not in response archive")
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            record = json.load(f)
+
+        return FetchResult(
+            url=record["url"],
+            status=record["status"],
+            headers=record["headers"],
+            body=base64.b64decode(record["body"]),
+            fetched_at=record["fetched_at"],
+            error=record["error"]
+        )
@@ -0,0 +1,97 @@
+"""ArtifactStripper.strip must match the sequential re.sub cleaning it replaced.
+
+The reference below is the previous ContentRefiner._remove_prompt_artifacts
+(every pattern applied with re.sub in turn, then bullet lines dropped and
+blank-line runs collapsed). Both run on each style's pattern set.
+"""
+import random
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from services.meme_engine.content_refiner import _stripper_for
+from services.writers import TwitterWriter, MediumWriter, YouTubeWriter
+
+STYLES = [None, "twitter", "medium", "youtube"]
+
+CASES = [
+    "",
+    "Plain line without artifacts",
+    "You are a tech founder\nReal hook here\nWrite 5 tweets\nReal point",
+    "First line\n- bullet\n  -indented bullet\n-\nLast line",
+    "Keep\n\n\n\n\nthis\n\n\nspaced\n\n",
+    "Article: OpenAI ships agents\nRULES: none\ntone: calm\nStructure: 3 parts",
+    "Prefix text You are echoed mid-line\nwrite it all down",
+    "- Confident tone\n- Slightly controversial take\n- 5 tweets max\nbody",
+    # Non-ASCII characters IGNORECASE folds to ASCII ones
+    "WRİTE this\nwrıte that\nRuleſ: none\nArticleſ: x\nYou areſ",
+    "İıſ plain non-ascii line\nRİules: kept?\nſtructure: y",
+    "Café launches agents\n  Tone:   über calm\n\n\n— dash line\n- übullet",
+]
+
+
+def reference_strip(text, patterns):
+    for p in patterns:
+        text = re.sub(p, "", text, flags=re.IGNORECASE)
+
+    text = "\n".join(
+        line for line in text.split("\n")
+        if not re.match(r"^\s*-\s*", line)
+    )
+
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def random_generation(rng, echoes):
+    """Prose, echoed prompt lines (case- and fold-mangled), bullets and blank runs."""
+    words = "agents model launch said again the rules write tone you are article".split()
+    lines = []
+    for _ in range(rng.randint(0, 25)):
+        kind = rng.random()
+        if kind < 0.3:
+            line = rng.choice(echoes)
+            line = line.upper() if rng.random() < 0.3 else line
+            line = line.replace("i", "İ").replace("s", "ſ") if rng.random() < 0.2 else line
+        elif kind < 0.4:
+            line = rng.choice(["-", "- ", "  - item", "\t-x"])
+        elif kind < 0.55:
+            line = ""
+        else:
+            line = " ".join(rng.choice(words) for _ in range(rng.randint(1, 10)))
+            if rng.random() < 0.2:
+                line += " " + rng.choice(echoes)
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def test_fixed_cases_match_reference():
+    for style in STYLES:
+        stripper = _stripper_for(style)
+        for text in CASES:
+            assert stripper.strip(text) == reference_strip(text, stripper.patterns), (style, text)
+
+
+def test_random_generations_match_reference():
+    rng = random.Random(7)
+    echoes = [
+        line.strip()
+        for writer in (TwitterWriter, MediumWriter, YouTubeWriter)
+        for line in writer(None, {}).get_system_prompt().split("\n")
+        if line.strip()
+    ] + ["Article: x", "You are here", "Rules: none", "Write 3 posts", "Read the article first"]
+
+    for style in STYLES:
+        stripper = _stripper_for(style)
+        for _ in range(300):
+            text = random_generation(rng, echoes)
+            assert stripper.strip(text) == reference_strip(text, stripper.patterns), (style, text)
+
+
+if __name__ == "__main__":
+    test_fixed_cases_match_reference()
+    test_random_generations_match_reference()
+    print("[OK] artifact stripper matches the sequential re.sub cleaning")
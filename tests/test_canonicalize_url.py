@@ -0,0 +1,50 @@
+"""canonicalize_url: one key per story link, and no exceptions on bad links."""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from shared.utils.helpers import canonicalize_url
+
+
+def test_tracking_params_are_dropped():
+    assert canonicalize_url(
+        "https://www.example.com/story?utm_source=rss&fbclid=x&id=7&UTM_Medium=y"
+    ) == "https://example.com/story?id=7"
+    # Host-specific params only on their host
+    assert canonicalize_url("https://www.nytimes.com/a?smid=tw&smtyp=cur") == "https://nytimes.com/a"
+    assert canonicalize_url("https://example.com/a?smid=3") == "https://example.com/a?smid=3"
+
+
+def test_params_sorted_fragment_and_trailing_slash_dropped():
+    assert canonicalize_url("http://Example.com/a/b/?b=2&a=1#comments") == "https://example.com/a/b?a=1&b=2"
+
+
+def test_default_ports_dropped_other_ports_kept():
+    assert canonicalize_url("https://example.com:443/a") == "https://example.com/a"
+    assert canonicalize_url("http://example.com:80/a") == "https://example.com/a"
+    assert canonicalize_url("https://example.com:8443/a") == "https://example.com:8443/a"
+
+
+def test_amp_variants_unwrapped():
+    canonical = "https://example.com/news/story"
+    assert canonicalize_url("https://amp.example.com/news/story/amp") == canonical
+    assert canonicalize_url("https://example-com.cdn.ampproject.org/c/s/example.com/news/story") == canonical
+
+
+def test_malformed_links_do_not_raise():
+    assert canonicalize_url("https://example.com:abc/a") == "https://example.com/a"
+    assert canonicalize_url("https://example.com:99999/a") == "https://example.com/a"
+    assert canonicalize_url("http://[::1/a") == "http://[::1/a"
+    assert canonicalize_url("") == ""
+    assert canonicalize_url(None) == ""
+
+
+if __name__ == "__main__":
+    test_tracking_params_are_dropped()
+    test_params_sorted_fragment_and_trailing_slash_dropped()
+    test_default_ports_dropped_other_ports_kept()
+    test_amp_variants_unwrapped()
+    test_malformed_links_do_not_raise()
+    print("[OK] canonicalize_url")
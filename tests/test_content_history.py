@@ -0,0 +1,59 @@
+"""ContentHistory fingerprints the story, not the platform template around it."""
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from services.meme_engine import content_history, content_writer
+from services.meme_engine.content_generator import apply_content_bias
+from services.meme_engine.content_history import ContentHistory
+from services.meme_engine.content_refiner import ContentRefiner
+
+PLATFORMS = ["twitter", "medium", "youtube"]
+STORIES = ["Apple unveils new chip.", "Tesla recalls 200k cars."]
+
+
+def render(story, platform):
+    post = getattr(content_writer, f"write_{platform}")(story)
+    return ContentRefiner().refine(apply_content_bias(post, "RISING"), platform)
+
+
+def open_history(tmp):
+    """History over the real post queue, smoke-test payload included."""
+    content_history.LEGACY_QUEUE_DIR = ROOT / "data" / "post_queue"
+    return ContentHistory(str(Path(tmp) / "content_history.db"))
+
+
+def test_distinct_short_stories_are_both_claimed():
+    legacy_dir = content_history.LEGACY_QUEUE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        history = open_history(tmp)
+        try:
+            for platform in PLATFORMS:
+                for story in STORIES:
+                    assert history.claim(render(story, platform), platform) is None, (platform, story)
+
+                duplicate = history.claim(render(STORIES[0], platform), platform)
+                assert duplicate is not None and duplicate["similarity"] == 1.0, platform
+        finally:
+            history.close()
+            content_history.LEGACY_QUEUE_DIR = legacy_dir
+
+
+def test_boilerplate_only_post_has_no_signature():
+    with tempfile.TemporaryDirectory() as tmp:
+        history = ContentHistory(str(Path(tmp) / "content_history.db"))
+        try:
+            post = content_writer.write_youtube("")
+            assert history.signature(post) is not None
+            assert history.signature(post, "youtube") is None
+        finally:
+            history.close()
+
+
+if __name__ == "__main__":
+    test_distinct_short_stories_are_both_claimed()
+    test_boilerplate_only_post_has_no_signature()
+    print("[OK] content history fingerprints story-specific text")
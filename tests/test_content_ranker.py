@@ -0,0 +1,62 @@
+"""ContentRanker prefers clean, on-topic candidates over degenerate ones."""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from services.meme_engine.content_ranker import ContentRanker
+
+ARTICLE = (
+    "Apple unveils its new M5 chip. The chip doubles neural engine throughput, "
+    "and Apple says laptops with the chip ship next month. Analysts expect the "
+    "chip to pressure Intel and Qualcomm on laptop battery life."
+)
+
+CLEAN = "\n".join([
+    "Apple just unveiled the M5 chip 🚀",
+    "Neural engine throughput doubles over the previous generation.",
+    "Laptops with the chip ship next month.",
+    "Battery life is the real battleground here.",
+    "Intel and Qualcomm now have a problem.",
+    "Analysts expect pressure across the laptop market.",
+    "Would you switch laptops for this chip?",
+])
+
+DUPLICATED = "\n".join(["Apple unveils the new M5 chip for laptops."] * 7)
+
+ARTIFACTS = "\n".join([
+    "You are a tech founder on X.",
+    "Read the article below and write a sharp opinion thread.",
+    "Rules:",
+    "- Max 280 characters per tweet",
+    "- Quote statistics for credibility",
+    "Article: Apple unveils its new M5 chip.",
+    "Apple just unveiled the M5 chip 🚀",
+])
+
+
+def test_clean_candidate_beats_degenerate_ones():
+    ranker = ContentRanker("twitter", ARTICLE)
+    clean, duplicated, artifacts = (ranker.score(t) for t in (CLEAN, DUPLICATED, ARTIFACTS))
+
+    assert clean["duplication"] == 1.0 and clean["artifacts"] == 1.0
+    assert duplicated["duplication"] < clean["duplication"]
+    assert artifacts["artifacts"] < clean["artifacts"]
+    assert clean["score"] > duplicated["score"]
+    assert clean["score"] > artifacts["score"]
+
+    index, report = ranker.best([DUPLICATED, ARTIFACTS, CLEAN])
+    assert index == 2
+    assert report["text"].startswith("1/ Apple just unveiled the M5 chip")
+
+
+def test_best_keeps_first_on_ties():
+    index, _ = ContentRanker("twitter").best([CLEAN, CLEAN])
+    assert index == 0
+
+
+if __name__ == "__main__":
+    test_clean_candidate_beats_degenerate_ones()
+    test_best_keeps_first_on_ties()
+    print("[OK] content ranker prefers clean candidates")
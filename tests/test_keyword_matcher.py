@@ -0,0 +1,78 @@
+"""KeywordMatcher word-boundary matching: no mid-word hits, inflected forms match."""
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from shared.utils import keyword_matcher
+from shared.utils.keyword_matcher import KeywordMatcher, get_matcher
+from services.meme_engine.content_selector import KEYWORDS
+from services.scoring_engine.market_signal_scorer import TREND_KEYWORDS
+
+
+def automaton_matcher(keywords, word_boundary=True):
+    """KeywordMatcher forced onto the automaton, as for a large keyword set."""
+    limit = keyword_matcher.MAX_REGEX_KEYWORDS
+    keyword_matcher.MAX_REGEX_KEYWORDS = 0
+    try:
+        return KeywordMatcher(keywords, word_boundary=word_boundary)
+    finally:
+        keyword_matcher.MAX_REGEX_KEYWORDS = limit
+
+
+def test_no_match_inside_words():
+    matcher = get_matcher(("ai", "agent"))
+    assert matcher.find("The CEO said it again") == frozenset()
+    assert not matcher.contains_any("He said so, again, and aimed to aid them")
+    assert matcher.find("Said the AI.") == {"ai"}
+
+
+def test_plural_and_inflected_forms_match():
+    matcher = get_matcher(("agent", "startup", "llm", "ai"))
+    assert matcher.find("AI agents help startups build LLMs") == {"ai", "agent", "startup", "llm"}
+
+    matcher = KeywordMatcher(["release", "launch", "model", "policy"])
+    assert matcher.find("Lab released models and launches new policies") == {
+        "release", "launch", "model", "policy"
+    }
+    assert matcher.find("releasing launching modeled") == {"release", "launch", "model"}
+
+
+def test_phrases_match_consecutive_words():
+    matcher = KeywordMatcher(["machine learning", "ai"])
+    assert matcher.find("Machine learning and AI") == {"machine learning", "ai"}
+    assert matcher.find("machine said learning") == frozenset()
+    assert matcher.find("machinery learning") == frozenset()
+
+
+def test_matches_are_reported_as_keywords():
+    for matcher in (KeywordMatcher(["c++", "ai"]), automaton_matcher(["c++", "ai"])):
+        assert matcher.find("c++ ai") == {"c++", "ai"}
+    for matcher in (KeywordMatcher(["node.js", "gpt-4"]), automaton_matcher(["node.js", "gpt-4"])):
+        assert matcher.find("Built on Node.js with GPT-4") == {"node.js", "gpt-4"}
+
+
+def test_regex_and_automaton_agree():
+    rng = random.Random(3)
+    keywords = TREND_KEYWORDS + KEYWORDS
+    words = keywords + "said again agents released policies the models, launch. aims".split()
+    for word_boundary in (True, False):
+        small = KeywordMatcher(keywords, word_boundary=word_boundary)
+        large = automaton_matcher(keywords, word_boundary=word_boundary)
+        for _ in range(300):
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 30)))
+            if rng.random() < 0.2:
+                text *= 400  # past PREFILTER_MAX_CHARS
+            assert small.find(text) == large.find(text), text
+            assert small.contains_any(text) == large.contains_any(text), text
+
+
+if __name__ == "__main__":
+    test_no_match_inside_words()
+    test_plural_and_inflected_forms_match()
+    test_phrases_match_consecutive_words()
+    test_matches_are_reported_as_keywords()
+    test_regex_and_automaton_agree()
+    print("[OK] keyword matcher")
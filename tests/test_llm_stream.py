@@ -0,0 +1,89 @@
+"""LLMEngine.generate_stream streams only generated text, so prompt lines don't reach StreamingRefiner's line limit."""
+import sys
+from pathlib import Path
+
+import torch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from services.meme_engine.llm_engine import LLMEngine
+from services.meme_engine.streaming_refiner import LINE_LIMITS, StreamingRefiner
+
+PROMPT = "\n".join(f"Background fact number {i} about the chip launch." for i in range(12))
+TWEETS = [
+    "Apple just unveiled the M5 chip.",
+    "Neural engine throughput doubles over the previous generation.",
+    "Laptops with the chip ship next month.",
+    "Battery life is the real battleground here.",
+    "Intel and Qualcomm now have a problem.",
+    "Analysts expect pressure across the laptop market.",
+    "Would you switch laptops for this chip?",
+    "Pricing has not been announced yet.",
+    "Developers get new on-device inference tools.",
+]
+
+
+class Encoding(dict):
+    def to(self, device):
+        return self
+
+
+class CharTokenizer:
+    """One token per character (token id = code point)."""
+
+    def __call__(self, text, return_tensors=None):
+        return Encoding(input_ids=torch.tensor([[ord(c) for c in text]]))
+
+    def decode(self, ids, **kwargs):
+        return "".join(chr(i) for i in ids)
+
+
+class ScriptedModel:
+    """Streams the prompt, then a fixed completion, like model.generate with a streamer."""
+
+    def __init__(self, completion):
+        self.completion = completion
+        self.generated = 0
+
+    def generate(self, input_ids, streamer, stopping_criteria, **kwargs):
+        streamer.put(input_ids)
+        ids = input_ids
+        for c in self.completion:
+            token = torch.tensor([[ord(c)]])
+            ids = torch.cat([ids, token], dim=1)
+            streamer.put(token[0])
+            self.generated += 1
+            if stopping_criteria(ids, None).all():
+                break
+        streamer.end()
+
+
+def make_engine(completion):
+    engine = LLMEngine.__new__(LLMEngine)
+    engine.logger = None
+    engine.config = {}
+    engine.device = torch.device("cpu")
+    engine.tokenizer = CharTokenizer()
+    engine.model = ScriptedModel(completion)
+    return engine
+
+
+def test_prompt_is_not_streamed():
+    assert len(PROMPT.splitlines()) > LINE_LIMITS["twitter"]
+
+    completion = "\n".join(TWEETS) + "\n"
+    engine = make_engine(completion)
+
+    refiner = StreamingRefiner("twitter")
+    refiner.refine_stream(engine.generate_stream(PROMPT))
+
+    assert refiner.lines == TWEETS[:LINE_LIMITS["twitter"]]
+    assert not any("Background fact" in line for line in refiner.lines)
+    # Generation still stopped early, once the limit was reached on generated lines
+    assert engine.model.generated < len(completion)
+
+
+if __name__ == "__main__":
+    test_prompt_is_not_streamed()
+    print("[OK] LLM stream tests passed")
@@ -0,0 +1,61 @@
+"""SourceRegistry state: processes sharing the state file keep each other's entries."""
+import json
+import multiprocessing
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from shared.config.source_registry import Source, SourceRegistry
+
+WORKERS = 4
+ROUNDS = 20
+
+
+def open_registry(state_path):
+    return SourceRegistry(ROOT / "config" / "sources.yaml", state_path)
+
+
+def _worker(args):
+    state_path, worker_id = args
+    sys.path.insert(0, str(ROOT))
+    registry = open_registry(state_path)
+    for i in range(ROUNDS):
+        registry.mark_fetched([Source(name=f"worker {worker_id} source {i}", url="", kind="rss")])
+
+
+def test_concurrent_saves_merge():
+    workdir = tempfile.mkdtemp()
+    state_path = Path(workdir) / "source_state.json"
+    try:
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(WORKERS) as pool:
+            pool.map(_worker, [(str(state_path), i) for i in range(WORKERS)])
+
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        assert len(state) == WORKERS * ROUNDS
+        assert not list(Path(workdir).glob("*.tmp"))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def test_stale_registry_keeps_newer_entries():
+    workdir = tempfile.mkdtemp()
+    state_path = Path(workdir) / "source_state.json"
+    try:
+        stale, fresh = open_registry(state_path), open_registry(state_path)
+        fresh.mark_fetched([Source(name="a", url="", kind="rss")])
+        stale.mark_fetched([Source(name="b", url="", kind="rss")])
+        assert set(open_registry(state_path)._state) == {"a", "b"}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_concurrent_saves_merge()
+    test_stale_registry_keeps_newer_entries()
+    print("[OK] source registry state")
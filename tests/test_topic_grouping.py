@@ -0,0 +1,75 @@
+"""Scorers group clustered signals by topic_id, not by their (repeatable) label."""
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from services.scoring_engine.market_signal_scorer import MarketSignalScorer
+from services.scoring_engine.columnar_scorer import ColumnarSignalScorer
+from services.scoring_engine.sharded_scorer import ShardedSignalScorer
+from services.scoring_engine.streaming_scorer import StreamingTrendScorer
+
+LABEL = "OpenAI launches autonomous AI agents"
+
+
+def make_signals():
+    now = datetime.utcnow()
+    signals = []
+    for i, (topic_id, source) in enumerate([(3, "theverge"), (7, "techcrunch"), (3, "wired"), (7, "reuters")]):
+        signals.append({
+            "title": f"{LABEL} ({source})",
+            "summary": "New framework enables task execution",
+            "source": source,
+            "timestamp": (now - timedelta(hours=i)).isoformat(),
+            "topic": LABEL,
+            "topic_id": topic_id,
+        })
+    signals.append({
+        "title": "Startup raises funding for robotics",
+        "summary": "Series A round",
+        "source": "theverge",
+        "timestamp": now.isoformat(),
+    })
+    return signals
+
+
+def by_topic_id(trends):
+    return {t.get("topic_id"): t for t in trends}
+
+
+def test_same_label_different_topic_ids_stay_separate():
+    signals = make_signals()
+    trends = by_topic_id(MarketSignalScorer().score(signals))
+
+    assert set(trends) == {3, 7, None}
+    assert trends[3]["signal_ids"] == [0, 2]
+    assert trends[7]["signal_ids"] == [1, 3]
+    assert trends[3]["topic"] != trends[7]["topic"]
+    assert trends[3]["label"] == trends[7]["label"] == LABEL
+    assert trends[None]["label"] == trends[None]["topic"] == "startup raises funding for"
+
+
+def test_all_scorers_agree():
+    signals = make_signals()
+    expected = MarketSignalScorer().score(signals)
+
+    for scorer in (ColumnarSignalScorer(), ShardedSignalScorer(workers=1)):
+        actual = scorer.score(signals)
+        assert [(t["topic"], t["label"], t.get("topic_id"), t["signal_ids"]) for t in actual] == \
+            [(t["topic"], t["label"], t.get("topic_id"), t["signal_ids"]) for t in expected]
+        assert scorer.score_top_k(signals, 2) == actual[:2]
+
+    assert MarketSignalScorer().score_top_k(signals, 2) == expected[:2]
+
+    streaming = StreamingTrendScorer()
+    streaming.ingest_many(signals)
+    assert [(t["topic"], t["label"], t.get("topic_id")) for t in streaming.top_k(3)] == \
+        [(t["topic"], t["label"], t.get("topic_id")) for t in expected]
+
+
+if __name__ == "__main__":
+    test_same_label_different_topic_ids_stay_separate()
+    test_all_scorers_agree()
+    print("[OK] Topic grouping tests passed")
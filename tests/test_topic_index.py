@@ -0,0 +1,132 @@
+"""TopicVectorIndex: incremental cross-process updates and concurrent appends.
+
+Vectors come from a deterministic hash encoder, so every row can be
+checked against the topic it is filed under.
+"""
+import hashlib
+import multiprocessing
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from services.scoring_engine.topic_index import TopicVectorIndex, get_index
+from services.scoring_engine.topic_clusterer import normalize_rows
+
+WORKERS = 4
+ROUNDS = 40
+DIM = 16
+
+
+def hash_encoder(topics):
+    return np.stack([
+        np.random.default_rng(int(hashlib.md5(t.encode()).hexdigest()[:8], 16)).normal(size=DIM)
+        for t in topics
+    ])
+
+
+def open_index(directory, max_tail=64):
+    return TopicVectorIndex(directory, encoder=hash_encoder, max_tail=max_tail)
+
+
+def _worker(args):
+    directory, worker_id = args
+    sys.path.insert(0, str(ROOT))
+    index = open_index(directory)
+    for i in range(ROUNDS):
+        index.add([f"worker {worker_id} topic {i} part {j}" for j in range(3)] + ["shared topic"])
+
+
+def assert_rows_match_topics(index):
+    assert len(set(index.topics)) == len(index.topics)
+    assert np.allclose(index.vectors, normalize_rows(hash_encoder(index.topics)), atol=1e-5)
+
+
+def test_other_processes_additions_are_picked_up():
+    directory = tempfile.mkdtemp()
+    try:
+        reader, writer = open_index(directory, max_tail=20), open_index(directory, max_tail=20)
+        writer.add(["first topic", 'quoted "topic"\nwith a newline'])
+        matches = reader.nearest(["first topic"], threshold=0.99, exclude_self=False)
+        assert matches["first topic"][0] == "first topic"
+
+        writer.add([f"topic {i}" for i in range(30)])  # past max_tail: new generation
+        reader.nearest(["topic 3"], threshold=0.99)
+        assert reader.generation == writer.generation and reader.topics == writer.topics
+        assert_rows_match_topics(reader)
+
+        reopened = open_index(directory)
+        assert reopened.topics == writer.topics
+        assert (Path(directory) / "meta.json").stat().st_size < 100
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_concurrent_adds_keep_rows_and_topics_aligned():
+    directory = tempfile.mkdtemp()
+    try:
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(WORKERS) as pool:
+            pool.map(_worker, [(directory, i) for i in range(WORKERS)])
+
+        index = open_index(directory)
+        assert len(index) == WORKERS * ROUNDS * 3 + 1
+        assert_rows_match_topics(index)
+        assert not list(Path(directory).glob("*.tmp"))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_retain_drops_evicted_topics():
+    directory = tempfile.mkdtemp()
+    try:
+        index = open_index(directory, max_tail=20)
+        index.add([f"topic {i}" for i in range(30)])
+        assert index.retain({f"topic {i}" for i in range(10)}) == 20
+        assert sorted(index.topics) == sorted(f"topic {i}" for i in range(10))
+        assert_rows_match_topics(index)
+        assert open_index(directory).topics == index.topics
+
+        assert index.retain(set()) == 10
+        assert len(open_index(directory)) == 0
+        assert len(list(Path(directory).glob("vectors.*"))) == 1
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_rows_outside_candidates_do_not_hide_a_match():
+    directory = tempfile.mkdtemp()
+    try:
+        encoder_vectors = {"query": [1.0, 0.0], "evicted": [1.0, 0.01], "live": [1.0, 0.1]}
+        index = TopicVectorIndex(
+            directory, encoder=lambda topics: np.array([encoder_vectors[t] for t in topics])
+        )
+        index.add(["query", "evicted", "live"])
+
+        assert index.nearest(["query"], threshold=0.9)["query"][0] == "evicted"
+        matches = index.nearest(["query"], threshold=0.9, candidates={"query", "live"})
+        assert matches["query"][0] == "live"
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_get_index_is_shared_per_directory():
+    directory = tempfile.mkdtemp()
+    try:
+        assert get_index(directory) is get_index(str(Path(directory) / "."))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_other_processes_additions_are_picked_up()
+    test_concurrent_adds_keep_rows_and_topics_aligned()
+    test_retain_drops_evicted_topics()
+    test_rows_outside_candidates_do_not_hide_a_match()
+    test_get_index_is_shared_per_directory()
+    print("[OK] topic index")
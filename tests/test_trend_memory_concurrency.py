@@ -0,0 +1,72 @@
+"""Stress test: many processes updating trend memory at the same time.
+
+Each worker runs update_trend_memory / update_memory in a loop against the
+same database and series file. Nothing may be lost: the final counts must
+equal the number of updates made and every topic must be in the series.
+"""
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+WORKERS = 8
+ROUNDS = 25
+TOPICS = ["openai agents", "autonomous ai", "robotics", "chip export rules"]
+
+
+def _worker(args):
+    workdir, worker_id = args
+    os.chdir(workdir)
+    sys.path.insert(0, str(ROOT))
+
+    from services.scoring_engine.trend_evolution import update_trend_memory
+    from services.scoring_engine.trend_memory import update_memory
+
+    own_topic = f"worker topic {worker_id}"
+    for _ in range(ROUNDS):
+        trends = [{"topic": topic, "score": 1.0} for topic in TOPICS + [own_topic]]
+        update_trend_memory(trends)
+        update_memory([{"trend": t["topic"], "score": t["score"]} for t in trends])
+
+
+def test_concurrent_writers_lose_nothing():
+    workdir = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        shutil.copytree(ROOT / "config", Path(workdir) / "config")
+
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(WORKERS) as pool:
+            pool.map(_worker, [(workdir, i) for i in range(WORKERS)])
+
+        os.chdir(workdir)
+        from services.scoring_engine.trend_store import TrendStore
+        from services.scoring_engine.trend_series import TrendSeries
+
+        store = TrendStore("data/memory/trend_memory.db")
+        evolution, memory = store.evolution(), store.memory()
+        store.close()
+        series = TrendSeries.from_config()
+
+        for topic in TOPICS:
+            assert evolution[topic]["count"] == WORKERS * ROUNDS, topic
+            assert memory[topic]["frequency"] == WORKERS * ROUNDS, topic
+        for i in range(WORKERS):
+            assert evolution[f"worker topic {i}"]["count"] == ROUNDS
+            assert memory[f"worker topic {i}"]["frequency"] == ROUNDS
+
+        assert set(series.topics) == set(TOPICS) | {f"worker topic {i}" for i in range(WORKERS)}
+        assert not list(Path(workdir, "data", "memory").glob("*.tmp"))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_concurrent_writers_lose_nothing()
+    print("[OK] concurrent trend memory writes")
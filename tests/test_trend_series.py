@@ -0,0 +1,63 @@
+"""TrendSeries rows live in the TrendStore and saves touch only changed topics."""
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from services.scoring_engine.trend_series import TrendSeries
+from services.scoring_engine.trend_store import TrendStore
+
+HOUR = 3600
+
+
+def test_save_upserts_only_changed_topics():
+    workdir = tempfile.mkdtemp()
+    store = TrendStore(str(Path(workdir) / "trend_memory.db"))
+    try:
+        series = TrendSeries(store, interval_hours=1)
+        for step in range(4):
+            series.record({"rising": 0.2 + 0.2 * step, "steady": 0.5}, now=step * HOUR)
+        series.save()
+
+        partial = TrendSeries(store, interval_hours=1, topics=["rising"])
+        assert partial.topics == ["rising"]
+        partial.record({"rising": 1.0}, now=4 * HOUR)
+        assert partial._dirty == {"rising"}
+        partial.save()
+
+        reloaded = TrendSeries(store, interval_hours=1)
+        assert set(reloaded.topics) == {"rising", "steady"}
+        assert reloaded.classify(now=4 * HOUR)["rising"] == "RISING"
+        steady = reloaded.series(now=3 * HOUR)[0][reloaded.topics.index("steady")]
+        assert np.allclose(steady[-4:], 0.5)
+
+        reloaded.remove(["steady"])
+        reloaded.save()
+        assert [row[0] for row in store.series()] == ["rising"]
+    finally:
+        store.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def test_rows_from_another_window_start_fresh():
+    workdir = tempfile.mkdtemp()
+    store = TrendStore(str(Path(workdir) / "trend_memory.db"))
+    try:
+        series = TrendSeries(store, window=12)
+        series.record({"topic": 1.0}, now=0)
+        series.save()
+        assert len(TrendSeries(store, window=6)) == 0
+    finally:
+        store.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_save_upserts_only_changed_topics()
+    test_rows_from_another_window_start_fresh()
+    print("[OK] trend series")